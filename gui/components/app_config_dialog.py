@@ -23,6 +23,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'utils'))
 
 from style import get_theme
+from version_cache import run_version_check
 
 
 class AppConfigDialog:
@@ -391,14 +392,9 @@ class AppConfigDialog:
         
         # Try to get version to confirm it's working
         try:
-            result = subprocess.run(
-                ["python", str(smbseek_script), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                version = result.stdout.strip()
+            returncode, output = run_version_check(str(smbseek_script), timeout=5)
+            if returncode == 0:
+                version = output.strip()
                 return {'valid': True, 'message': f'✅ Valid SMBSeek installation ({version})'}
             else:
                 return {'valid': False, 'message': '❌ SMBSeek script not executable'}
@@ -90,6 +90,11 @@ class DashboardWidget:
         self._status_static_mode = True  # Keep status label static post-initialization
         self._status_summary_initialized = False
 
+        # Token bucket for forced UI flushes during progress bursts
+        self._progress_flush_rate = 10.0  # flushes per second (also the burst size)
+        self._progress_flush_tokens = self._progress_flush_rate
+        self._progress_flush_updated = time.monotonic()
+
         # Live log viewer state
         self.log_queue: "queue.Queue[str]" = queue.Queue()
         self.log_history = deque(maxlen=500)
@@ -755,6 +760,26 @@ class DashboardWidget:
             detail = None
 
         self._update_progress_summary(summary, detail)
+        self._flush_progress_ui(force=percentage is not None and percentage >= 100)
+
+    def _flush_progress_ui(self, force: bool = False) -> None:
+        """
+        Force a UI redraw for a progress update, rate limited by a token bucket.
+
+        Progress text is always updated; only the expensive update() call is
+        skipped when backend output arrives faster than the bucket refills.
+        Skipped redraws are picked up by the next flush or the Tk idle loop.
+        """
+        now = time.monotonic()
+        self._progress_flush_tokens = min(
+            self._progress_flush_rate,
+            self._progress_flush_tokens + (now - self._progress_flush_updated) * self._progress_flush_rate
+        )
+        self._progress_flush_updated = now
+        if not force:
+            if self._progress_flush_tokens < 1:
+                return
+            self._progress_flush_tokens -= 1
 
         # Force UI update without triggering window auto-resize
         # Using update() instead of update_idletasks() to prevent geometry recalculation
@@ -929,17 +954,7 @@ class DashboardWidget:
                 detail_text = None
 
             self._update_progress_summary(progress_text, detail_text)
-
-            # Force UI update safely without triggering window auto-resize
-            # Using update() instead of update_idletasks() to prevent geometry recalculation
-            try:
-                self.parent.update()
-                # Enforce window size after UI update to prevent auto-resizing
-                if self.size_enforcement_callback:
-                    self.size_enforcement_callback()
-            except tk.TclError:
-                # UI may be destroyed, ignore
-                pass
+            self._flush_progress_ui(force=percentage is not None and percentage >= 100)
 
         except Exception as e:
             # Log error but don't interrupt scan
@@ -406,28 +406,36 @@ class DatabaseSetupDialog:
             })
             
             # Success - provide comprehensive database information
-            success_message = f"Database imported successfully!\n\n"
-            success_message += f"📊 **Database Summary:**\n"
-            success_message += f"• Compatibility: {analysis['compatibility_level'].title()} SMBSeek database\n"
-            success_message += f"• Total tables: {analysis['schema_info']['total_tables']}\n"
-            success_message += f"• Total records: {analysis['schema_info']['total_records']:,}\n\n"
-            
-            success_message += f"🎯 **Core Data:**\n"
-            success_message += f"• SMB servers: {stats.get('total_servers', 0):,}\n"
-            success_message += f"• Share access records: {stats.get('accessible_shares', 0):,}\n"
-            success_message += f"• High-risk vulnerabilities: {stats.get('high_risk_vulnerabilities', 0)}\n"
             recent_discoveries = stats.get('recent_discoveries', {})
             if isinstance(recent_discoveries, dict):
-                success_message += f"• Recent discoveries: {recent_discoveries.get('display', '--')}\n"
+                recent_display = recent_discoveries.get('display', '--')
             else:
-                success_message += f"• Recent discoveries: {recent_discoveries}\n"
+                recent_display = recent_discoveries
+            
+            message_lines = [
+                "Database imported successfully!",
+                "",
+                "📊 **Database Summary:**",
+                f"• Compatibility: {analysis['compatibility_level'].title()} SMBSeek database",
+                f"• Total tables: {analysis['schema_info']['total_tables']}",
+                f"• Total records: {analysis['schema_info']['total_records']:,}",
+                "",
+                "🎯 **Core Data:**",
+                f"• SMB servers: {stats.get('total_servers', 0):,}",
+                f"• Share access records: {stats.get('accessible_shares', 0):,}",
+                f"• High-risk vulnerabilities: {stats.get('high_risk_vulnerabilities', 0)}",
+                f"• Recent discoveries: {recent_display}",
+            ]
+            
+            warnings = analysis['warnings']
+            if warnings:
+                message_lines.append("")
+                message_lines.append("⚠️  **Warnings:**")
+                message_lines.extend(f"• {warning}" for warning in warnings[:3])  # Show first 3 warnings
+                if len(warnings) > 3:
+                    message_lines.append(f"• ... and {len(warnings) - 3} more warnings")
             
-            if analysis['warnings']:
-                success_message += f"\n⚠️  **Warnings:**\n"
-                for warning in analysis['warnings'][:3]:  # Show first 3 warnings
-                    success_message += f"• {warning}\n"
-                if len(analysis['warnings']) > 3:
-                    success_message += f"• ... and {len(analysis['warnings']) - 3} more warnings"
+            success_message = "\n".join(message_lines)
             
             self.operation_queue.put({
                 'type': 'complete',
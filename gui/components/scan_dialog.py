@@ -211,12 +211,16 @@ class ScanDialog:
         if not self.content_canvas:
             return
 
+        # Wheel events arrive in bursts; read each event field once
+        wheel_delta = getattr(event, "delta", 0)
+        button = getattr(event, "num", None)
+
         delta = 0
-        if getattr(event, "delta", 0):
-            delta = -1 if event.delta > 0 else 1
-        elif getattr(event, "num", None) == 4:
+        if wheel_delta:
+            delta = -1 if wheel_delta > 0 else 1
+        elif button == 4:
             delta = -1
-        elif getattr(event, "num", None) == 5:
+        elif button == 5:
             delta = 1
 
         if delta:
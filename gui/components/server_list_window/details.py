@@ -7,10 +7,13 @@ Self-contained UI components with passed data dependencies.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import functools
+import io
 import subprocess
 import platform
 import threading
-from typing import Dict, Any, List, Optional, Sequence
+from itertools import islice
+from typing import Dict, Any, Optional, Sequence, Tuple
 
 from gui.utils import probe_cache, probe_runner, probe_patterns
 from gui.utils.probe_runner import ProbeError
@@ -170,6 +173,16 @@ def explore_server(server_data):
         )
 
 
+# Backslashes are not allowed inside f-string expressions before Python
+# 3.12, so the placeholder text lives here rather than inline
+_NO_PROBE_TEXT = "🔍 Probe:\n   No probe has been run for this host yet.\n"
+_PROBE_HEADER_TEMPLATE = (
+    "🔍 Probe Snapshot:\n"
+    "   Run: {run_at}\n"
+    "   Limits: {max_dirs} dirs / {max_files} files per share | Timeout: {timeout}s\n"
+)
+
+
 def _format_server_details(server: Dict[str, Any], probe_section: Optional[str] = None) -> str:
     """Format server details for display with accessible shares list."""
     # Extract share information
@@ -178,12 +191,9 @@ def _format_server_details(server: Dict[str, Any], probe_section: Optional[str]
     total_shares = server.get('total_shares', accessible_count)
 
     # Format accessible shares list
-    if accessible_list and accessible_list.strip():
-        shares = [share.strip() for share in accessible_list.split(',') if share.strip()]
-        if shares:
-            share_list_text = '\n'.join([f'   • {share}' for share in shares])
-        else:
-            share_list_text = '   • None accessible'
+    shares = _parse_accessible_shares(accessible_list)
+    if shares:
+        share_list_text = '\n'.join([f'   • {share}' for share in shares])
     else:
         share_list_text = '   • None accessible'
 
@@ -207,7 +217,7 @@ def _format_server_details(server: Dict[str, Any], probe_section: Optional[str]
    Accessible Share List:
 {share_list_text}
 
-{probe_section or '🔍 Probe:\n   No probe has been run for this host yet.\n'}
+{probe_section or _NO_PROBE_TEXT}
 
 📝 Additional Notes:
    This server was discovered through SMBSeek scanning and shows
@@ -241,96 +251,126 @@ def _render_server_details(
 def _format_probe_section(probe_result: Optional[Dict[str, Any]]) -> str:
     """Return formatted probe section text."""
     if not probe_result:
-        return "🔍 Probe:\n   No probe has been run for this host yet.\n"
+        return _NO_PROBE_TEXT
 
     limits = probe_result.get("limits", {})
     max_dirs = limits.get("max_directories")
     max_files = limits.get("max_files")
     timeout = limits.get("timeout_seconds")
 
-    lines: List[str] = [
-        "🔍 Probe Snapshot:",
-        f"   Run: {probe_result.get('run_at', 'Unknown')}",
-        f"   Limits: {max_dirs or '?'} dirs / {max_files or '?'} files per share | Timeout: {timeout or '?'}s"
-    ]
+    # Snapshots can list many shares x directories x files; write every line
+    # into one local buffer instead of growing and joining a list of lines
+    buf = io.StringIO()
+    buf.write(_PROBE_HEADER_TEMPLATE.format(
+        run_at=probe_result.get('run_at', 'Unknown'),
+        max_dirs=max_dirs or '?',
+        max_files=max_files or '?',
+        timeout=timeout or '?'
+    ))
+
+    network = probe_result.get("network")
+    if network:
+        ports = ", ".join(str(port) for port in network.get("open_ports", [])) or "none"
+        buf.write(f"   Open ports: {ports} | TCP connect: {network.get('tcp_response_ms', '?')} ms\n")
 
     shares = probe_result.get("shares", [])
     if shares:
         for share in shares:
             share_name = share.get("share", "Unknown Share")
-            lines.append(f"   Share: {share_name}")
+            buf.write(f"   Share: {share_name}\n")
             directories = share.get("directories", [])
             if not directories:
-                lines.append("      (no directories returned)")
+                buf.write("      (no directories returned)\n")
             for directory in directories:
                 dir_name = directory.get("name", "")
-                lines.append(f"      📁 {dir_name}/")
+                buf.write(f"      📁 {dir_name}/\n")
                 files = directory.get("files", [])
                 if files:
-                    for file_name in files:
-                        lines.append(f"         • {file_name}")
+                    buf.writelines(f"         • {file_name}\n" for file_name in files)
                     if directory.get("files_truncated"):
-                        lines.append("         … additional files not shown")
+                        buf.write("         … additional files not shown\n")
                 else:
-                    lines.append("         (no files listed)")
+                    buf.write("         (no files listed)\n")
             if share.get("directories_truncated"):
-                lines.append("      … additional directories not shown")
+                buf.write("      … additional directories not shown\n")
     else:
-        lines.append("   No shares were successfully probed.")
+        buf.write("   No shares were successfully probed.\n")
 
     analysis = probe_result.get("indicator_analysis") if probe_result else None
     if analysis:
         matches = analysis.get("matches", [])
         if matches:
-            lines.append("\n   ☠ Indicators Detected:")
-            for match in matches[:5]:
-                indicator = match.get("indicator", "Indicator")
-                path = match.get("path", "(unknown path)")
-                lines.append(f"      {indicator} → {path}")
+            buf.write("\n   ☠ Indicators Detected:\n")
+            buf.writelines(
+                f"      {match.get('indicator', 'Indicator')} → {match.get('path', '(unknown path)')}\n"
+                for match in islice(matches, 5)
+            )
             if len(matches) > 5:
-                lines.append(f"      … {len(matches) - 5} additional hits")
+                buf.write(f"      … {len(matches) - 5} additional hits\n")
         else:
-            lines.append("\n   ✅ No ransomware indicators detected in sampled paths.")
+            buf.write("\n   ✅ No ransomware indicators detected in sampled paths.\n")
 
     errors = probe_result.get("errors", [])
     if errors:
-        lines.append("\n   ⚠ Probe Errors:")
+        buf.write("\n   ⚠ Probe Errors:\n")
         for err in errors:
             share = err.get("share", "Unknown share")
             message = err.get("message", "Unknown error")
-            lines.append(f"      {share}: {message}")
+            buf.write(f"      {share}: {message}\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _parse_accessible_shares(raw_value: Optional[str]) -> List[str]:
+@functools.lru_cache(maxsize=256)
+def _parse_accessible_shares(raw_value: Optional[str]) -> Tuple[str, ...]:
+    """
+    Split a comma-separated share list.
+
+    Batch probes parse one list per selected server and most hosts expose
+    the same handful of share lists, so results are cached (as tuples, so
+    callers cannot mutate a shared value).
+    """
     if not raw_value:
-        return []
-    return [share.strip() for share in raw_value.split(',') if share.strip()]
+        return ()
+    return tuple(share.strip() for share in raw_value.split(',') if share.strip())
 
 
-def _load_probe_config(settings_manager) -> Dict[str, int]:
+def _load_probe_config(settings_manager) -> Dict[str, Any]:
     """Load probe limits from settings (fall back to defaults)."""
     defaults = {
         "max_directories": 3,
         "max_files": 5,
-        "timeout_seconds": 10
+        "timeout_seconds": 10,
+        "max_concurrent_shares": probe_runner.DEFAULT_MAX_WORKERS,
+        "max_concurrent_hosts": probe_runner.DEFAULT_MAX_HOSTS,
+        "requests_per_second": probe_runner.DEFAULT_REQUESTS_PER_SECOND,
+        "reuse_minutes": 10
     }
     if not settings_manager:
         return defaults
 
     try:
-        max_dirs = int(settings_manager.get_setting('probe.max_directories_per_share', defaults["max_directories"]))
-        max_files = int(settings_manager.get_setting('probe.max_files_per_directory', defaults["max_files"]))
-        timeout = int(settings_manager.get_setting('probe.share_timeout_seconds', defaults["timeout_seconds"]))
+        # Walk to the probe section once; every limit is a plain dict get
+        probe_settings = settings_manager.get_setting('probe', {}) or {}
+        get = probe_settings.get
+        max_dirs = int(get('max_directories_per_share', defaults["max_directories"]))
+        max_files = int(get('max_files_per_directory', defaults["max_files"]))
+        timeout = int(get('share_timeout_seconds', defaults["timeout_seconds"]))
+        workers = int(get('max_concurrent_shares', defaults["max_concurrent_shares"]))
+        hosts = int(get('max_concurrent_hosts', defaults["max_concurrent_hosts"]))
+        rate = float(get('requests_per_second', defaults["requests_per_second"]))
+        reuse = float(get('batch_reuse_minutes', defaults["reuse_minutes"]))
     except Exception:
         return defaults
 
     return {
         "max_directories": max(1, max_dirs),
         "max_files": max(1, max_files),
-        "timeout_seconds": max(1, timeout)
+        "timeout_seconds": max(1, timeout),
+        "max_concurrent_shares": max(1, workers),
+        "max_concurrent_hosts": max(1, hosts),
+        "requests_per_second": max(0.0, rate),
+        "reuse_minutes": max(0.0, reuse)
     }
 
 
@@ -342,7 +382,7 @@ def _start_probe(
     probe_state: Dict[str, Any],
     settings_manager,
     probe_button: Optional[tk.Button],
-    config_override: Optional[Dict[str, int]] = None,
+    config_override: Optional[Dict[str, Any]] = None,
     probe_status_callback=None
 ) -> None:
     """Trigger background probe run."""
@@ -373,7 +413,9 @@ def _start_probe(
                 accessible_shares,
                 max_directories=config["max_directories"],
                 max_files=config["max_files"],
-                timeout_seconds=config["timeout_seconds"]
+                timeout_seconds=config["timeout_seconds"],
+                max_workers=config.get("max_concurrent_shares", probe_runner.DEFAULT_MAX_WORKERS),
+                requests_per_second=config.get("requests_per_second", probe_runner.DEFAULT_REQUESTS_PER_SECOND)
             )
             analysis = probe_patterns.attach_indicator_analysis(result, indicator_patterns)
             probe_cache.save_probe_result(ip_address, result)
@@ -448,12 +490,18 @@ def _open_probe_dialog(
     timeout_var = tk.IntVar(value=config["timeout_seconds"])
     tk.Entry(dialog, textvariable=timeout_var, width=10).grid(row=2, column=1, padx=10, pady=5)
 
+    tk.Label(dialog, text="Shares probed in parallel:").grid(row=3, column=0, sticky="w", padx=10, pady=5)
+    workers_var = tk.IntVar(value=config["max_concurrent_shares"])
+    tk.Entry(dialog, textvariable=workers_var, width=10).grid(row=3, column=1, padx=10, pady=5)
+
     def start_probe_from_dialog():
         try:
             new_config = {
                 "max_directories": max(1, int(dirs_var.get())),
                 "max_files": max(1, int(files_var.get())),
-                "timeout_seconds": max(1, int(timeout_var.get()))
+                "timeout_seconds": max(1, int(timeout_var.get())),
+                "max_concurrent_shares": max(1, int(workers_var.get())),
+                "requests_per_second": config["requests_per_second"]
             }
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for all fields.")
@@ -463,6 +511,7 @@ def _open_probe_dialog(
             settings_manager.set_setting('probe.max_directories_per_share', new_config["max_directories"])
             settings_manager.set_setting('probe.max_files_per_directory', new_config["max_files"])
             settings_manager.set_setting('probe.share_timeout_seconds', new_config["timeout_seconds"])
+            settings_manager.set_setting('probe.max_concurrent_shares', new_config["max_concurrent_shares"])
 
         dialog.destroy()
         _start_probe(
@@ -478,7 +527,7 @@ def _open_probe_dialog(
         )
 
     button_frame = tk.Frame(dialog)
-    button_frame.grid(row=3, column=0, columnspan=2, pady=10)
+    button_frame.grid(row=4, column=0, columnspan=2, pady=10)
 
     tk.Button(button_frame, text="Start Probe", command=start_probe_from_dialog).pack(side=tk.LEFT, padx=(0, 5))
     tk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT)
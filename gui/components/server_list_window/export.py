@@ -1,7 +1,7 @@
 """
 Server List Export Operations
 
-Handles CSV/JSON/ZIP export functionality with progress dialogs.
+Handles CSV/JSON/JSONL/ZIP export functionality with progress dialogs.
 All operations use explicit dependency injection to avoid tight coupling.
 """
 
@@ -39,6 +39,12 @@ def show_export_menu(parent_window, server_data, export_type, theme, export_engi
             server_data, export_type, 'json', parent_window, theme, export_engine
         )
     )
+    menu.add_command(
+        label=f"Export {export_type.title()} as JSON Lines",
+        command=lambda: export_servers_to_format(
+            server_data, export_type, 'jsonl', parent_window, theme, export_engine
+        )
+    )
     menu.add_command(
         label=f"Export {export_type.title()} as ZIP (CSV+JSON)",
         command=lambda: export_servers_to_format(
@@ -60,7 +66,7 @@ def export_servers_to_format(servers, export_type, format_type, parent_window, t
     Args:
         servers: List of server dictionaries to export
         export_type: Type of export ("selected" or "all")
-        format_type: Export format (csv, json, zip)
+        format_type: Export format (csv, json, jsonl, zip)
         parent_window: Parent window for dialogs
         theme: Theme object for styling
         export_engine: Export engine instance
@@ -71,10 +77,11 @@ def export_servers_to_format(servers, export_type, format_type, parent_window, t
 
     # Generate filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    extensions = {'csv': '.csv', 'json': '.json', 'zip': '.zip'}
+    extensions = {'csv': '.csv', 'json': '.json', 'jsonl': '.jsonl', 'zip': '.zip'}
     filetypes_map = {
         'csv': [("CSV files", "*.csv"), ("All files", "*.*")],
         'json': [("JSON files", "*.json"), ("All files", "*.*")],
+        'jsonl': [("JSON Lines files", "*.jsonl"), ("All files", "*.*")],
         'zip': [("ZIP files", "*.zip"), ("All files", "*.*")]
     }
 
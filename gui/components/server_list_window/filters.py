@@ -11,6 +11,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Callable
 
 
+# Date fields checked, in order, when filtering servers by recency
+_DATE_FIELDS = ("first_seen", "last_seen", "discovery_date", "created_at")
+
+
 def create_filter_panel(parent, theme, filter_vars, callbacks):
     """
     Create filtering controls panel.
@@ -209,13 +213,18 @@ def apply_date_filter(servers: List[Dict[str, Any]], filter_type: str, last_scan
     if not cutoff_time:
         return servers
 
+    # If no date is available and we're filtering for recent items, exclude.
+    # But if filtering "Since Last Scan" and no date, include (assume old
+    # data). Decided once here rather than per undated server
+    keep_undated = filter_type == "Since Last Scan"
+
     filtered = []
     for server in servers:
         # Check various date fields that might be available
         server_date = None
 
         # Try different date field names
-        for date_field in ["first_seen", "last_seen", "discovery_date", "created_at"]:
+        for date_field in _DATE_FIELDS:
             if date_field in server and server[date_field]:
                 try:
                     server_date = datetime.fromisoformat(server[date_field].replace("Z", "+00:00"))
@@ -224,13 +233,11 @@ def apply_date_filter(servers: List[Dict[str, Any]], filter_type: str, last_scan
                     continue
 
         # If we found a valid date, compare it
-        if server_date and server_date >= cutoff_time:
-            filtered.append(server)
-        elif not server_date:
-            # If no date available and we're filtering for recent items, exclude
-            # But if filtering "Since Last Scan" and no date, include (assume old data)
-            if filter_type == "Since Last Scan":
+        if server_date:
+            if server_date >= cutoff_time:
                 filtered.append(server)
+        elif keep_undated:
+            filtered.append(server)
 
     return filtered
 
@@ -267,7 +274,8 @@ def apply_favorites_filter(servers: List[Dict[str, Any]], favorites_only: bool,
     if not favorites_only or not settings_manager:
         return servers
 
-    favorite_ips = settings_manager.get_favorite_servers()
+    # Settings store a list; build the set once so each row is an O(1) lookup
+    favorite_ips = frozenset(settings_manager.get_favorite_servers())
     return [server for server in servers if server.get("ip_address") in favorite_ips]
 
 
@@ -286,7 +294,7 @@ def apply_avoid_filter(servers: List[Dict[str, Any]], avoid_only: bool, settings
     if not avoid_only or not settings_manager:
         return servers
 
-    avoid_ips = settings_manager.get_avoid_servers()
+    avoid_ips = frozenset(settings_manager.get_avoid_servers())
     return [server for server in servers if server.get("ip_address") in avoid_ips]
 
 
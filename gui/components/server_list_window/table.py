@@ -9,8 +9,35 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 from typing import Dict, List, Any, Callable, Optional, Tuple
+import functools
 import re
 
+# Sort helpers, compiled once; "Last Seen" cells use this zero-padded layout,
+# which orders the same as the datetimes it encodes
+_FIRST_NUMBER_RE = re.compile(r'\d+')
+_LAST_SEEN_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _display_last_seen(last_seen: str) -> str:
+    """
+    Return a "Last Seen" timestamp as YYYY-MM-DD HH:MM (unchanged if unparseable).
+
+    The table is rebuilt on every filter change and hosts from one scan share
+    timestamps, so the same values are formatted over and over; cache them.
+    """
+    try:
+        date_obj = datetime.fromisoformat(last_seen.replace("Z", "+00:00"))
+        return date_obj.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return last_seen
+
+
+@functools.lru_cache(maxsize=4096)
+def _display_share_list(accessible_shares: str) -> str:
+    """Return a share list with blank entries and spaces after commas removed (cached)."""
+    return ",".join([share.strip() for share in accessible_shares.split(",") if share.strip()])
+
 
 def create_server_table(parent, theme, callbacks):
     """
@@ -111,60 +138,59 @@ def update_table_display(tree, filtered_servers: List[Dict[str, Any]], settings_
         filtered_servers: List of server dictionaries to display
         settings_manager: Optional settings manager for favorites/avoid status
     """
-    # Clear existing items
-    for item in tree.get_children():
-        tree.delete(item)
+    # Clear existing items in a single Tcl call
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+
+    # Favorite/avoid lists are loop invariants; read them once as sets
+    if settings_manager:
+        favorite_ips = {ip.strip() for ip in settings_manager.get_favorite_servers() if ip}
+        avoid_ips = {ip.strip() for ip in settings_manager.get_avoid_servers() if ip}
+    else:
+        favorite_ips = avoid_ips = set()
 
     # Add filtered servers
     for server in filtered_servers:
         # Format display values - updated for enhanced share tracking
         ip_addr = server.get("ip_address", "")
-        shares_count = str(server.get("accessible_shares", 0))
+        share_count = server.get("accessible_shares", 0)
+        shares_count = str(share_count)
         accessible_shares = server.get("accessible_shares_list", "")
         last_seen = server.get("last_seen", "Never")
         country = server.get("country", "Unknown")
 
         # Format last seen date
         if last_seen and last_seen != "Never":
-            try:
-                date_obj = datetime.fromisoformat(last_seen.replace("Z", "+00:00"))
-                last_seen = date_obj.strftime("%Y-%m-%d %H:%M")
-            except:
-                pass
+            last_seen = _display_last_seen(last_seen)
 
         # Format accessible shares list (ensure no spaces after commas)
         if accessible_shares:
-            # Remove any spaces after commas and ensure clean formatting
-            accessible_shares = ",".join([share.strip() for share in accessible_shares.split(",") if share.strip()])
+            accessible_shares = _display_share_list(accessible_shares)
+
+        lookup_ip = ip_addr.strip() if ip_addr else ""
 
         # Determine favorite star
-        if settings_manager and settings_manager.is_favorite_server(ip_addr):
-            star = "★"
-        else:
-            star = "☆"
+        star = "★" if lookup_ip in favorite_ips else "☆"
 
         # Determine avoid skull
-        if settings_manager and settings_manager.is_avoid_server(ip_addr):
-            skull = "☠"
-        else:
-            skull = "💀"
+        skull = "☠" if lookup_ip in avoid_ips else "💀"
 
         probe_emoji = server.get("probe_status_emoji", "⚪")
 
+        # Add visual indicators for shares count
+        if share_count > 0:
+            shares_display = f"📁 {shares_count}"
+        else:
+            shares_display = shares_count
+
         # Insert row with new column structure including favorite, avoid, probe columns
-        item_id = tree.insert(
+        tree.insert(
             "",
             "end",
-            values=(star, skull, probe_emoji, ip_addr, shares_count, accessible_shares, last_seen, country)
+            values=(star, skull, probe_emoji, ip_addr, shares_display, accessible_shares, last_seen, country)
         )
 
-        # Add visual indicators for shares count
-        share_count = server.get("accessible_shares", 0)
-        if share_count > 0:
-            tree.set(item_id, "Shares", f"📁 {shares_count}")
-        else:
-            tree.set(item_id, "Shares", shares_count)
-
 
 def get_selected_server_data(tree, filtered_servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -178,12 +204,13 @@ def get_selected_server_data(tree, filtered_servers: List[Dict[str, Any]]) -> Li
         List of selected server dictionaries
     """
     selected_items = tree.selection()
-    selected_ips = []
+    # A set keeps the membership test below O(1) when many rows are selected
+    selected_ips = set()
 
     for item in selected_items:
         values = tree.item(item)["values"]
         if len(values) >= 4:
-            selected_ips.append(values[3])  # IP address now at index 3 (after favorite/avoid/probe)
+            selected_ips.add(values[3])  # IP address now at index 3 (after favorite/avoid/probe)
 
     selected_servers = [
         server for server in filtered_servers
@@ -241,32 +268,36 @@ def sort_table_by_column(tree, column: str, current_sort_column: Optional[str],
     # Get current data with sort key
     data_with_keys = []
 
-    for item in tree.get_children():
-        values = tree.item(item)["values"]
+    # Column position is the same for every row; look it up once
+    try:
+        col_index = tree["columns"].index(column)
+    except ValueError:
+        col_index = None
+
+    if col_index is not None:
+        for item in tree.get_children():
+            values = tree.item(item)["values"]
 
-        # Determine sort key based on column
-        try:
-            col_index = tree["columns"].index(column)
-            sort_key = values[col_index]
-        except (ValueError, IndexError):
-            continue
-
-        # Convert to appropriate type for sorting
-        if column == "Shares":
-            # Extract number from string (remove emojis)
-            numbers = re.findall(r'\d+', str(sort_key))
-            sort_key = int(numbers[0]) if numbers else 0
-        elif column == "Last Seen":
-            # Sort by date
+            # Determine sort key based on column
             try:
-                sort_key = datetime.strptime(sort_key, "%Y-%m-%d %H:%M")
-            except:
-                sort_key = datetime.min
-        elif column == "Accessible":
-            # Sort by length of accessible shares list (number of shares)
-            sort_key = len(str(sort_key).split(",")) if str(sort_key).strip() else 0
-
-        data_with_keys.append((sort_key, item, values))
+                sort_key = values[col_index]
+            except IndexError:
+                continue
+
+            # Convert to appropriate type for sorting
+            if column == "Shares":
+                # Extract number from string (remove emojis)
+                number_match = _FIRST_NUMBER_RE.search(str(sort_key))
+                sort_key = int(number_match.group()) if number_match else 0
+            elif column == "Last Seen":
+                # Sort by date; unparseable values sort as the earliest date
+                sort_key = str(sort_key)
+                sort_key = (1, sort_key) if _LAST_SEEN_RE.fullmatch(sort_key) else (0, "")
+            elif column == "Accessible":
+                # Sort by length of accessible shares list (number of shares)
+                sort_key = len(str(sort_key).split(",")) if str(sort_key).strip() else 0
+
+            data_with_keys.append((sort_key, item, values))
 
     # Sort with correct direction
     reverse_sort = (new_sort_direction == "desc")
@@ -8,9 +8,10 @@ Maintains all shared state and coordinates between components.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import os
 import sys
+import threading
 
 # Add utils to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'utils'))
@@ -29,7 +30,7 @@ except ImportError:
 
 # Import modular components
 from . import export, details, filters, table
-from gui.utils import probe_cache, probe_patterns
+from gui.utils import probe_cache, probe_patterns, probe_runner
 
 
 class ServerListWindow:
@@ -59,6 +60,9 @@ class ServerListWindow:
         self.probe_status_map = {}
         self.ransomware_indicators = []
         self.indicator_patterns = []
+        # Indicator analysis per (ip, probe run_at); reset when patterns reload
+        self._indicator_analysis_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.batch_probe_running = False
 
         # Favorites and avoid functionality
         self.favorites_only = tk.BooleanVar()
@@ -166,6 +170,7 @@ class ServerListWindow:
                     config_path = None
         self.ransomware_indicators = probe_patterns.load_ransomware_indicators(config_path)
         self.indicator_patterns = probe_patterns.compile_indicator_patterns(self.ransomware_indicators)
+        self._indicator_analysis_cache.clear()
 
     def _center_window(self) -> None:
         """Center window on parent."""
@@ -310,6 +315,15 @@ class ServerListWindow:
         self.theme.apply_to_widget(details_button, "button_secondary")
         details_button.pack(side=tk.LEFT, padx=(0, 5))
 
+        # Probe selected button
+        self.probe_selected_button = tk.Button(
+            button_container,
+            text="🔍 Probe Selected",
+            command=self._probe_selected_servers
+        )
+        self.theme.apply_to_widget(self.probe_selected_button, "button_secondary")
+        self.probe_selected_button.pack(side=tk.LEFT, padx=(0, 5))
+
         # Export selected button
         export_selected_button = tk.Button(
             button_container,
@@ -531,21 +545,39 @@ class ServerListWindow:
                 server["probe_status_emoji"] = self._probe_status_to_emoji('unprobed')
             return
 
+        # Read every cached snapshot up front (concurrently), then collect
+        # status changes and persist them in one settings write
+        cached_results = probe_cache.load_probe_results(
+            server.get("ip_address") for server in servers
+        )
+        # Stored statuses are read once as a map rather than looked up
+        # through the settings path for every server
+        stored_statuses = self.settings_manager.get_probe_status_map()
+        pending_updates: Dict[str, str] = {}
         for server in servers:
             ip = server.get("ip_address")
-            status = self._determine_probe_status(ip)
+            status = self._determine_probe_status(ip, pending_updates, cached_results, stored_statuses)
             server["probe_status"] = status
             server["probe_status_emoji"] = self._probe_status_to_emoji(status)
 
-    def _determine_probe_status(self, ip_address: Optional[str]) -> str:
+        if pending_updates:
+            self.settings_manager.set_probe_statuses(pending_updates)
+
+    def _determine_probe_status(self, ip_address: Optional[str],
+                                pending_updates: Optional[Dict[str, str]] = None,
+                                cached_results: Optional[Dict[str, Dict[str, Any]]] = None,
+                                stored_statuses: Optional[Dict[str, str]] = None) -> str:
         if not ip_address:
             return 'unprobed'
 
-        cached_result = probe_cache.load_probe_result(ip_address)
+        if cached_results is not None:
+            cached_result = cached_results.get(ip_address)
+        else:
+            cached_result = probe_cache.load_probe_result(ip_address)
         derived_status = 'unprobed'
         if cached_result:
             if self.indicator_patterns:
-                analysis = probe_patterns.attach_indicator_analysis(cached_result, self.indicator_patterns)
+                analysis = self._analyze_cached_probe(ip_address, cached_result)
             else:
                 analysis = {"is_suspicious": False}
             if analysis.get('is_suspicious'):
@@ -553,33 +585,66 @@ class ServerListWindow:
             else:
                 derived_status = 'clean'
 
-        stored_status = self.settings_manager.get_probe_status(ip_address)
+        if stored_statuses is not None:
+            stored_status = stored_statuses.get(ip_address, 'unprobed')
+        else:
+            stored_status = self.settings_manager.get_probe_status(ip_address)
         status = derived_status if derived_status != 'unprobed' else stored_status
 
         if status != stored_status:
-            self.settings_manager.set_probe_status(ip_address, status)
+            if pending_updates is not None:
+                pending_updates[ip_address] = status
+            else:
+                self.settings_manager.set_probe_status(ip_address, status)
 
         self.probe_status_map[ip_address] = status
         return status
 
+    def _analyze_cached_probe(self, ip_address: str, cached_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Return indicator analysis for a cached snapshot, memoized per probe run."""
+        run_at = cached_result.get("run_at")
+        key = (ip_address, run_at)
+        analysis = self._indicator_analysis_cache.get(key)
+        if analysis is None:
+            analysis = probe_patterns.attach_indicator_analysis(cached_result, self.indicator_patterns)
+            if run_at:
+                self._indicator_analysis_cache[key] = analysis
+        else:
+            cached_result["indicator_analysis"] = analysis
+        return analysis
+
+    # Built once rather than on every call; the lookup runs per server
+    _PROBE_STATUS_EMOJI = {
+        'clean': '△',
+        'issue': '✖',
+        'unprobed': '○'
+    }
+
+    # Batch probes apply statuses in groups of this many hosts: progress
+    # survives a crash without rewriting the settings file or rebuilding
+    # the table for every host
+    _PROBE_STATUS_FLUSH_SIZE = 25
+
     @staticmethod
     def _probe_status_to_emoji(status: str) -> str:
-        mapping = {
-            'clean': '△',
-            'issue': '✖',
-            'unprobed': '○'
-        }
-        return mapping.get(status, '⚪')
+        return ServerListWindow._PROBE_STATUS_EMOJI.get(status, '⚪')
 
     def _handle_probe_status_update(self, ip_address: str, status: str) -> None:
         if not ip_address:
             return
+        self._apply_probe_statuses({ip_address: status})
+
+    def _apply_probe_statuses(self, statuses: Dict[str, str]) -> None:
+        """Persist a group of probe statuses and refresh the table once."""
+        if not statuses:
+            return
         if self.settings_manager:
-            self.settings_manager.set_probe_status(ip_address, status)
-        self.probe_status_map[ip_address] = status
+            self.settings_manager.set_probe_statuses(statuses)
+        self.probe_status_map.update(statuses)
 
         for server in self.all_servers:
-            if server.get("ip_address") == ip_address:
+            status = statuses.get(server.get("ip_address"))
+            if status is not None:
                 server["probe_status"] = status
                 server["probe_status_emoji"] = self._probe_status_to_emoji(status)
 
@@ -587,6 +652,114 @@ class ServerListWindow:
         self._apply_filters()
         self._restore_selection(selected_ips)
 
+    def _probe_selected_servers(self) -> None:
+        """Probe all selected servers in the background, several hosts at a time."""
+        if self.batch_probe_running:
+            return
+
+        targets = []
+        for server in table.get_selected_server_data(self.tree, self.filtered_servers):
+            ip_address = server.get("ip_address")
+            shares = details._parse_accessible_shares(server.get("accessible_shares_list", ""))
+            if ip_address and shares:
+                targets.append((ip_address, shares))
+
+        if not targets:
+            messagebox.showwarning("No Selection", "Please select servers with accessible shares to probe.")
+            return
+
+        config = details._load_probe_config(self.settings_manager)
+        indicator_patterns = self.indicator_patterns
+        self.batch_probe_running = True
+        self.probe_selected_button.configure(state=tk.DISABLED)
+        self.selection_label.configure(text=f"Probing {len(targets)} servers…")
+
+        def worker():
+            failures = []
+            completed = []
+            stop_error = None
+            pending_statuses: Dict[str, str] = {}
+
+            def report_status(ip_address, status):
+                # Rows and settings are updated a group at a time rather
+                # than once per host (see _PROBE_STATUS_FLUSH_SIZE)
+                completed.append(ip_address)
+                pending_statuses[ip_address] = status
+                if len(pending_statuses) >= self._PROBE_STATUS_FLUSH_SIZE:
+                    flush_statuses()
+
+            def flush_statuses():
+                if not pending_statuses:
+                    return
+                try:
+                    self.window.after(0, self._apply_probe_statuses, dict(pending_statuses))
+                except (tk.TclError, RuntimeError):
+                    pass  # Window closed; results are still cached
+                pending_statuses.clear()
+
+            try:
+                # Hosts probed moments ago with the same shares and limits are
+                # taken from the cache instead of being walked again
+                reused = probe_cache.load_fresh_probe_results(
+                    targets,
+                    max_age_seconds=config["reuse_minutes"] * 60,
+                    max_directories=config["max_directories"],
+                    max_files=config["max_files"]
+                )
+                for ip_address, result in reused.items():
+                    analysis = probe_patterns.attach_indicator_analysis(result, indicator_patterns)
+                    report_status(ip_address, 'issue' if analysis.get("is_suspicious") else 'clean')
+
+                def analyze_and_cache(ip_address, result):
+                    # Runs on the probe worker threads, overlapping other hosts
+                    probe_patterns.attach_indicator_analysis(result, indicator_patterns)
+                    probe_cache.save_probe_result(ip_address, result)
+
+                results = probe_runner.run_probes(
+                    [(ip_address, shares) for ip_address, shares in targets if ip_address not in reused],
+                    max_hosts=config["max_concurrent_hosts"],
+                    max_directories=config["max_directories"],
+                    max_files=config["max_files"],
+                    timeout_seconds=config["timeout_seconds"],
+                    max_workers=config["max_concurrent_shares"],
+                    requests_per_second=config["requests_per_second"],
+                    on_snapshot=analyze_and_cache
+                )
+                for ip_address, result, error in results:
+                    if error:
+                        failures.append(f"{ip_address}: {error}")
+                        continue
+                    report_status(ip_address, 'issue' if result["indicator_analysis"].get("is_suspicious") else 'clean')
+            except Exception as exc:
+                stop_error = str(exc)
+            finally:
+                flush_statuses()
+                try:
+                    self.window.after(
+                        0, self._finish_batch_probe, len(targets), len(completed), failures, stop_error
+                    )
+                except (tk.TclError, RuntimeError):
+                    pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _finish_batch_probe(self, total: int, completed: int, failures: List[str],
+                            stop_error: Optional[str] = None) -> None:
+        self.batch_probe_running = False
+        self.probe_selected_button.configure(state=tk.NORMAL)
+        self._on_selection_changed()
+        if stop_error:
+            messagebox.showwarning(
+                "Probe Stopped",
+                f"Batch probe stopped after {completed} of {total} servers: {stop_error}\n\n"
+                + "\n".join(failures[:10])
+            )
+        elif failures:
+            messagebox.showwarning(
+                "Probe Completed With Errors",
+                f"Probed {completed} of {total} servers.\n\n" + "\n".join(failures[:10])
+            )
+
     def _get_selected_ips(self) -> List[str]:
         ips = []
         for item in self.tree.selection():
@@ -0,0 +1,116 @@
+"""Unit tests for the data export engine."""
+
+import json
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from gui.utils import data_export_engine
+from gui.utils.data_export_engine import DataExportEngine
+
+
+SERVERS = [
+    {
+        "ip_address": "10.0.0.1",
+        "country": "US",
+        "auth_method": "Anonymous",
+        "accessible_shares": ["data", "public"],
+        "vulnerabilities": 0
+    },
+    {
+        "ip_address": "10.0.0.2",
+        "country": "DE",
+        "auth_method": "Guest/Blank",
+        "accessible_shares": [],
+        "vulnerabilities": 1,
+        "last_seen": "2024-01-01T00:00:00"
+    }
+]
+
+
+class TestZipExport(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_path = Path(self._tmp.name)
+        self.engine = DataExportEngine()
+
+    def test_zip_members_match_standalone_exports(self):
+        zip_path = self.tmp_path / "servers.zip"
+        csv_path = self.tmp_path / "servers.csv"
+
+        result = self.engine.export_data(SERVERS, "servers", "zip", str(zip_path), include_metadata=False)
+        self.engine.export_data(SERVERS, "servers", "csv", str(csv_path), include_metadata=False)
+
+        self.assertTrue(result["success"])
+        with zipfile.ZipFile(zip_path) as archive:
+            self.assertEqual(sorted(archive.namelist()), ["servers_export.csv", "servers_export.json"])
+            self.assertEqual(archive.read("servers_export.csv"), csv_path.read_bytes())
+            exported = json.loads(archive.read("servers_export.json"))
+        self.assertEqual([row["ip_address"] for row in exported["data"]], ["10.0.0.1", "10.0.0.2"])
+
+    def test_zip_includes_metadata_member(self):
+        zip_path = self.tmp_path / "servers.zip"
+
+        self.engine.export_data(SERVERS, "servers", "zip", str(zip_path), include_metadata=True)
+
+        with zipfile.ZipFile(zip_path) as archive:
+            metadata = json.loads(archive.read("export_metadata.json"))
+        self.assertEqual(metadata["export_info"]["record_count"], 2)
+
+
+
+class TestJsonLinesExport(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_path = Path(self._tmp.name)
+        self.engine = DataExportEngine()
+
+    def _export(self, servers):
+        jsonl_path = self.tmp_path / "servers.jsonl"
+        result = self.engine.export_data(servers, "servers", "jsonl", str(jsonl_path), include_metadata=False)
+        self.assertTrue(result["success"])
+        return jsonl_path
+
+    def test_one_record_per_line(self):
+        servers = [dict(SERVERS[0], country="Österreich", last_seen=datetime(2024, 1, 2, 3, 4, 5)), SERVERS[1]]
+
+        # orjson and the stdlib fallback must write identical files
+        outputs = [self._export(servers).read_bytes()]
+        with mock.patch.object(data_export_engine, "orjson", None):
+            outputs.append(self._export(servers).read_bytes())
+
+        for output in outputs:
+            lines = output.decode("utf-8").splitlines()
+            records = [json.loads(line) for line in lines]
+            self.assertEqual([record["ip_address"] for record in records], ["10.0.0.1", "10.0.0.2"])
+            self.assertEqual(records[0]["last_seen"], "2024-01-02 03:04:05")
+            self.assertIn("Österreich".encode("utf-8"), output)
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_metadata_goes_to_sidecar(self):
+        jsonl_path = self.tmp_path / "servers.jsonl"
+
+        result = self.engine.export_data(SERVERS, "servers", "jsonl", str(jsonl_path), include_metadata=True)
+
+        self.assertEqual(len(jsonl_path.read_text(encoding="utf-8").splitlines()), 2)
+        metadata = json.loads(Path(result["metadata_path"]).read_text(encoding="utf-8"))
+        self.assertEqual(metadata["export_info"]["format"], "jsonl")
+
+    def test_empty_data(self):
+        jsonl_path = self.tmp_path / "empty.jsonl"
+
+        with self.assertRaises(ValueError):
+            self.engine.export_data([], "servers", "jsonl", str(jsonl_path))
+        result = self.engine._export_jsonl([], "servers", str(jsonl_path), None, None)
+
+        self.assertEqual(result["records_exported"], 0)
+        self.assertEqual(jsonl_path.read_bytes(), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
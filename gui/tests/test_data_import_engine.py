@@ -0,0 +1,59 @@
+"""Unit tests for the data import engine."""
+
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from gui.utils.data_import_engine import DataImportEngine
+
+
+class TestImportModes(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_path = Path(self._tmp.name)
+        self.db_path = self.tmp_path / "import.db"
+        self.engine = DataImportEngine(str(self.db_path))
+
+    def _import(self, records, data_type, mode):
+        file_path = self.tmp_path / f"{data_type}.json"
+        file_path.write_text(json.dumps({"data": records}), encoding="utf-8")
+        return self.engine.import_data(str(file_path), data_type, mode)
+
+    def _rows(self, sql):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(sql).fetchall()
+
+    def test_merge_updates_existing_records(self):
+        self._import([
+            {"ip_address": "10.0.0.1", "country": "US", "auth_method": "Anonymous"},
+            {"ip_address": "10.0.0.2", "country": "DE", "auth_method": "Anonymous"},
+        ], "servers", "merge")
+
+        result = self._import([
+            {"ip_address": "10.0.0.1", "country": "FR", "auth_method": "Guest/Blank"},
+            {"ip_address": "10.0.0.3", "country": "US", "auth_method": "Anonymous"},
+        ], "servers", "merge")
+
+        self.assertEqual((result["records_inserted"], result["records_updated"]), (1, 1))
+        self.assertEqual(
+            self._rows("SELECT ip_address, country, auth_method FROM servers ORDER BY id"),
+            [("10.0.0.1", "FR", "Guest/Blank"), ("10.0.0.2", "DE", "Anonymous"), ("10.0.0.3", "US", "Anonymous")]
+        )
+
+    def test_append_skips_records_already_stored(self):
+        servers = [
+            {"ip_address": f"10.0.{i // 250}.{i % 250}", "country": "US", "auth_method": "Anonymous"}
+            for i in range(DataImportEngine.KEY_LOOKUP_CHUNK + 10)
+        ]
+        self._import(servers[:DataImportEngine.KEY_LOOKUP_CHUNK + 5], "servers", "append")
+
+        result = self._import(servers, "servers", "append")
+
+        self.assertEqual((result["records_inserted"], result["records_skipped"]), (5, DataImportEngine.KEY_LOOKUP_CHUNK + 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Unit tests for database reader connection handling."""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gui.utils import database_access
+from gui.utils.database_access import DatabaseReader
+
+
+class TestGetConnection(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.reader = DatabaseReader(str(Path(self._tmp.name) / "smbseek.db"))
+        self.addCleanup(self.reader.close)
+
+    def test_locked_database_reports_friendly_error_without_sleeping(self):
+        with mock.patch.object(database_access.time, "sleep") as sleep:
+            with self.assertRaisesRegex(sqlite3.OperationalError, "locked by backend operation"):
+                with self.reader._get_connection():
+                    raise sqlite3.OperationalError("database is locked")
+
+        sleep.assert_not_called()
+        self.assertIsNone(self.reader._connection)
+
+    def test_other_errors_are_passed_through(self):
+        with self.assertRaisesRegex(sqlite3.OperationalError, "no such table"):
+            with self.reader._get_connection() as conn:
+                conn.execute("SELECT * FROM missing_table")
+
+
+if __name__ == "__main__":
+    unittest.main()
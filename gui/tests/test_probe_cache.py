@@ -0,0 +1,87 @@
+"""Unit tests for probe cache helpers."""
+
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gui.utils import probe_cache
+
+
+class TestLoadProbeResults(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(probe_cache, "CACHE_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_returns_only_cached_ips(self):
+        probe_cache.save_probe_result("10.0.0.1", {"ip_address": "10.0.0.1", "shares": []})
+        probe_cache.save_probe_result("10.0.0.2", {"ip_address": "10.0.0.2", "shares": []})
+
+        results = probe_cache.load_probe_results(["10.0.0.1", "10.0.0.2", "10.0.0.3", None])
+
+        self.assertEqual(set(results), {"10.0.0.1", "10.0.0.2"})
+        self.assertEqual(results["10.0.0.2"]["ip_address"], "10.0.0.2")
+
+    def test_empty_input(self):
+        self.assertEqual(probe_cache.load_probe_results([]), {})
+
+    def test_first_save_creates_cache_dir(self):
+        cache_dir = Path(self._tmp.name) / "nested" / "probes"
+        with mock.patch.object(probe_cache, "CACHE_DIR", cache_dir):
+            self.assertIsNone(probe_cache.load_probe_result("10.0.0.1"))
+            self.assertFalse(cache_dir.exists())
+            probe_cache.save_probe_result("10.0.0.1", {"ip_address": "10.0.0.1"})
+            self.assertEqual(probe_cache.load_probe_result("10.0.0.1"), {"ip_address": "10.0.0.1"})
+
+    def test_missing_cache_dir(self):
+        with mock.patch.object(probe_cache, "CACHE_DIR", Path(self._tmp.name) / "absent"):
+            self.assertEqual(probe_cache.load_probe_results(["10.0.0.1"]), {})
+
+
+class TestLoadFreshProbeResults(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(probe_cache, "CACHE_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _save(self, ip, minutes_ago, shares=("C$",), errors=(), limits=(3, 5)):
+        run_at = datetime.datetime.utcnow() - datetime.timedelta(minutes=minutes_ago)
+        probe_cache.save_probe_result(ip, {
+            "ip_address": ip,
+            "run_at": run_at.isoformat(timespec="seconds") + "Z",
+            "limits": {"max_directories": limits[0], "max_files": limits[1], "timeout_seconds": 10},
+            "shares": [{"share": share, "directories": []} for share in shares],
+            "errors": [{"share": share, "message": "Access denied"} for share in errors]
+        })
+
+    def test_only_matching_recent_snapshots_are_reused(self):
+        self._save("10.0.0.1", minutes_ago=1, shares=("C$",), errors=("D$",))
+        self._save("10.0.0.2", minutes_ago=30)
+        self._save("10.0.0.3", minutes_ago=1, shares=("C$",))
+        self._save("10.0.0.4", minutes_ago=1, limits=(1, 1))
+
+        fresh = probe_cache.load_fresh_probe_results(
+            [("10.0.0.1", ["C$", "\\D$"]), ("10.0.0.2", ["C$"]), ("10.0.0.3", ["C$", "E$"]), ("10.0.0.4", ["C$"])],
+            max_age_seconds=600,
+            max_directories=3,
+            max_files=5
+        )
+
+        self.assertEqual(set(fresh), {"10.0.0.1"})
+
+    def test_zero_age_disables_reuse(self):
+        self._save("10.0.0.1", minutes_ago=0)
+        fresh = probe_cache.load_fresh_probe_results(
+            [("10.0.0.1", ["C$"])], max_age_seconds=0, max_directories=3, max_files=5
+        )
+        self.assertEqual(fresh, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,17 @@ class TestProbePatterns(unittest.TestCase):
             self.assertIn("README-ID-*.txt", indicators)
             self.assertEqual(len(indicators), 2)
 
+    def test_equivalent_indicators_are_loaded_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "config.json"
+            config_path.write_text(json.dumps({
+                "security": {
+                    "ransomware_indicators": ["*.locky", "*.LOCKY", "**.locky", "[id].crypt", "{uid}.crypt"]
+                }
+            }), encoding="utf-8")
+            indicators = probe_patterns.load_ransomware_indicators(str(config_path))
+        self.assertEqual(indicators, ["*.locky", "[id].crypt"])
+
     def test_find_indicator_hits_flags_matches(self):
         indicators = ["README-ID-*.txt", "notes.txt"]
         patterns = probe_patterns.compile_indicator_patterns(indicators)
@@ -42,6 +53,29 @@ class TestProbePatterns(unittest.TestCase):
         self.assertTrue(analysis["is_suspicious"])
         self.assertEqual(analysis["matches"][0]["indicator"], "README-ID-*.txt")
 
+    def test_find_indicator_hits_reports_every_matching_indicator(self):
+        patterns = probe_patterns.compile_indicator_patterns(["*.locked", "DECRYPT*", "read_me.txt"])
+        snapshot = {
+            "ip_address": "10.0.0.7",
+            "shares": [
+                {
+                    "share": "Data",
+                    "directories": [
+                        {
+                            "name": "Finance",
+                            "files": ["decrypt_files.LOCKED", "budget.xlsx"]
+                        }
+                    ]
+                }
+            ]
+        }
+        analysis = probe_patterns.find_indicator_hits(snapshot, patterns)
+        self.assertEqual(
+            [match["indicator"] for match in analysis["matches"]],
+            ["*.locked", "DECRYPT*"]
+        )
+        self.assertTrue(all(match["path"].endswith("decrypt_files.LOCKED") for match in analysis["matches"]))
+
     def test_attach_indicator_analysis_adds_key(self):
         patterns = probe_patterns.compile_indicator_patterns(["+readme-warning+.txt"])
         snapshot = {
@@ -0,0 +1,490 @@
+"""Unit tests for probe runner helpers."""
+
+import socket
+import struct
+import time
+import unittest
+from unittest import mock
+
+from gui.utils import probe_runner
+
+
+class TestCheckPorts(unittest.TestCase):
+    def test_listening_port_is_reachable(self):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            reachable = probe_runner.check_ports(["127.0.0.1"], port=port, timeout_seconds=1)
+        self.assertEqual(reachable, {"127.0.0.1"})
+
+    def test_closed_port_is_not_reachable(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        reachable = probe_runner.check_ports(["127.0.0.1"], port=port, timeout_seconds=1)
+        self.assertEqual(reachable, set())
+
+    def test_open_hosts_are_yielded_before_the_check_finishes(self):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            # 192.0.2.0/24 is reserved for documentation and never answers
+            reachable = probe_runner.iter_reachable(["127.0.0.1", "192.0.2.1"], port=port, timeout_seconds=5)
+            started = time.monotonic()
+            first = next(reachable)
+            elapsed = time.monotonic() - started
+            reachable.close()
+        self.assertEqual(first, "127.0.0.1")
+        self.assertLess(elapsed, 1)
+
+
+class TestCheckEndpoints(unittest.TestCase):
+    def test_reports_connect_time_per_open_endpoint(self):
+        with socket.socket() as listener, socket.socket() as closed:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            closed.bind(("127.0.0.1", 0))
+            open_port = listener.getsockname()[1]
+            closed_port = closed.getsockname()[1]
+            reachable = probe_runner.check_endpoints(
+                [("127.0.0.1", open_port), ("127.0.0.1", closed_port)],
+                timeout_seconds=1
+            )
+        self.assertEqual(set(reachable), {("127.0.0.1", open_port)})
+        self.assertGreaterEqual(reachable[("127.0.0.1", open_port)], 0)
+
+    def test_unresolvable_host_is_skipped(self):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            reachable = probe_runner.check_endpoints(
+                [("host.invalid", port), ("127.0.0.1", port)],
+                timeout_seconds=1
+            )
+        self.assertEqual(set(reachable), {("127.0.0.1", port)})
+
+    def test_stop_at_skips_waiting_for_filtered_ports(self):
+        with socket.socket() as listener, socket.socket() as full, socket.socket() as filler:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            # A zero backlog that is already taken leaves new SYNs unanswered,
+            # like a port dropped by a firewall
+            full.bind(("127.0.0.1", 0))
+            full.listen(0)
+            filler.connect(full.getsockname())
+            smb = ("127.0.0.1", listener.getsockname()[1])
+            filtered = ("127.0.0.1", full.getsockname()[1])
+
+            started = time.monotonic()
+            reachable = probe_runner.check_endpoints([smb, filtered], timeout_seconds=3, stop_at=smb)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(set(reachable), {smb})
+        self.assertLess(elapsed, 1)
+
+    def test_in_flight_connects_are_capped(self):
+        with socket.socket() as first, socket.socket() as second, socket.socket() as closed:
+            for sock in (first, second):
+                sock.bind(("127.0.0.1", 0))
+                sock.listen()
+            closed.bind(("127.0.0.1", 0))
+            endpoints = [("127.0.0.1", sock.getsockname()[1]) for sock in (first, closed, second)]
+            with mock.patch.object(probe_runner, "_MAX_PENDING_CONNECTS", 1):
+                reachable = probe_runner.check_endpoints(endpoints, timeout_seconds=1)
+        self.assertEqual(set(reachable), {endpoints[0], endpoints[2]})
+
+
+class TestRunProbes(unittest.TestCase):
+    def test_reports_each_host_once(self):
+        calls = []
+
+        def fake_run_probe(ip, shares, **options):
+            calls.append((ip, tuple(shares), options["timeout_seconds"]))
+            if ip == "10.0.0.2":
+                raise probe_runner.ProbeError("unreachable")
+            return {"ip_address": ip, "shares": []}
+
+        with mock.patch.object(probe_runner, "run_probe", fake_run_probe), \
+                mock.patch.object(probe_runner, "iter_reachable", lambda hosts, **_: iter(list(hosts))):
+            results = {
+                ip: (snapshot, error)
+                for ip, snapshot, error in probe_runner.run_probes(
+                    [("10.0.0.1", ["C$"]), ("10.0.0.2", ["D$"])],
+                    max_hosts=2,
+                    timeout_seconds=3
+                )
+            }
+
+        self.assertEqual(sorted(calls), [("10.0.0.1", ("C$",), 3), ("10.0.0.2", ("D$",), 3)])
+        self.assertEqual(results["10.0.0.1"], ({"ip_address": "10.0.0.1", "shares": []}, None))
+        self.assertEqual(results["10.0.0.2"], (None, "unreachable"))
+
+    def test_on_snapshot_runs_for_successful_hosts(self):
+        seen = []
+
+        def fake_run_probe(ip, shares, **options):
+            if ip == "10.0.0.2":
+                raise probe_runner.ProbeError("unreachable")
+            return {"ip_address": ip}
+
+        def on_snapshot(ip, snapshot):
+            snapshot["analyzed"] = True
+            seen.append(ip)
+
+        with mock.patch.object(probe_runner, "run_probe", fake_run_probe), \
+                mock.patch.object(probe_runner, "iter_reachable", lambda hosts, **_: iter(list(hosts))):
+            results = list(probe_runner.run_probes(
+                [("10.0.0.1", ["C$"]), ("10.0.0.2", ["D$"])],
+                on_snapshot=on_snapshot,
+                timeout_seconds=3
+            ))
+
+        self.assertEqual(seen, ["10.0.0.1"])
+        self.assertIn(("10.0.0.1", {"ip_address": "10.0.0.1", "analyzed": True}, None), results)
+
+
+class TestRunProbesPreflight(unittest.TestCase):
+    def test_closed_hosts_skip_smb_work(self):
+        with mock.patch.object(probe_runner, "run_probe") as run_probe, \
+                mock.patch.object(probe_runner, "iter_reachable", return_value=iter(())):
+            results = list(probe_runner.run_probes([("10.0.0.9", ["C$"])], timeout_seconds=1))
+
+        run_probe.assert_not_called()
+        self.assertEqual(results, [("10.0.0.9", None, "Port 445 is not reachable on 10.0.0.9.")])
+
+    def test_reachable_hosts_are_not_checked_again(self):
+        with mock.patch.object(probe_runner, "run_probe", return_value={}) as run_probe, \
+                mock.patch.object(probe_runner, "iter_reachable", lambda hosts, **_: iter(list(hosts))):
+            list(probe_runner.run_probes([("10.0.0.1", ["C$"])], timeout_seconds=1))
+
+        self.assertIs(run_probe.call_args.kwargs["preflight"], False)
+
+    def test_probe_without_preflight_skips_port_check(self):
+        with mock.patch.object(probe_runner, "SMBConnection", object), \
+                mock.patch.object(probe_runner, "check_endpoints") as check_endpoints, \
+                mock.patch.object(probe_runner, "_connect", side_effect=lambda *_: _FakeConnection()):
+            snapshot = probe_runner.run_probe(
+                "10.0.0.1",
+                ["data"],
+                max_directories=1,
+                max_files=1,
+                timeout_seconds=1,
+                requests_per_second=None,
+                preflight=False
+            )
+
+        check_endpoints.assert_not_called()
+        self.assertNotIn("network", snapshot)
+        self.assertEqual([share["share"] for share in snapshot["shares"]], ["data"])
+
+    def test_filtered_netbios_port_does_not_delay_the_probe(self):
+        with socket.socket() as listener, socket.socket() as full, socket.socket() as filler:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            full.bind(("127.0.0.1", 0))
+            full.listen(0)
+            filler.connect(full.getsockname())
+            smb_port = listener.getsockname()[1]
+
+            started = time.monotonic()
+            with mock.patch.object(probe_runner, "SMBConnection", object), \
+                    mock.patch.object(probe_runner, "SMB_PORT", smb_port), \
+                    mock.patch.object(probe_runner, "NETBIOS_PORT", full.getsockname()[1]), \
+                    mock.patch.object(probe_runner, "_connect", side_effect=lambda *_: _FakeConnection()):
+                snapshot = probe_runner.run_probe(
+                    "127.0.0.1",
+                    ["data"],
+                    max_directories=1,
+                    max_files=1,
+                    timeout_seconds=3,
+                    requests_per_second=None
+                )
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual(snapshot["network"]["open_ports"], [smb_port])
+
+
+class TestHostRegistries(unittest.TestCase):
+    def test_entries_are_dropped_after_the_probe(self):
+        with mock.patch.object(probe_runner, "SMBConnection", object), \
+                mock.patch.object(probe_runner, "_connect", side_effect=lambda *_: _FakeConnection()):
+            probe_runner.run_probe(
+                "10.0.0.77",
+                ["data"],
+                max_directories=1,
+                max_files=1,
+                timeout_seconds=1,
+                requests_per_second=5,
+                preflight=False
+            )
+
+        self.assertNotIn("10.0.0.77", probe_runner._HOST_PROBE_LOCKS)
+        self.assertNotIn("10.0.0.77", probe_runner._HOST_LIMITERS)
+
+
+class _FakeEntry:
+    def __init__(self, name, is_directory):
+        self._name = name
+        self._is_directory = is_directory
+
+    def get_longname(self):
+        return self._name
+
+    def is_directory(self):
+        return self._is_directory
+
+
+class _FakeConnection:
+    TREE = {
+        ("data", "*"): [_FakeEntry(".", True), _FakeEntry("a", True), _FakeEntry("b", True), _FakeEntry("x.txt", False)],
+        ("data", "a\\*"): [_FakeEntry("1.txt", False), _FakeEntry("2.txt", False)],
+        ("data", "b\\*"): [_FakeEntry("3.txt", False)],
+    }
+
+    def __init__(self):
+        self.trees = []
+
+    def login(self, username, password):
+        pass
+
+    def connectTree(self, share):
+        if share != "data":
+            raise Exception("SMB SessionError: STATUS_BAD_NETWORK_NAME(share)")
+        self.trees.append(share)
+        return 1
+
+    def getSMBServer(self):
+        return self
+
+    def listPath(self, share, pattern):
+        if (share, pattern) not in self.TREE:
+            raise Exception("SMB SessionError: STATUS_BAD_NETWORK_NAME(share)")
+        return self.TREE[(share, pattern)]
+
+    def logoff(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestRunProbe(unittest.TestCase):
+    def test_listings_are_assembled_in_share_order(self):
+        connections = []
+
+        def connect(ip_address, timeout_seconds):
+            conn = _FakeConnection()
+            connections.append(conn)
+            return conn
+
+        with mock.patch.object(probe_runner, "SMBConnection", object), \
+                mock.patch.object(probe_runner, "check_endpoints", return_value={("10.0.0.1", 445): 0.01}), \
+                mock.patch.object(probe_runner, "_connect", side_effect=connect):
+            snapshot = probe_runner.run_probe(
+                "10.0.0.1",
+                ["data", "missing"],
+                max_directories=1,
+                max_files=1,
+                timeout_seconds=1,
+                requests_per_second=None
+            )
+
+        self.assertEqual(snapshot["shares"], [{
+            "share": "data",
+            "directories": [{"name": "a", "files": ["1.txt"], "files_truncated": True}],
+            "directories_truncated": True
+        }])
+        self.assertEqual(snapshot["errors"], [{"share": "missing", "message": "Share not found (STATUS_BAD_NETWORK_NAME)"}])
+        # Each session connects to a share's tree once, however many listings it serves
+        for conn in connections:
+            self.assertEqual(len(conn.trees), len(set(conn.trees)))
+
+
+class _FakeStatusError(Exception):
+    def __init__(self, error):
+        super().__init__(f"SMB SessionError: code: {error:#x}")
+        self.error = error
+
+
+class TestSessionPool(unittest.TestCase):
+    def test_share_level_errors_keep_the_session(self):
+        connections = []
+
+        class _DenyingConnection(_FakeConnection):
+            def connectTree(self, share):
+                if share != "data":
+                    raise _FakeStatusError(0xC0000022)  # STATUS_ACCESS_DENIED
+                return super().connectTree(share)
+
+        def connect(ip_address, timeout_seconds):
+            conn = _DenyingConnection()
+            connections.append(conn)
+            return conn
+
+        with mock.patch.object(probe_runner, "SMBConnection", object), \
+                mock.patch.object(probe_runner, "_SMB_STATUS_ERRORS", (_FakeStatusError,)), \
+                mock.patch.object(probe_runner, "check_endpoints", return_value={("10.0.0.1", 445): 0.01}), \
+                mock.patch.object(probe_runner, "_connect", side_effect=connect):
+            snapshot = probe_runner.run_probe(
+                "10.0.0.1",
+                ["a", "b", "data"],
+                max_directories=2,
+                max_files=1,
+                timeout_seconds=1,
+                max_workers=1,
+                requests_per_second=None
+            )
+
+        self.assertEqual(len(connections), 1)
+        self.assertEqual([share["share"] for share in snapshot["shares"]], ["data"])
+
+    def test_lost_session_is_discarded(self):
+        connections = []
+
+        class _ExpiringConnection(_FakeConnection):
+            def connectTree(self, share):
+                if share != "data":
+                    raise _FakeStatusError(0xC000035C)  # STATUS_NETWORK_SESSION_EXPIRED
+                return super().connectTree(share)
+
+        def connect(ip_address, timeout_seconds):
+            conn = _ExpiringConnection()
+            connections.append(conn)
+            return conn
+
+        with mock.patch.object(probe_runner, "SMBConnection", object), \
+                mock.patch.object(probe_runner, "_SMB_STATUS_ERRORS", (_FakeStatusError,)), \
+                mock.patch.object(probe_runner, "check_endpoints", return_value={("10.0.0.1", 445): 0.01}), \
+                mock.patch.object(probe_runner, "_connect", side_effect=connect):
+            probe_runner.run_probe(
+                "10.0.0.1",
+                ["a", "data"],
+                max_directories=1,
+                max_files=1,
+                timeout_seconds=1,
+                max_workers=1,
+                requests_per_second=None
+            )
+
+        self.assertEqual(len(connections), 2)
+
+    def test_failed_login_is_not_retried_per_share(self):
+        attempts = []
+
+        class _RejectingConnection(_FakeConnection):
+            def login(self, username, password):
+                attempts.append(username)
+                raise Exception("SMB SessionError: STATUS_LOGON_FAILURE(logon failure)")
+
+        with mock.patch.object(probe_runner, "SMBConnection", object), \
+                mock.patch.object(probe_runner, "check_endpoints", return_value={("10.0.0.1", 445): 0.01}), \
+                mock.patch.object(probe_runner, "_connect", side_effect=lambda *_: _RejectingConnection()):
+            snapshot = probe_runner.run_probe(
+                "10.0.0.1",
+                ["a", "b", "c"],
+                max_directories=1,
+                max_files=1,
+                timeout_seconds=1,
+                max_workers=1,
+                requests_per_second=None
+            )
+
+        self.assertEqual(len(attempts), 1)
+        self.assertEqual(
+            [error["message"] for error in snapshot["errors"]],
+            ["Logon failed (STATUS_LOGON_FAILURE)"] * 3
+        )
+
+
+class TestBuildSharePayload(unittest.TestCase):
+    def test_large_listings_are_capped(self):
+        root = [{"name": ".", "is_directory": True}] + [
+            {"name": f"dir{i}", "is_directory": True} for i in range(50)
+        ]
+        dir_entries = probe_runner._subdirectories(root, 3)
+        nested = [{"name": "..", "is_directory": True}] + [
+            {"name": f"{i}.txt", "is_directory": False} for i in range(1000)
+        ]
+
+        payload = probe_runner._build_share_payload(
+            "data", dir_entries, [nested, []], max_directories=2, max_files=2
+        )
+
+        self.assertEqual([entry["name"] for entry in dir_entries], ["dir0", "dir1", "dir2"])
+        self.assertEqual(payload, {
+            "share": "data",
+            "directories": [
+                {"name": "dir0", "files": ["0.txt", "1.txt"], "files_truncated": True},
+                {"name": "dir1", "files": [], "files_truncated": False}
+            ],
+            "directories_truncated": True
+        })
+
+
+def _full_dir_record(name, attributes, next_offset=0):
+    encoded = name.encode("utf-16le")
+    header = struct.pack("<II6qIII", next_offset, 0, 0, 0, 0, 0, 0, 0, attributes, len(encoded), 0)
+    return header + encoded
+
+
+class TestParseDirectoryPage(unittest.TestCase):
+    def test_records_are_decoded_in_place(self):
+        first = _full_dir_record("docs", 0x10, next_offset=80)
+        page = first.ljust(80, b"\0") + _full_dir_record("readme.txt", 0x20)
+
+        self.assertEqual(probe_runner._parse_directory_page(page), [
+            {"name": "docs", "is_directory": True},
+            {"name": "readme.txt", "is_directory": False},
+        ])
+
+
+@unittest.skipIf(probe_runner.SMB3 is None, "impacket is not installed")
+class TestQueryDirectory(unittest.TestCase):
+    def test_paging_stops_once_limit_is_reached(self):
+        server = mock.Mock(spec=["connectTree", "create", "queryDirectory", "disconnectTree", "SMB_PACKET", "sendSMB"])
+        server.connectTree.return_value = 1
+        server.create.return_value = b"\x01" * 16
+        server.SMB_PACKET.return_value = {}
+        server.queryDirectory.return_value = _full_dir_record("a.txt", 0x20)
+
+        entries = probe_runner._query_directory(server, "data", "*", limit=1, directories=False)
+
+        self.assertEqual(entries, [{"name": "a.txt", "is_directory": False}])
+        self.assertEqual(server.queryDirectory.call_count, 1)
+
+
+class TestHostProbeLock(unittest.TestCase):
+    def test_same_host_shares_one_lock(self):
+        self.assertIs(probe_runner._host_probe_lock("10.0.0.5"), probe_runner._host_probe_lock("10.0.0.5"))
+        self.assertIsNot(probe_runner._host_probe_lock("10.0.0.5"), probe_runner._host_probe_lock("10.0.0.6"))
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_waiters_are_spaced_by_reserved_slots(self):
+        sleeps = []
+        with mock.patch.object(probe_runner.time, "monotonic", return_value=100.0), \
+                mock.patch.object(probe_runner.time, "sleep", side_effect=sleeps.append):
+            limiter = probe_runner._RateLimiter(2.0)
+            for _ in range(4):
+                limiter.acquire()
+
+        # Burst of two, then one slot every half second
+        self.assertEqual(sleeps, [0.5, 1.0])
+
+
+class TestDescribeError(unittest.TestCase):
+    def test_known_status_is_mapped(self):
+        exc = Exception("SMB SessionError: STATUS_ACCESS_DENIED({Access Denied} A process has requested access)")
+        self.assertEqual(probe_runner._describe_error(exc), "Access denied (STATUS_ACCESS_DENIED)")
+
+    def test_unknown_error_is_passed_through(self):
+        exc = Exception("SMB SessionError: STATUS_SOMETHING_NEW(details)")
+        self.assertEqual(probe_runner._describe_error(exc), str(exc))
+
+
+if __name__ == "__main__":
+    unittest.main()
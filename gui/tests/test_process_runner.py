@@ -0,0 +1,79 @@
+"""Unit tests for backend subprocess execution."""
+
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+from gui.utils.backend_interface import process_runner
+
+
+class TestExecuteWithProgress(unittest.TestCase):
+    def test_callback_error_kills_the_cli(self):
+        interface = mock.Mock(
+            backend_path=".",
+            enable_debug_timeouts=False,
+            cancel_requested=False
+        )
+        interface._get_operation_timeout.return_value = 30
+        started = []
+
+        def failing_parser(interface, lines, output_lines, progress_callback, log_callback):
+            started.append(interface.active_process)
+            next(iter(lines))
+            raise ValueError("callback failed")
+
+        cmd = [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(30)"]
+        with mock.patch.object(process_runner.config, "validate_config", return_value={"valid": True}), \
+                mock.patch.object(process_runner.progress, "parse_output_stream", side_effect=failing_parser):
+            with self.assertRaises(ValueError):
+                process_runner.execute_with_progress(interface, cmd, progress_callback=None)
+
+        self.assertIsNotNone(started[0].returncode)
+        self.assertIsNone(interface.active_process)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "reads /proc")
+    def test_timeout_kills_the_cli_process_group(self):
+        interface = mock.Mock(
+            backend_path=".",
+            enable_debug_timeouts=False,
+            cancel_requested=False
+        )
+        interface._get_operation_timeout.return_value = 1
+        interface._format_timeout_duration.return_value = "1s"
+        output = []
+
+        def collecting_parser(interface, lines, output_lines, progress_callback, log_callback):
+            for line in lines:
+                output.append(line)
+
+        # The CLI starts a worker child, as scans do, and both outlive the timeout
+        script = (
+            "import subprocess, sys, time; "
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            "print(child.pid, flush=True); time.sleep(30)"
+        )
+        with mock.patch.object(process_runner.config, "validate_config", return_value={"valid": True}), \
+                mock.patch.object(process_runner.progress, "parse_output_stream", side_effect=collecting_parser):
+            with self.assertRaises(TimeoutError):
+                process_runner.execute_with_progress(interface, [sys.executable, "-c", script], progress_callback=None)
+
+        child_pid = int(output[0])
+        deadline = time.monotonic() + 5
+        while _process_running(child_pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(_process_running(child_pid))
+
+
+def _process_running(pid):
+    """True while ``pid`` exists and is not a zombie awaiting its reaper."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+if __name__ == "__main__":
+    unittest.main()
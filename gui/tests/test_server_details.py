@@ -0,0 +1,68 @@
+"""Unit tests for server detail text formatting."""
+
+import unittest
+
+from gui.components.server_list_window import details
+
+
+class TestFormatServerDetails(unittest.TestCase):
+    def test_lists_accessible_shares(self):
+        text = details._format_server_details({"accessible_shares_list": "ADMIN$, data,,"})
+
+        self.assertIn("   • ADMIN$\n   • data\n", text)
+
+    def test_no_shares_and_no_probe(self):
+        text = details._format_server_details({"accessible_shares_list": ""})
+
+        self.assertIn("   • None accessible", text)
+        self.assertIn("No probe has been run for this host yet.", text)
+
+    def test_probe_section_is_embedded(self):
+        text = details._format_server_details({}, "🔍 Probe Snapshot:\n")
+
+        self.assertIn("🔍 Probe Snapshot:", text)
+        self.assertNotIn("No probe has been run", text)
+
+
+class TestFormatProbeSection(unittest.TestCase):
+    def test_snapshot_layout(self):
+        snapshot = {
+            "run_at": "2024-01-01T00:00:00Z",
+            "limits": {"max_directories": 3, "max_files": 5, "timeout_seconds": 10},
+            "shares": [{
+                "share": "data",
+                "directories": [
+                    {"name": "docs", "files": ["a.txt"], "files_truncated": True},
+                    {"name": "empty", "files": []}
+                ]
+            }],
+            "errors": [{"share": "c$", "message": "Access denied"}]
+        }
+
+        text = details._format_probe_section(snapshot)
+
+        self.assertEqual(text, (
+            "🔍 Probe Snapshot:\n"
+            "   Run: 2024-01-01T00:00:00Z\n"
+            "   Limits: 3 dirs / 5 files per share | Timeout: 10s\n"
+            "   Share: data\n"
+            "      📁 docs/\n"
+            "         • a.txt\n"
+            "         … additional files not shown\n"
+            "      📁 empty/\n"
+            "         (no files listed)\n"
+            "\n   ⚠ Probe Errors:\n"
+            "      c$: Access denied\n"
+        ))
+
+    def test_indicator_hits_are_capped_at_five(self):
+        matches = [{"indicator": f"ind{i}", "path": f"data/p{i}"} for i in range(7)]
+        text = details._format_probe_section({"indicator_analysis": {"matches": matches}})
+
+        self.assertIn("      ind4 → data/p4\n", text)
+        self.assertNotIn("ind5", text)
+        self.assertIn("      … 2 additional hits\n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
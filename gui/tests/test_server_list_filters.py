@@ -0,0 +1,36 @@
+"""Unit tests for server list filtering logic."""
+
+import unittest
+from datetime import datetime, timedelta
+
+from gui.components.server_list_window import filters
+
+
+class TestApplyDateFilter(unittest.TestCase):
+    def setUp(self):
+        recent = (datetime.now() - timedelta(hours=1)).isoformat()
+        old = (datetime.now() - timedelta(days=60)).isoformat()
+        self.servers = [
+            {"ip_address": "10.0.0.1", "last_seen": recent},
+            {"ip_address": "10.0.0.2", "first_seen": old},
+            {"ip_address": "10.0.0.3"},
+        ]
+
+    def _ips(self, servers):
+        return [server["ip_address"] for server in servers]
+
+    def test_undated_servers_are_dropped_for_fixed_windows(self):
+        result = filters.apply_date_filter(self.servers, "Last 24 Hours", None)
+
+        self.assertEqual(self._ips(result), ["10.0.0.1"])
+
+    def test_undated_servers_are_kept_since_last_scan(self):
+        last_scan = datetime.now() - timedelta(days=1)
+
+        result = filters.apply_date_filter(self.servers, "Since Last Scan", last_scan)
+
+        self.assertEqual(self._ips(result), ["10.0.0.1", "10.0.0.3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
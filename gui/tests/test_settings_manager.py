@@ -0,0 +1,53 @@
+"""Unit tests for settings persistence."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from gui.utils.settings_manager import SettingsManager
+
+
+class TestSaveSettings(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.manager = SettingsManager(settings_dir=self._tmp.name)
+        self.settings_file = Path(self._tmp.name) / "gui_settings.json"
+
+    def test_unchanged_settings_are_not_rewritten(self):
+        self.manager.set_setting("interface.mode", "advanced")
+        before = self.settings_file.read_bytes()
+
+        self.assertTrue(self.manager.set_setting("interface.mode", "advanced"))
+
+        self.assertEqual(self.settings_file.read_bytes(), before)
+
+    def test_changed_settings_are_written(self):
+        self.manager.set_setting("interface.mode", "advanced")
+        self.manager.set_setting("interface.mode", "simple")
+
+        reloaded = SettingsManager(settings_dir=self._tmp.name)
+        self.assertEqual(reloaded.get_setting("interface.mode"), "simple")
+
+    def test_missing_file_is_recreated(self):
+        self.manager.set_setting("interface.mode", "advanced")
+        self.settings_file.unlink()
+
+        self.manager.save_settings()
+
+        self.assertTrue(self.settings_file.exists())
+
+    def test_export_round_trips(self):
+        self.manager.set_setting("interface.mode", "advanced")
+        export_path = Path(self._tmp.name) / "exported.json"
+
+        self.assertTrue(self.manager.export_settings(str(export_path)))
+
+        self.assertNotIn(b"\r\n", export_path.read_bytes())
+        other = SettingsManager(settings_dir=str(Path(self._tmp.name) / "other"))
+        self.assertTrue(other.import_settings(str(export_path)))
+        self.assertEqual(other.get_setting("interface.mode"), "advanced")
+
+
+if __name__ == "__main__":
+    unittest.main()
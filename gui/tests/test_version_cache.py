@@ -0,0 +1,57 @@
+"""Unit tests for the SMBSeek version check cache."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gui.utils import version_cache
+
+
+class TestRunVersionCheck(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_path = Path(self._tmp.name)
+        patcher = mock.patch.object(version_cache, "CACHE_PATH", self.tmp_path / "version_cache.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.script = self.tmp_path / "smbseek.py"
+        self.script.write_text(
+            "import pathlib\n"
+            f"pathlib.Path({str(self.tmp_path / 'runs.txt')!r}).open('a').write('x')\n"
+            "print('SMBSeek 3.0.0')\n",
+            encoding="utf-8"
+        )
+
+    def _runs(self):
+        runs_file = self.tmp_path / "runs.txt"
+        return len(runs_file.read_text()) if runs_file.exists() else 0
+
+    def test_second_check_is_served_from_cache(self):
+        first = version_cache.run_version_check(str(self.script))
+        second = version_cache.run_version_check(str(self.script))
+
+        self.assertEqual(first, (0, "SMBSeek 3.0.0\n"))
+        self.assertEqual(second, first)
+        self.assertEqual(self._runs(), 1)
+
+    def test_expired_entry_reruns_check(self):
+        version_cache.run_version_check(str(self.script))
+        version_cache.run_version_check(str(self.script), ttl_seconds=0)
+        self.assertEqual(self._runs(), 2)
+
+    def test_help_check_is_cached_per_interpreter(self):
+        self.assertEqual(version_cache.run_help_check(str(self.script), sys.executable), 0)
+        self.assertEqual(version_cache.run_help_check(str(self.script), sys.executable), 0)
+        self.assertEqual(self._runs(), 1)
+
+        # The help entry is separate from the version entry
+        version_cache.run_version_check(str(self.script))
+        self.assertEqual(self._runs(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
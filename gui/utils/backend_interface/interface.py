@@ -26,6 +26,33 @@ from . import process_runner
 from . import progress
 from . import mock_operations
 
+try:
+    from version_cache import run_help_check
+except ImportError:
+    from ..version_cache import run_help_check
+
+
+# Compiled once: failed-command output is scanned in a single regex pass
+# instead of a per-line loop of substring checks.
+_ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+_SPECIAL_ERROR_LINE_RE = re.compile(
+    r'^.*(?:'
+    r'No authenticated hosts found from the last'
+    r'|None of the specified servers are authenticated'
+    r'|SMB libraries not available'
+    r'|No module named [\'"](?:smbprotocol|pyspnego)[\'"]'
+    r').*$',
+    re.MULTILINE
+)
+
+_ERROR_LINE_RE = re.compile(
+    r'^.*(?:error:|failed:|exception:|traceback|invalid|missing|not found).*$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+_VERSION_RE = re.compile(rb'SMBSeek (\S+)')
+
 
 class BackendInterface:
     """
@@ -56,6 +83,14 @@ class BackendInterface:
         self.config_path = self.backend_path / "conf" / "config.json"
         self.config_example_path = self.backend_path / "conf" / "config.json.example"
 
+        # Command prefixes are fixed for the lifetime of the interface, so
+        # resolve them once instead of on every subprocess invocation
+        self._interpreter = sys.executable or 'python3'
+        self._cli_command_prefix = (self._interpreter, str(self.cli_script))
+        self._tools_dir = str(self.backend_path / "tools")
+        self._debug_subprocess = bool(os.getenv("XSMBSEEK_DEBUG_SUBPROCESS"))
+        self._backend_available_mtime = None
+
         # Mock mode for testing without backend
         self.mock_mode = mock_mode
 
@@ -110,11 +145,12 @@ class BackendInterface:
         Returns:
             User-friendly error message with actual CLI error details
         """
-        lines = full_output.split('\n')
+        clean_output = _ANSI_ESCAPE_RE.sub('', full_output)
         
         # Check for specific recent filtering errors first (as per backend team recommendations)
-        for line in lines:
-            line_clean = re.sub(r'\x1b\[[0-9;]*m', '', line).strip()
+        special_match = _SPECIAL_ERROR_LINE_RE.search(clean_output)
+        if special_match:
+            line_clean = special_match.group(0).strip()
             
             # Pattern: "No authenticated hosts found from the last N hours"
             if "No authenticated hosts found from the last" in line_clean:
@@ -125,59 +161,32 @@ class BackendInterface:
                 return f"SERVERS_NOT_AUTHENTICATED: {line_clean}"
 
             # Missing dependency patterns (smbprotocol / pyspnego not installed)
-            missing_dependency_substrings = (
-                "SMB libraries not available",
-                "ModuleNotFoundError: No module named 'smbprotocol'",
-                'ModuleNotFoundError: No module named "smbprotocol"',
-                "ModuleNotFoundError: No module named 'pyspnego'",
-                'ModuleNotFoundError: No module named "pyspnego"',
-                "No module named 'smbprotocol'",
-                'No module named "smbprotocol"',
-                "No module named 'pyspnego'",
-                'No module named "pyspnego"'
+            friendly_message = (
+                "SMBSeek backend is missing required SMB libraries (smbprotocol). "
+                "This usually happens when the xsmbseek GUI runs outside the project "
+                "virtual environment. Activate the venv (e.g., `source venv/bin/activate`) "
+                "or install the dependencies with `pip install -r requirements.txt`.\n"
+                f"Backend output: {line_clean}"
             )
-            if any(substring in line_clean for substring in missing_dependency_substrings):
-                friendly_message = (
-                    "SMBSeek backend is missing required SMB libraries (smbprotocol). "
-                    "This usually happens when the xsmbseek GUI runs outside the project "
-                    "virtual environment. Activate the venv (e.g., `source venv/bin/activate`) "
-                    "or install the dependencies with `pip install -r requirements.txt`.\n"
-                    f"Backend output: {line_clean}"
-                )
-                return f"DEPENDENCY_MISSING: {friendly_message}"
-        
-        # Look for common error patterns
-        error_indicators = [
-            'error:', 'Error:', 'ERROR:',
-            'failed:', 'Failed:', 'FAILED:',
-            'exception:', 'Exception:', 'EXCEPTION:',
-            'traceback', 'Traceback',
-            'invalid', 'Invalid', 'INVALID',
-            'missing', 'Missing', 'MISSING',
-            'not found', 'Not found', 'NOT FOUND'
-        ]
+            return f"DEPENDENCY_MISSING: {friendly_message}"
         
         # Extract relevant error lines
-        error_lines = []
-        for line in lines:
-            line_lower = line.lower().strip()
-            if any(indicator.lower() in line_lower for indicator in error_indicators):
-                # Clean up ANSI codes and whitespace
-                clean_line = re.sub(r'\x1b\[[0-9;]*m', '', line).strip()
-                if clean_line:
-                    error_lines.append(clean_line)
+        error_lines = [
+            line.strip() for line in _ERROR_LINE_RE.findall(clean_output)
+            if line.strip()
+        ]
         
         if error_lines:
             # Return first few error lines
             return '\n'.join(error_lines[:3])
         
         # If no specific errors found, look for last non-empty lines
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
+        non_empty_lines = [line.strip() for line in full_output.split('\n') if line.strip()]
         if non_empty_lines:
             # Return last few lines which often contain the error
             last_lines = non_empty_lines[-3:]
             # Clean up ANSI codes
-            clean_lines = [re.sub(r'\x1b\[[0-9;]*m', '', line) for line in last_lines]
+            clean_lines = [_ANSI_ESCAPE_RE.sub('', line) for line in last_lines]
             return '\n'.join(clean_lines)
         
         # Fallback to command and basic info
@@ -216,19 +225,9 @@ class BackendInterface:
         Returns:
             Command list with interpreter, script path, and arguments
         """
-        # Determine Python interpreter (same as GUI for environment consistency)
-        interpreter = sys.executable
-        if not interpreter:
-            # Fallback chain for robustness
-            interpreter = 'python3'  # Unix/Linux standard
-
-        # Ensure script path is string (currently Path object)
-        script_path = str(self.cli_script)
-
-        command_list = [interpreter, script_path, *args]
-        debug_enabled = os.getenv("XSMBSEEK_DEBUG_SUBPROCESS")
-        if debug_enabled:
-            print(f"DEBUG: CLI command -> interpreter={interpreter} cmd={command_list}")  # TODO: remove debug logging
+        command_list = [*self._cli_command_prefix, *args]
+        if self._debug_subprocess:
+            print(f"DEBUG: CLI command -> interpreter={self._interpreter} cmd={command_list}")  # TODO: remove debug logging
         return command_list
 
     def _build_tool_command(self, script_name: str, *args) -> List[str]:
@@ -242,18 +241,12 @@ class BackendInterface:
         Returns:
             Command list with interpreter, tool script path, and arguments
         """
-        # Determine Python interpreter (same as GUI for environment consistency)
-        interpreter = sys.executable
-        if not interpreter:
-            interpreter = 'python3'  # Unix/Linux standard
-
         # Build cross-platform path to tool script
-        script_path = str(self.backend_path / "tools" / script_name)
+        script_path = os.path.join(self._tools_dir, script_name)
 
-        command_list = [interpreter, script_path, *args]
-        debug_enabled = os.getenv("XSMBSEEK_DEBUG_SUBPROCESS")
-        if debug_enabled:
-            print(f"DEBUG: Tool command -> interpreter={interpreter} cmd={command_list}")  # TODO: remove debug logging
+        command_list = [self._interpreter, script_path, *args]
+        if self._debug_subprocess:
+            print(f"DEBUG: Tool command -> interpreter={self._interpreter} cmd={command_list}")  # TODO: remove debug logging
         return command_list
 
     def enable_mock_mode(self, mock_data_path: Optional[str] = None) -> None:
@@ -518,17 +511,23 @@ class BackendInterface:
                 "--recent", str(recent_hours),
                 "--count-only"
             )
+            # A missing tool script would only fail after an interpreter
+            # start; a stat call answers that without spawning anything
+            if not os.path.isfile(cmd[1]):
+                return False
             
+            # Only a bare integer on stdout matters; skip text decoding and
+            # don't buffer stderr at all
             result = subprocess.run(
                 cmd,
                 cwd=self.backend_path,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=30
             )
             
             if result.returncode == 0:
-                # Parse count from output
+                # Parse count from output (int() accepts ASCII digits as bytes)
                 output = result.stdout.strip()
                 try:
                     count = int(output)
@@ -564,6 +563,8 @@ class BackendInterface:
             }
         
         cmd = self._build_tool_command("db_query.py", "--summary")
+        if not os.path.isfile(cmd[1]):
+            raise RuntimeError(f"Database query failed: tool script not found at {cmd[1]}")
         
         try:
             result = subprocess.run(
@@ -778,16 +779,36 @@ class BackendInterface:
         if self.mock_mode:
             return True
         
+        # Cheap filesystem checks first - no point spawning an interpreter
+        # for a script that is missing or unreadable (it is run through the
+        # interpreter, so no execute bit is needed)
         try:
-            result = subprocess.run(
-                self._build_cli_command("--help"),
-                cwd=self.backend_path,
-                capture_output=True,
+            script_mtime = self.cli_script.stat().st_mtime
+        except OSError:
+            return False
+        if not os.access(self.cli_script, os.R_OK):
+            return False
+        
+        # A successful --help run stays valid until the script changes
+        if self._backend_available_mtime == script_mtime:
+            return True
+        
+        # The on-disk check cache lets a fresh GUI launch skip the --help
+        # interpreter start when the script is unchanged since last time
+        try:
+            returncode = run_help_check(
+                str(self.cli_script),
+                self._interpreter,
+                cwd=str(self.backend_path),
                 timeout=10
             )
-            return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
             return False
+        
+        if returncode == 0:
+            self._backend_available_mtime = script_mtime
+            return True
+        return False
     
     def get_backend_version(self) -> Optional[str]:
         """
@@ -803,15 +824,15 @@ class BackendInterface:
             result = subprocess.run(
                 self._build_cli_command("--version"),
                 cwd=self.backend_path,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
             if result.returncode == 0:
-                # Extract version from output
-                version_match = re.search(r'SMBSeek (\S+)', result.stdout)
+                # Extract version from raw output; decode only the match
+                version_match = _VERSION_RE.search(result.stdout)
                 if version_match:
-                    return version_match.group(1)
+                    return version_match.group(1).decode('utf-8', 'replace')
             return "Unknown"
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return None
@@ -915,10 +936,12 @@ class BackendInterface:
         try:
             fd, temp_path = tempfile.mkstemp(suffix=".json", prefix="smbseek_config_")
 
-            # Write merged config to temp file
-            with os.fdopen(fd, 'w') as f:
-                json.dump(temp_config, f, indent=2)
+            # Write merged config to temp file: encoded once and written as
+            # UTF-8 bytes, rather than json.dump's per-token text writes
+            # through the locale encoder and newline translation
+            with os.fdopen(fd, 'wb') as f:
                 fd = None  # fdopen closes the descriptor
+                f.write(json.dumps(temp_config, indent=2).encode('utf-8'))
 
             yield temp_path
 
@@ -5,17 +5,80 @@ Contains methods for executing commands with progress tracking, parsing output s
 and handling error recovery scenarios.
 """
 
+import codecs
 import subprocess
 import sys
 import threading
 import os
+import selectors
+import signal
 import time
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterator, List, Optional, Callable
 
 from . import config
 from . import progress
 
 
+_SELECTABLE_PIPES = not sys.platform.startswith('win')
+
+
+def _iter_output_lines(process, deadline: Optional[float]) -> Iterator[str]:
+    """
+    Yield stdout lines as they become readable, enforcing the deadline.
+
+    Reads the raw pipe directly (universal newlines, like text-mode Popen)
+    so lines are delivered as soon as they arrive instead of sitting in the
+    TextIOWrapper's read-ahead buffer.
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passes before EOF
+    """
+    fd = process.stdout.fileno()
+    decoder = codecs.getincrementaldecoder(process.stdout.encoding)(errors=process.stdout.errors)
+    pending = ""
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise subprocess.TimeoutExpired(process.args, 0)
+            if not selector.select(timeout):
+                continue
+
+            chunk = os.read(fd, 65536)
+            pending += decoder.decode(chunk, final=not chunk)
+            if chunk and pending.endswith("\r"):
+                # Could be the first half of a \r\n split across reads
+                text, pending = pending[:-1], "\r"
+            else:
+                text, pending = pending, ""
+
+            *lines, tail = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+            for line in lines:
+                yield line + "\n"
+            pending = tail + pending
+
+            if not chunk:
+                if pending:
+                    yield pending
+                return
+
+
+def _kill_process(process) -> None:
+    """Kill a CLI run (its whole process group on POSIX) and reap it."""
+    try:
+        if _SELECTABLE_PIPES:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+    process.wait()
+
+
 def execute_with_progress(interface, cmd: List[str],
                          progress_callback: Optional[Callable],
                          log_callback: Optional[Callable[[str], None]] = None,
@@ -45,6 +108,8 @@ def execute_with_progress(interface, cmd: List[str],
         "start_time": time.time(),
         "status": "running"
     }
+    process = None
+    progress_thread = None
 
     try:
         # Validate configuration before starting subprocess
@@ -91,17 +156,10 @@ def execute_with_progress(interface, cmd: List[str],
                 start_new_session=True
             )
 
-        # Thread for reading output and parsing progress
         output_lines = []
-        progress_thread = threading.Thread(
-            target=progress.parse_output_stream,
-            args=(interface, process.stdout, output_lines, progress_callback, log_callback)
-        )
-        progress_thread.start()
 
-        # Track active process and thread for cancellation
+        # Track active process for cancellation
         interface.active_process = process
-        interface.active_output_thread = progress_thread
 
         # Wait for completion with configurable timeout
         operation_timeout = interface._get_operation_timeout(timeout_override)
@@ -113,15 +171,35 @@ def execute_with_progress(interface, cmd: List[str],
             print(f"DEBUG: Using timeout: {timeout_display} (source: {timeout_source})")
 
         try:
-            returncode = process.wait(timeout=operation_timeout)
+            if _SELECTABLE_PIPES:
+                # POSIX: a selector watches stdout and the deadline from this
+                # thread, so no dedicated reader thread is needed
+                deadline = time.monotonic() + operation_timeout if operation_timeout else None
+                progress.parse_output_stream(
+                    interface,
+                    _iter_output_lines(process, deadline),
+                    output_lines,
+                    progress_callback,
+                    log_callback
+                )
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                returncode = process.wait(timeout=max(0, remaining) if remaining is not None else None)
+            else:
+                # Windows pipes cannot be selected on; read from a helper thread
+                progress_thread = threading.Thread(
+                    target=progress.parse_output_stream,
+                    args=(interface, process.stdout, output_lines, progress_callback, log_callback)
+                )
+                progress_thread.start()
+                interface.active_output_thread = progress_thread
+                returncode = process.wait(timeout=operation_timeout)
+                progress_thread.join()
         except subprocess.TimeoutExpired:
-            process.kill()
+            _kill_process(process)
             timeout_duration = interface._format_timeout_duration(operation_timeout)
             cmd_str = " ".join(cmd[:3])  # First 3 command parts for context
             raise TimeoutError(f"Operation '{cmd_str}...' timed out after {timeout_duration}")
 
-        progress_thread.join()
-
         # Check for cancellation before processing results
         if interface.cancel_requested:
             # Operation was cancelled - return cancellation result
@@ -170,12 +248,17 @@ def execute_with_progress(interface, cmd: List[str],
     finally:
         # Clean up cancellation state after operation completes/fails/is cancelled
         # Ensure thread is joined and state is reset
-        if progress_thread.is_alive():
+        if progress_thread is not None and progress_thread.is_alive():
             try:
                 progress_thread.join(timeout=5)
             except (threading.ThreadError, RuntimeError):
                 pass
 
+        # A callback or parser error can leave the read loop while the CLI
+        # is still running; never leave it behind untracked
+        if process is not None and process.poll() is None:
+            _kill_process(process)
+
         # Reset cancellation tracking state
         interface.active_process = None
         interface.active_output_thread = None
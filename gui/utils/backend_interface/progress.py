@@ -10,6 +10,90 @@ import re
 from typing import Dict, List, Optional, Callable, Tuple, Any
 
 
+# Keyword groups for phase inference, in priority order; one alternation per
+# phase so each line is scanned once per phase rather than once per keyword
+_INFERRED_PHASE_PATTERNS = (
+    ('discovery', re.compile(r'shodan|query|discovery')),
+    ('authentication', re.compile(r'authentication|auth|login')),
+    ('access_testing', re.compile(r'testing|processing|host')),  # Most common phase
+    ('collection', re.compile(r'collection|enumeration|share')),
+    ('reporting', re.compile(r'report|complete|summary')),
+)
+
+# Final results parsing, compiled once at import
+_ANSI_SGR_RE = re.compile(r'\x1B\[[0-9;]*m')
+_SHODAN_ERROR_RE = re.compile(r'Shodan API error:\s*(.+)', re.IGNORECASE)
+_FINAL_RESULT_PATTERNS = tuple(
+    (key, re.compile(pattern)) for key, pattern in (
+        # New patterns matching actual SMBSeek output format (with emoji prefixes)
+        ("hosts_scanned", r'📊\s*Hosts Scanned:\s*(?P<value>\d[\d,]*)'),
+        ("hosts_accessible", r'🔓\s*Hosts Accessible:\s*(?P<value>\d[\d,]*)'),
+        ("accessible_shares", r'📁\s*Accessible Shares:\s*(?P<value>\d[\d,]*)'),
+
+        # Legacy patterns (for backward compatibility with older SMBSeek versions)
+        ("shodan_results", r'Shodan Results:\s*(?P<value>\d[\d,]*)'),
+        ("hosts_tested", r'Hosts Tested:\s*(?P<value>\d[\d,]*)'),
+        ("successful_auth", r'Successful Auth:\s*(?P<value>\d[\d,]*)'),
+        ("failed_auth", r'Failed Auth:\s*(?P<value>\d[\d,]*)'),
+        ("session_id", r'session:\s*(?P<value>\d+)'),
+    )
+)
+_FIRST_NUMBER_RE = re.compile(r'\d+')
+# Keywords marking output lines worth echoing when parsing fails; one
+# alternation rejects a line in a single scan instead of one per keyword
+_RELEVANT_OUTPUT_RE = re.compile(r'hosts|scanned|accessible|shares|found|results', re.IGNORECASE)
+
+# CLI output stream patterns, compiled once at import
+
+# Enhanced progress patterns matching real backend output format
+# Formats: "\033[96mℹ 📊 Progress: 45/120 (37.5%)\033[0m" OR "📊 Progress: 25/100 (25.0%) | Success: 5, Failed: 20"
+# Also handles recent filtering: "Testing recent hosts: 25/100 (25.0%)"
+# Made info symbol optional to capture authentication testing progress
+_PROGRESS_RE = re.compile(r'(?:\033\[\d+m)?(?:ℹ\s*)?(?:📊\s*Progress:|Testing\s+recent\s+hosts?:)\s*(\d+)/(\d+)\s*\((\d+(?:\.\d+)?)\%\)(?:\s*\|.*?)?(?:\033\[\d+m)?')
+
+# Workflow step detection for phase transitions
+# Format: "\033[94m[1/4] Discovery & Authentication\033[0m"
+_WORKFLOW_RE = re.compile(r'(?:\033\[\d+m)?\[(\d+)/(\d+)\]\s*(.+?)(?:\033\[\d+m)?$')
+
+# General status pattern with ANSI color support
+_STATUS_RE = re.compile(r'(?:\033\[\d+m)?([ℹ✓⚠✗🚀])\s*(.+?)(?:\033\[\d+m)?$')
+
+# Early-stage patterns for immediate feedback
+_SHODAN_RE = re.compile(r'(?:Shodan|Query|Discovery|API).*?(\d+).*?(?:results?|found|hosts?|entries)', re.IGNORECASE)
+_DATABASE_RE = re.compile(r'(?:Database|DB).*?(\d+).*?(?:servers?|hosts?|known)', re.IGNORECASE)
+
+# Recent filtering specific patterns (as per backend team recommendations)
+_RECENT_FILTERING_RE = re.compile(r'(?:Loading|Found|Testing).*?(?:from\s+last|within\s+last|recent).*?(\d+).*?(?:days?|hours?).*?(\d+)?.*?(?:hosts?|servers?)', re.IGNORECASE)
+_SKIPPED_HOSTS_RE = re.compile(r'(?:Skipped|Skipping).*?(\d+).*?(?:hosts?|servers?).*?(?:recent|within|last)', re.IGNORECASE)
+
+# Authentication testing detection (for phase transition)
+_AUTH_TESTING_START_RE = re.compile(r'Testing SMB authentication on (\d+) hosts', re.IGNORECASE)
+
+# Enhanced detailed progress patterns
+_HOST_PROGRESS_RE = re.compile(r'(?:Testing|Processing|Checking).*?(?:host|server).*?(\d+).*?of.*?(\d+)', re.IGNORECASE)
+_SHARE_PROGRESS_RE = re.compile(r'(?:Enumerating|Checking).*?share.*?(\d+).*?of.*?(\d+)', re.IGNORECASE)
+_AUTH_SUCCESS_RE = re.compile(r'Success:\s*(\d+),?\s*Failed:\s*(\d+)', re.IGNORECASE)
+
+# Individual host testing pattern - matches: "[1/10] Testing 213.217.247.165..."
+_INDIVIDUAL_HOST_RE = re.compile(r'\[(\d+)/(\d+)\]\s*Testing\s+([\d.]+)', re.IGNORECASE)
+
+# Phase detection patterns with workflow step support
+_PHASE_PATTERNS = {
+    'discovery': re.compile(r'(?:Discovery|Shodan|Query|Found.*SMB.*servers|Step\s*1)', re.IGNORECASE),
+    'authentication': re.compile(r'(?:Testing SMB authentication|Authentication testing)', re.IGNORECASE),
+    'access_testing': re.compile(r'(?:Access|Share.*Verification|Step\s*2)', re.IGNORECASE),
+    'collection': re.compile(r'(?:Collection|Enumeration|File|Step\s*3)', re.IGNORECASE),
+    'reporting': re.compile(r'(?:Report|Intelligence|Step\s*4)', re.IGNORECASE)
+}
+
+# Patterns handed to parse_detailed_progress for every unmatched line
+_DETAILED_PROGRESS_PATTERNS = {
+    'host_progress': _HOST_PROGRESS_RE,
+    'share_progress': _SHARE_PROGRESS_RE,
+    'auth_success': _AUTH_SUCCESS_RE
+}
+
+
 def parse_output_stream(interface, stdout, output_lines: List[str],
                         progress_callback: Optional[Callable],
                         log_callback: Optional[Callable[[str], None]] = None) -> None:
@@ -29,47 +113,6 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
     # Reset phase tracking for new scan
     interface.last_known_phase = None
 
-    # Enhanced progress patterns matching real backend output format
-    # Formats: "\033[96mℹ 📊 Progress: 45/120 (37.5%)\033[0m" OR "📊 Progress: 25/100 (25.0%) | Success: 5, Failed: 20"
-    # Also handles recent filtering: "Testing recent hosts: 25/100 (25.0%)"
-    # Made info symbol optional to capture authentication testing progress
-    progress_pattern = re.compile(r'(?:\033\[\d+m)?(?:ℹ\s*)?(?:📊\s*Progress:|Testing\s+recent\s+hosts?:)\s*(\d+)/(\d+)\s*\((\d+(?:\.\d+)?)\%\)(?:\s*\|.*?)?(?:\033\[\d+m)?')
-
-    # Workflow step detection for phase transitions
-    # Format: "\033[94m[1/4] Discovery & Authentication\033[0m"
-    workflow_pattern = re.compile(r'(?:\033\[\d+m)?\[(\d+)/(\d+)\]\s*(.+?)(?:\033\[\d+m)?$')
-
-    # General status pattern with ANSI color support
-    status_pattern = re.compile(r'(?:\033\[\d+m)?([ℹ✓⚠✗🚀])\s*(.+?)(?:\033\[\d+m)?$')
-
-    # Early-stage patterns for immediate feedback
-    shodan_pattern = re.compile(r'(?:Shodan|Query|Discovery|API).*?(\d+).*?(?:results?|found|hosts?|entries)', re.IGNORECASE)
-    database_pattern = re.compile(r'(?:Database|DB).*?(\d+).*?(?:servers?|hosts?|known)', re.IGNORECASE)
-
-    # Recent filtering specific patterns (as per backend team recommendations)
-    recent_filtering_pattern = re.compile(r'(?:Loading|Found|Testing).*?(?:from\s+last|within\s+last|recent).*?(\d+).*?(?:days?|hours?).*?(\d+)?.*?(?:hosts?|servers?)', re.IGNORECASE)
-    skipped_hosts_pattern = re.compile(r'(?:Skipped|Skipping).*?(\d+).*?(?:hosts?|servers?).*?(?:recent|within|last)', re.IGNORECASE)
-
-    # Authentication testing detection (for phase transition)
-    auth_testing_start_pattern = re.compile(r'Testing SMB authentication on (\d+) hosts', re.IGNORECASE)
-
-    # Enhanced detailed progress patterns
-    host_progress_pattern = re.compile(r'(?:Testing|Processing|Checking).*?(?:host|server).*?(\d+).*?of.*?(\d+)', re.IGNORECASE)
-    share_progress_pattern = re.compile(r'(?:Enumerating|Checking).*?share.*?(\d+).*?of.*?(\d+)', re.IGNORECASE)
-    auth_success_pattern = re.compile(r'Success:\s*(\d+),?\s*Failed:\s*(\d+)', re.IGNORECASE)
-
-    # Individual host testing pattern - matches: "[1/10] Testing 213.217.247.165..."
-    individual_host_pattern = re.compile(r'\[(\d+)/(\d+)\]\s*Testing\s+([\d.]+)', re.IGNORECASE)
-
-    # Phase detection patterns with workflow step support
-    phase_patterns = {
-        'discovery': re.compile(r'(?:Discovery|Shodan|Query|Found.*SMB.*servers|Step\s*1)', re.IGNORECASE),
-        'authentication': re.compile(r'(?:Testing SMB authentication|Authentication testing)', re.IGNORECASE),
-        'access_testing': re.compile(r'(?:Access|Share.*Verification|Step\s*2)', re.IGNORECASE),
-        'collection': re.compile(r'(?:Collection|Enumeration|File|Step\s*3)', re.IGNORECASE),
-        'reporting': re.compile(r'(?:Report|Intelligence|Step\s*4)', re.IGNORECASE)
-    }
-
     for raw_line in stdout:
         stripped_line = raw_line.rstrip("\n")
         line = stripped_line.strip()
@@ -85,7 +128,7 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
             continue
 
         # Parse workflow step transitions first (gives us phase context)
-        workflow_match = workflow_pattern.search(line)
+        workflow_match = _WORKFLOW_RE.search(line)
         if workflow_match:
             step_num, total_steps, step_name = workflow_match.groups()
             step_percentage = calculate_workflow_step_percentage(int(step_num), int(total_steps))
@@ -93,12 +136,12 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
             continue
 
         # Parse explicit progress indicators (main progress tracking)
-        progress_match = progress_pattern.search(line)
+        progress_match = _PROGRESS_RE.search(line)
         if progress_match:
             current, total, percentage = progress_match.groups()
 
             # Detect current phase for progress mapping
-            current_phase = detect_phase(interface, line, phase_patterns)
+            current_phase = detect_phase(interface, line, _PHASE_PATTERNS)
 
             # Map backend percentage to workflow step range
             raw_percentage = float(percentage)
@@ -114,18 +157,21 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
             if not allow_100_percent and mapped_percentage >= 99.0:
                 mapped_percentage = 98.5
 
-            # Extract additional context if present
-            auth_match = auth_success_pattern.search(line)
+            # Extract additional context if present. The line is lowercased
+            # once; the case-sensitive "Testing recent hosts:" checks were
+            # subsumed by the lowercase ones
+            line_lower = line.lower()
+            auth_match = _AUTH_SUCCESS_RE.search(line)
             if auth_match:
                 success, failed = auth_match.groups()
                 # Check if this is recent filtering context
-                if "recent" in line.lower() or "Testing recent hosts:" in line:
+                if "recent" in line_lower:
                     message = f"Testing recent hosts: {current}/{total} (Success: {success}, Failed: {failed})"
                 else:
                     message = f"Testing hosts: {current}/{total} (Success: {success}, Failed: {failed})"
             else:
                 # Check if this is recent filtering progress
-                if "Testing recent hosts:" in line or "recent hosts:" in line.lower():
+                if "recent hosts:" in line_lower:
                     message = f"Testing recent hosts: {current}/{total}"
                 else:
                     message = f"Processing {current}/{total} hosts"
@@ -145,50 +191,51 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
             continue
 
         # Parse early-stage activity for immediate feedback
-        shodan_match = shodan_pattern.search(line)
+        shodan_match = _SHODAN_RE.search(line)
         if shodan_match:
             count = shodan_match.group(1)
             progress_callback(10.0, f"Shodan query found {count} potential targets")
             continue
 
-        database_match = database_pattern.search(line)
+        database_match = _DATABASE_RE.search(line)
         if database_match:
             count = database_match.group(1)
             progress_callback(5.0, f"Database loaded: {count} known servers")
             continue
 
         # Detect authentication testing start
-        auth_start_match = auth_testing_start_pattern.search(line)
+        auth_start_match = _AUTH_TESTING_START_RE.search(line)
         if auth_start_match:
             count = auth_start_match.group(1)
             progress_callback(15.0, f"Starting authentication tests on {count} hosts...")
             continue
 
         # Parse recent filtering activity
-        recent_filter_match = recent_filtering_pattern.search(line)
+        recent_filter_match = _RECENT_FILTERING_RE.search(line)
         if recent_filter_match:
             # Extract numbers - first is timeframe, second (if present) is host count
             numbers = recent_filter_match.groups()
             timeframe = numbers[0]
             host_count = numbers[1] if len(numbers) > 1 and numbers[1] else "some"
 
-            if "loading" in line.lower():
+            line_lower = line.lower()
+            if "loading" in line_lower:
                 progress_callback(8.0, f"Loading hosts from last {timeframe} days...")
-            elif "found" in line.lower():
+            elif "found" in line_lower:
                 progress_callback(12.0, f"Found {host_count} hosts within recent timeframe")
-            elif "testing" in line.lower():
+            elif "testing" in line_lower:
                 progress_callback(20.0, f"Testing {host_count} recent hosts...")
             continue
 
         # Parse skipped hosts due to recent filtering
-        skipped_match = skipped_hosts_pattern.search(line)
+        skipped_match = _SKIPPED_HOSTS_RE.search(line)
         if skipped_match:
             count = skipped_match.group(1)
             progress_callback(5.0, f"Skipped {count} hosts (scanned within recent timeframe)")
             continue
 
         # Parse individual host testing for granular progress (e.g., "[5/100] Testing 192.168.1.5...")
-        individual_host_match = individual_host_pattern.search(line)
+        individual_host_match = _INDIVIDUAL_HOST_RE.search(line)
         if individual_host_match:
             current, total, ip_address = individual_host_match.groups()
 
@@ -220,14 +267,10 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
                 pass
 
         # Determine current phase for context
-        current_phase = detect_phase(interface, line, phase_patterns)
+        current_phase = detect_phase(interface, line, _PHASE_PATTERNS)
 
         # Parse detailed progress based on enhanced patterns
-        detailed_progress = parse_detailed_progress(line, {
-            'host_progress': host_progress_pattern,
-            'share_progress': share_progress_pattern,
-            'auth_success': auth_success_pattern
-        })
+        detailed_progress = parse_detailed_progress(line, _DETAILED_PROGRESS_PATTERNS)
 
         if detailed_progress:
             percentage, message = detailed_progress
@@ -235,7 +278,7 @@ def parse_output_stream(interface, stdout, output_lines: List[str],
             continue
 
         # Parse general status messages with improved context
-        status_match = status_pattern.search(line)
+        status_match = _STATUS_RE.search(line)
         if status_match:
             icon, message = status_match.groups()
             # Estimate progress based on phase, icon, and keywords
@@ -295,16 +338,9 @@ def infer_phase_from_context(line: str) -> Optional[str]:
     line_lower = line.lower()
 
     # Simple keyword-based inference for common cases
-    if any(keyword in line_lower for keyword in ['shodan', 'query', 'discovery']):
-        return 'discovery'
-    elif any(keyword in line_lower for keyword in ['authentication', 'auth', 'login']):
-        return 'authentication'
-    elif any(keyword in line_lower for keyword in ['testing', 'processing', 'host']):
-        return 'access_testing'  # Most common phase
-    elif any(keyword in line_lower for keyword in ['collection', 'enumeration', 'share']):
-        return 'collection'
-    elif any(keyword in line_lower for keyword in ['report', 'complete', 'summary']):
-        return 'reporting'
+    for phase, pattern in _INFERRED_PHASE_PATTERNS:
+        if pattern.search(line_lower):
+            return phase
 
     return None  # Let caller handle this case
 
@@ -474,7 +510,7 @@ def parse_final_results(output: str) -> Dict:
     "Discovery Results" section of CLI output.
     """
     # Strip ANSI escape sequences once for both regex extraction and success detection
-    cleaned_output = re.sub(r'\x1B\[[0-9;]*m', '', output)
+    cleaned_output = _ANSI_SGR_RE.sub('', output)
 
     results = {
         "success": False,
@@ -491,30 +527,16 @@ def parse_final_results(output: str) -> Dict:
     }
 
     # Detect explicit Shodan credit errors and surface them
-    shodan_error_match = re.search(r'Shodan API error:\s*(.+)', cleaned_output, re.IGNORECASE)
+    shodan_error_match = _SHODAN_ERROR_RE.search(cleaned_output)
     if shodan_error_match:
         results["error"] = shodan_error_match.group(0).lstrip('✗❌ ').strip()
         return results
 
-    # Parse results section - updated patterns to match actual SMBSeek output format
-    patterns = {
-        # New patterns matching actual SMBSeek output format (with emoji prefixes)
-        "hosts_scanned": r'📊\s*Hosts Scanned:\s*(\d[\d,]*)',
-        "hosts_accessible": r'🔓\s*Hosts Accessible:\s*(\d[\d,]*)',
-        "accessible_shares": r'📁\s*Accessible Shares:\s*(\d[\d,]*)',
-
-        # Legacy patterns (for backward compatibility with older SMBSeek versions)
-        "shodan_results": r'Shodan Results:\s*(\d[\d,]*)',
-        "hosts_tested": r'Hosts Tested:\s*(\d[\d,]*)',
-        "successful_auth": r'Successful Auth:\s*(\d[\d,]*)',
-        "failed_auth": r'Failed Auth:\s*(\d[\d,]*)',
-        "session_id": r'session:\s*(\d+)'
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, cleaned_output)
+    # Parse results section - patterns (module level) match actual SMBSeek output format
+    for key, pattern in _FINAL_RESULT_PATTERNS:
+        match = pattern.search(cleaned_output)
         if match:
-            value = match.group(1).replace(',', '')  # Strip commas before int conversion
+            value = match.group('value').replace(',', '')  # Strip commas before int conversion
             results[key] = int(value) if value.isdigit() else value
 
     # Create compatibility mappings for backward compatibility and flexible field access
@@ -553,8 +575,7 @@ def parse_final_results(output: str) -> Dict:
             print(f"Parsed values: {parsed_fields}")
             # Show a snippet of the output for debugging
             output_lines = cleaned_output.split('\n')
-            relevant_lines = [line for line in output_lines if any(keyword in line.lower()
-                             for keyword in ['hosts', 'scanned', 'accessible', 'shares', 'found', 'results'])]
+            relevant_lines = [line for line in output_lines if _RELEVANT_OUTPUT_RE.search(line)]
             if relevant_lines:
                 print(f"Relevant output lines: {relevant_lines[:5]}")  # Show first 5 relevant lines
 
@@ -592,17 +613,17 @@ def parse_summary_output(output: str) -> Dict:
     # This would need to match the actual CLI output format
     lines = output.split('\n')
     for line in lines:
-        if "servers" in line.lower():
-            numbers = re.findall(r'\d+', line)
-            if numbers:
-                summary["total_servers"] = int(numbers[0])
-        elif "shares" in line.lower():
-            numbers = re.findall(r'\d+', line)
-            if numbers:
-                summary["accessible_shares"] = int(numbers[0])
-        elif "vulnerabilities" in line.lower():
-            numbers = re.findall(r'\d+', line)
-            if numbers:
-                summary["vulnerabilities"] = int(numbers[0])
+        line_lower = line.lower()
+        if "servers" in line_lower:
+            key = "total_servers"
+        elif "shares" in line_lower:
+            key = "accessible_shares"
+        elif "vulnerabilities" in line_lower:
+            key = "vulnerabilities"
+        else:
+            continue
+        number_match = _FIRST_NUMBER_RE.search(line)
+        if number_match:
+            summary[key] = int(number_match.group())
 
     return summary
@@ -2,21 +2,47 @@
 SMBSeek GUI - Data Export Engine
 
 Centralized data export system supporting multiple formats for team collaboration.
-Handles CSV and JSON exports with consistent formatting and metadata.
+Handles CSV, JSON and JSON Lines exports with consistent formatting and metadata.
 
 Design Decision: Centralized export engine ensures consistent data formats
 across all components and simplifies maintenance of export functionality.
 """
 
 import csv
+import io
 import json
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Callable
-import tempfile
+from typing import IO, Dict, List, Any, Optional, Union, Callable
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+
+# Large exports write many small rows/records; a 1 MiB buffer turns them
+# into a handful of write() syscalls instead of one per 8 KiB
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _dumps_indented(value: Any) -> bytes:
+    """
+    Serialize to UTF-8 JSON with 2-space indentation.
+
+    Uses orjson when available; datetimes are passed through to ``str`` so
+    the output matches the stdlib ``default=str`` rendering.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(value, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+
 
 class DataExportEngine:
     """
@@ -32,6 +58,7 @@ class DataExportEngine:
         self.export_formats = {
             'csv': self._export_csv,
             'json': self._export_json,
+            'jsonl': self._export_jsonl,
             'zip': self._export_zip
         }
         
@@ -111,7 +138,7 @@ class DataExportEngine:
         Args:
             data: List of data dictionaries to export
             data_type: Type of data (servers, vulnerabilities, shares, scan_results)
-            export_format: Format to export (csv, json, zip)
+            export_format: Format to export (csv, json, jsonl, zip)
             output_path: Path to save the exported file
             include_metadata: Whether to include export metadata
             filters_applied: Dictionary of filters that were applied
@@ -251,64 +278,72 @@ class DataExportEngine:
         Returns:
             Export result dictionary
         """
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=EXPORT_BUFFER_SIZE) as csvfile:
+            self._write_csv(csvfile, data, data_type, metadata, progress_callback)
+        
+        return {
+            'success': True,
+            'output_path': output_path,
+            'format': 'csv',
+            'records_exported': len(data),
+            'file_size': os.path.getsize(output_path)
+        }
+    
+    def _write_csv(self, csvfile: IO[str], data: List[Dict[str, Any]], data_type: str,
+                   metadata: Optional[Dict[str, Any]],
+                   progress_callback: Optional[Callable[[int, str], None]]) -> None:
+        """Write CSV rows (with optional metadata comment lines) to an open text stream."""
         mapping = self.field_mappings[data_type]
         all_fields = mapping['required_fields'] + mapping['optional_fields']
         
-        # Determine which fields are actually present in the data
-        present_fields = []
-        for field in all_fields:
-            if any(field in item for item in data):
-                present_fields.append(field)
+        # Determine which fields are actually present in the data, in one
+        # pass over the records rather than one scan per candidate field
+        seen_fields = set()
+        for item in data:
+            seen_fields.update(item)
+        present_fields = [field for field in all_fields if field in seen_fields]
         
         # Use display names for headers
         headers = [mapping['display_names'].get(field, field) for field in present_fields]
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write metadata as comments if included
-            if metadata:
-                writer.writerow([f"# SMBSeek Export - {metadata['export_info']['timestamp']}"])
-                writer.writerow([f"# Data Type: {data_type}"])
-                writer.writerow([f"# Records: {len(data)}"])
-                if metadata.get('filters_applied'):
-                    filters_str = ', '.join(f"{k}={v}" for k, v in metadata['filters_applied'].items() if v)
-                    writer.writerow([f"# Filters: {filters_str}"])
-                writer.writerow([])  # Empty row separator
-            
-            # Write headers
-            writer.writerow(headers)
-            
-            # Write data rows
-            for i, item in enumerate(data):
-                row = []
-                for field in present_fields:
-                    value = item.get(field, '')
-                    
-                    # Handle different data types
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value) if value else ''
-                    elif value is None:
-                        value = ''
-                    else:
-                        value = str(value)
-                    
-                    row.append(value)
+        writer = csv.writer(csvfile)
+        
+        # Write metadata as comments if included
+        if metadata:
+            writer.writerow([f"# SMBSeek Export - {metadata['export_info']['timestamp']}"])
+            writer.writerow([f"# Data Type: {data_type}"])
+            writer.writerow([f"# Records: {len(data)}"])
+            if metadata.get('filters_applied'):
+                filters_str = ', '.join(f"{k}={v}" for k, v in metadata['filters_applied'].items() if v)
+                writer.writerow([f"# Filters: {filters_str}"])
+            writer.writerow([])  # Empty row separator
+        
+        # Write headers
+        writer.writerow(headers)
+        
+        # Write data rows
+        for i, item in enumerate(data):
+            row = []
+            for field in present_fields:
+                value = item.get(field, '')
                 
-                writer.writerow(row)
+                # Handle different data types
+                if isinstance(value, (list, dict)):
+                    value = json.dumps(value) if value else ''
+                elif value is None:
+                    value = ''
+                else:
+                    value = str(value)
                 
-                # Progress update
-                if progress_callback and i % 100 == 0:
-                    progress = 50 + int((i / len(data)) * 40)
-                    progress_callback(progress, f"Writing row {i+1}/{len(data)}")
-        
-        return {
-            'success': True,
-            'output_path': output_path,
-            'format': 'csv',
-            'records_exported': len(data),
-            'file_size': os.path.getsize(output_path)
-        }
+                row.append(value)
+            
+            writer.writerow(row)
+            
+            # Progress update
+            if progress_callback and i % 100 == 0:
+                progress = 50 + int((i / len(data)) * 40)
+                progress_callback(progress, f"Writing row {i+1}/{len(data)}")
     
     def _export_json(self, data: List[Dict[str, Any]], data_type: str,
                     output_path: str, metadata: Optional[Dict[str, Any]], 
@@ -326,28 +361,101 @@ class DataExportEngine:
         Returns:
             Export result dictionary
         """
-        export_structure = {
-            'data': data
+        with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as jsonfile:
+            self._write_json(jsonfile, data, metadata, progress_callback)
+        
+        if progress_callback:
+            progress_callback(90, "JSON export completed")
+        
+        return {
+            'success': True,
+            'output_path': output_path,
+            'format': 'json',
+            'records_exported': len(data),
+            'file_size': os.path.getsize(output_path)
         }
+    
+    def _write_json(self, jsonfile: IO[bytes], data: List[Dict[str, Any]],
+                    metadata: Optional[Dict[str, Any]],
+                    progress_callback: Optional[Callable[[int, str], None]]) -> None:
+        """Write the JSON document to an open binary stream."""
+        # Stream records one at a time rather than building the whole
+        # document in memory; layout matches json.dump(..., indent=2)
+        jsonfile.write(b'{\n  "data": [')
+        
+        for i, item in enumerate(data):
+            record = _dumps_indented(item).replace(b'\n', b'\n    ')
+            jsonfile.write((b'\n    ' if i == 0 else b',\n    ') + record)
+            
+            # Progress update
+            if progress_callback and i % 100 == 0:
+                progress = 50 + int((i / len(data)) * 40)
+                progress_callback(progress, f"Writing record {i+1}/{len(data)}")
+        
+        jsonfile.write(b'\n  ]' if data else b']')
         
         # Include metadata if provided
         if metadata:
-            export_structure['metadata'] = metadata
+            metadata_json = _dumps_indented(metadata).replace(b'\n', b'\n  ')
+            jsonfile.write(b',\n  "metadata": ' + metadata_json)
         
-        # Write JSON file
-        with open(output_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_structure, jsonfile, indent=2, default=str)
+        jsonfile.write(b'\n}')
+    
+    def _export_jsonl(self, data: List[Dict[str, Any]], data_type: str,
+                     output_path: str, metadata: Optional[Dict[str, Any]],
+                     progress_callback: Optional[Callable[[int, str], None]]) -> Dict[str, Any]:
+        """
+        Export data to JSON Lines format (one compact record per line).
         
-        if progress_callback:
-            progress_callback(90, "JSON export completed")
+        Records are serialized and written as they are produced, so memory
+        stays flat however large the export. Metadata goes to a sidecar
+        ``<name>_metadata.json`` file to keep every line a data record.
         
-        return {
+        Args:
+            data: Validated data to export
+            data_type: Type of data
+            output_path: Output file path
+            metadata: Export metadata
+            progress_callback: Progress callback function
+            
+        Returns:
+            Export result dictionary
+        """
+        with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as jsonlfile:
+            for i, item in enumerate(data):
+                # Same rendering either way: datetimes via str, non-ASCII as UTF-8
+                if orjson is not None:
+                    jsonlfile.write(orjson.dumps(
+                        item,
+                        default=str,
+                        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                    ))
+                else:
+                    jsonlfile.write((json.dumps(item, default=str, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8'))
+                
+                # Progress update
+                if progress_callback and i % 100 == 0:
+                    progress = 50 + int((i / len(data)) * 40)
+                    progress_callback(progress, f"Writing record {i+1}/{len(data)}")
+        
+        result = {
             'success': True,
             'output_path': output_path,
-            'format': 'json',
+            'format': 'jsonl',
             'records_exported': len(data),
             'file_size': os.path.getsize(output_path)
         }
+        
+        if metadata:
+            output = Path(output_path)
+            metadata_path = output.with_name(f"{output.stem}_metadata.json")
+            metadata_path.write_bytes(_dumps_indented(metadata))
+            result['metadata_path'] = str(metadata_path)
+        
+        if progress_callback:
+            progress_callback(90, "JSON Lines export completed")
+        
+        return result
     
     def _export_zip(self, data: List[Dict[str, Any]], data_type: str,
                    output_path: str, metadata: Optional[Dict[str, Any]], 
@@ -365,37 +473,28 @@ class DataExportEngine:
         Returns:
             Export result dictionary
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
+        # Members are streamed straight into the archive, so nothing is
+        # written to a temporary file and read back
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             if progress_callback:
                 progress_callback(60, "Creating CSV file...")
             
-            # Create CSV file
-            csv_path = temp_path / f"{data_type}_export.csv"
-            csv_result = self._export_csv(data, data_type, str(csv_path), metadata, None)
+            with zipf.open(f"{data_type}_export.csv", 'w') as member:
+                with io.TextIOWrapper(member, encoding='utf-8', newline='') as csvfile:
+                    self._write_csv(csvfile, data, data_type, metadata, None)
             
             if progress_callback:
                 progress_callback(75, "Creating JSON file...")
             
-            # Create JSON file
-            json_path = temp_path / f"{data_type}_export.json"
-            json_result = self._export_json(data, data_type, str(json_path), metadata, None)
+            with zipf.open(f"{data_type}_export.json", 'w') as member:
+                self._write_json(member, data, metadata, None)
             
             if progress_callback:
-                progress_callback(90, "Creating ZIP archive...")
+                progress_callback(90, "Finishing ZIP archive...")
             
-            # Create ZIP file
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(csv_path, csv_path.name)
-                zipf.write(json_path, json_path.name)
-                
-                # Add metadata file if present
-                if metadata:
-                    metadata_path = temp_path / "export_metadata.json"
-                    with open(metadata_path, 'w', encoding='utf-8') as metafile:
-                        json.dump(metadata, metafile, indent=2, default=str)
-                    zipf.write(metadata_path, metadata_path.name)
+            # Add metadata file if present
+            if metadata:
+                zipf.writestr("export_metadata.json", _dumps_indented(metadata))
         
         return {
             'success': True,
@@ -450,6 +549,7 @@ class DataExportEngine:
         expected_extensions = {
             'csv': ['.csv'],
             'json': ['.json'],
+            'jsonl': ['.jsonl'],
             'zip': ['.zip']
         }
         
@@ -500,6 +600,12 @@ class DataExportEngine:
             avg_bytes_per_record = len(sample_json.encode('utf-8')) / sample_size if sample_size > 0 else 0
             estimated_bytes = int(avg_bytes_per_record * len(data) * 1.3)  # 30% padding for structure
             
+        elif export_format == 'jsonl':
+            # Compact records, one per line: sample size is close to exact
+            sample_json = json.dumps(sample_data, default=str)
+            avg_bytes_per_record = len(sample_json.encode('utf-8')) / sample_size if sample_size > 0 else 0
+            estimated_bytes = int(avg_bytes_per_record * len(data) * 1.05)
+            
         else:  # zip
             # Estimate as sum of CSV and JSON with compression
             csv_estimate = self.estimate_export_size(data, data_type, 'csv')['estimated_bytes']
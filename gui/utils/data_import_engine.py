@@ -10,15 +10,17 @@ workflow where colleagues export data and share it for import.
 """
 
 import csv
+import io
+import itertools
 import json
 import sqlite3
 import zipfile
+from collections import Counter
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Callable, Tuple
-import tempfile
+from typing import IO, Dict, List, Any, Optional, Union, Callable, Tuple
 import os
-import hashlib
 
 
 class DataImportEngine:
@@ -30,6 +32,9 @@ class DataImportEngine:
     collaboration workflows.
     """
     
+    # Bound parameters per bulk key lookup (SQLite's historic limit is 999)
+    KEY_LOOKUP_CHUNK = 500
+    
     def __init__(self, db_path: str):
         """
         Initialize the data import engine.
@@ -39,6 +44,13 @@ class DataImportEngine:
         """
         self.db_path = db_path
         
+        # File readers by extension (same dispatch as the export engine)
+        self.file_readers = {
+            '.csv': self._read_csv_file,
+            '.json': self._read_json_file,
+            '.zip': self._read_zip_file
+        }
+        
         # Import modes
         self.import_modes = {
             'merge': 'Add new records, update existing ones',
@@ -155,14 +167,10 @@ class DataImportEngine:
             
             # Determine file format and extract data
             file_ext = Path(file_path).suffix.lower()
-            if file_ext == '.csv':
-                data = self._read_csv_file(file_path, data_type, progress_callback)
-            elif file_ext == '.json':
-                data = self._read_json_file(file_path, data_type, progress_callback)
-            elif file_ext == '.zip':
-                data = self._read_zip_file(file_path, data_type, progress_callback)
-            else:
+            reader = self.file_readers.get(file_ext)
+            if reader is None:
                 raise ValueError(f"Unsupported file format: {file_ext}")
+            data = reader(file_path, data_type, progress_callback)
             
             if progress_callback:
                 progress_callback(25, f"Loaded {len(data)} records, validating...")
@@ -188,14 +196,17 @@ class DataImportEngine:
             if progress_callback:
                 progress_callback(50, "Data validated, preparing database...")
             
-            # Initialize database schema
-            self._ensure_database_schema(data_type)
-            
-            if progress_callback:
-                progress_callback(75, f"Importing {len(data)} records...")
-            
-            # Import data to database
-            import_result = self._import_to_database(data, data_type, import_mode, progress_callback)
+            # One connection serves both the schema setup and the import, so
+            # the database is opened and its schema loaded once per import
+            with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+                # Initialize database schema
+                self._ensure_database_schema(conn, data_type)
+                
+                if progress_callback:
+                    progress_callback(75, f"Importing {len(data)} records...")
+                
+                # Import data to database
+                import_result = self._import_to_database(conn, data, data_type, import_mode, progress_callback)
             
             if progress_callback:
                 progress_callback(100, "Import completed successfully")
@@ -210,60 +221,49 @@ class DataImportEngine:
     def _read_csv_file(self, file_path: str, data_type: str, 
                       progress_callback: Optional[Callable[[int, str], None]]) -> List[Dict[str, Any]]:
         """Read and parse CSV file."""
+        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+            return self._parse_csv_stream(csvfile, progress_callback)
+    
+    def _parse_csv_stream(self, csvfile: IO[str],
+                          progress_callback: Optional[Callable[[int, str], None]]) -> List[Dict[str, Any]]:
+        """Parse CSV rows from an open text stream in a single pass."""
         data = []
         
-        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            # Skip comment lines that start with #
-            lines = [line for line in csvfile if not line.strip().startswith('#')]
-            
-            # Reset file pointer and create reader
-            csvfile.seek(0)
-            # Skip comment lines again
-            for line in csvfile:
-                if not line.strip().startswith('#'):
-                    break
-            
-            # Get current position and read from there
-            csvfile.seek(0)
-            content = csvfile.read()
-            lines = content.split('\n')
-            
-            # Find first non-comment line for header
-            header_line = None
-            data_start = 0
-            for i, line in enumerate(lines):
-                if not line.strip().startswith('#') and line.strip():
-                    header_line = line
-                    data_start = i + 1
-                    break
-            
-            if not header_line:
-                raise ValueError("No data found in CSV file")
-            
-            # Parse header and data
-            reader = csv.DictReader([header_line] + lines[data_start:])
-            
-            for i, row in enumerate(reader):
-                # Clean up row data
-                clean_row = {}
-                for key, value in row.items():
-                    if key:  # Skip empty keys
-                        # Handle JSON-encoded fields
-                        if value.startswith('[') or value.startswith('{'):
-                            try:
-                                clean_row[key.lower().replace(' ', '_')] = json.loads(value)
-                            except json.JSONDecodeError:
-                                clean_row[key.lower().replace(' ', '_')] = value
-                        else:
+        # Skip leading comment lines that start with #; the first line with
+        # content is the header
+        header_line = None
+        for line in csvfile:
+            if not line.strip().startswith('#') and line.strip():
+                header_line = line
+                break
+        
+        if not header_line:
+            raise ValueError("No data found in CSV file")
+        
+        # Parse header and data, continuing from the current stream position
+        reader = csv.DictReader(itertools.chain([header_line], csvfile))
+        
+        for i, row in enumerate(reader):
+            # Clean up row data
+            clean_row = {}
+            for key, value in row.items():
+                if key:  # Skip empty keys
+                    # Handle JSON-encoded fields
+                    if value.startswith('[') or value.startswith('{'):
+                        try:
+                            clean_row[key.lower().replace(' ', '_')] = json.loads(value)
+                        except json.JSONDecodeError:
                             clean_row[key.lower().replace(' ', '_')] = value
-                
-                if clean_row:  # Only add non-empty rows
-                    data.append(clean_row)
-                
-                # Progress update
-                if progress_callback and i % 100 == 0:
-                    progress = 10 + int((i / 1000) * 10)  # 10-20% for reading
-                    progress_callback(min(progress, 20), f"Reading row {i+1}")
+                    else:
+                        clean_row[key.lower().replace(' ', '_')] = value
+            
+            if clean_row:  # Only add non-empty rows
+                data.append(clean_row)
+            
+            # Progress update
+            if progress_callback and i % 100 == 0:
+                progress = 10 + int((i / 1000) * 10)  # 10-20% for reading
+                progress_callback(min(progress, 20), f"Reading row {i+1}")
         
         return data
     
@@ -271,7 +271,11 @@ class DataImportEngine:
                        progress_callback: Optional[Callable[[int, str], None]]) -> List[Dict[str, Any]]:
         """Read and parse JSON file."""
         with open(file_path, 'r', encoding='utf-8') as jsonfile:
-            json_data = json.load(jsonfile)
+            return self._parse_json_stream(jsonfile)
+    
+    def _parse_json_stream(self, jsonfile: IO[str]) -> List[Dict[str, Any]]:
+        """Parse import records from an open JSON text stream."""
+        json_data = json.load(jsonfile)
         
         # Handle different JSON structures
         if isinstance(json_data, list):
@@ -295,24 +299,27 @@ class DataImportEngine:
     def _read_zip_file(self, file_path: str, data_type: str,
                       progress_callback: Optional[Callable[[int, str], None]]) -> List[Dict[str, Any]]:
         """Read and parse ZIP file containing CSV/JSON."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with zipfile.ZipFile(file_path, 'r') as zipf:
-                zipf.extractall(temp_dir)
-                
-                # Look for CSV or JSON files
-                temp_path = Path(temp_dir)
-                csv_files = list(temp_path.glob('*.csv'))
-                json_files = list(temp_path.glob('*.json'))
-                
-                # Prefer JSON over CSV for more complete data
-                if json_files:
-                    for json_file in json_files:
-                        if 'metadata' not in json_file.name.lower():
-                            return self._read_json_file(str(json_file), data_type, progress_callback)
-                elif csv_files:
-                    return self._read_csv_file(str(csv_files[0]), data_type, progress_callback)
-                else:
-                    raise ValueError("No CSV or JSON files found in ZIP archive")
+        with zipfile.ZipFile(file_path, 'r') as zipf:
+            # Look for CSV or JSON files at the archive root; members are
+            # decoded straight from the archive rather than extracted first
+            members = [name for name in zipf.namelist() if '/' not in name]
+            csv_files = [name for name in members if name.endswith('.csv')]
+            json_files = [name for name in members if name.endswith('.json')]
+            
+            # Prefer JSON over CSV for more complete data
+            if json_files:
+                for json_file in json_files:
+                    if 'metadata' not in json_file.lower():
+                        with zipf.open(json_file) as raw:
+                            return self._parse_json_stream(io.TextIOWrapper(raw, encoding='utf-8'))
+            elif csv_files:
+                with zipf.open(csv_files[0]) as raw:
+                    return self._parse_csv_stream(
+                        io.TextIOWrapper(raw, encoding='utf-8', newline=''),
+                        progress_callback
+                    )
+            else:
+                raise ValueError("No CSV or JSON files found in ZIP archive")
         
         return []
     
@@ -334,16 +341,20 @@ class DataImportEngine:
         errors = []
         warnings = []
         
+        required_fields = schema['required_fields']
+        key_fields = schema['key_fields']
+        record_keys = []
+        
         for i, record in enumerate(data):
             record_errors = []
             
             # Check required fields
-            for field in schema['required_fields']:
+            for field in required_fields:
                 if field not in record or not record[field]:
                     record_errors.append(f"Missing required field: {field}")
             
-            # Check key field uniqueness (within this dataset)
-            key_values = tuple(str(record.get(field, '')) for field in schema['key_fields'])
+            # Collect key values for the uniqueness check (within this dataset)
+            record_keys.append(tuple(str(record.get(field, '')) for field in key_fields))
             
             # Basic data type validation
             for field, value in record.items():
@@ -354,11 +365,8 @@ class DataImportEngine:
             if record_errors:
                 errors.append(f"Record {i+1}: " + "; ".join(record_errors))
         
-        # Check for duplicate keys in dataset
-        key_counts = {}
-        for record in data:
-            key_values = tuple(str(record.get(field, '')) for field in schema['key_fields'])
-            key_counts[key_values] = key_counts.get(key_values, 0) + 1
+        # Check for duplicate keys in dataset (counted in one batch)
+        key_counts = Counter(record_keys)
         
         duplicates = [key for key, count in key_counts.items() if count > 1]
         if duplicates:
@@ -372,11 +380,11 @@ class DataImportEngine:
             'duplicate_keys': len(duplicates)
         }
     
-    def _ensure_database_schema(self, data_type: str) -> None:
+    def _ensure_database_schema(self, conn: sqlite3.Connection, data_type: str) -> None:
         """Ensure database tables exist for the data type."""
         schema = self.db_schemas[data_type]
         
-        with sqlite3.connect(self.db_path, timeout=30) as conn:
+        with conn:
             cursor = conn.cursor()
             cursor.execute(schema['sql_create'])
             
@@ -407,12 +415,13 @@ class DataImportEngine:
             
             conn.commit()
     
-    def _import_to_database(self, data: List[Dict[str, Any]], data_type: str, 
+    def _import_to_database(self, conn: sqlite3.Connection, data: List[Dict[str, Any]], data_type: str, 
                           import_mode: str, progress_callback: Optional[Callable[[int, str], None]]) -> Dict[str, Any]:
         """
         Import validated data to database.
         
         Args:
+            conn: Open connection to the import database
             data: Validated data to import
             data_type: Type of data
             import_mode: Import mode (merge, replace, append)
@@ -433,7 +442,12 @@ class DataImportEngine:
             'errors': []
         }
         
-        with sqlite3.connect(self.db_path, timeout=30) as conn:
+        with conn:
+            # WAL turns the commit into a sequential log append; NORMAL sync
+            # is durable across application crashes and avoids an fsync per
+            # transaction
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
             cursor = conn.cursor()
             
             # Handle replace mode
@@ -444,46 +458,67 @@ class DataImportEngine:
             
             # Prepare fields for insertion
             all_fields = schema['required_fields'] + schema['optional_fields']
+            check_existing = import_mode in ['merge', 'append']
+            current_time = datetime.now(timezone.utc).isoformat()
+            key_fields = schema['key_fields']
+            # An empty table is a definite "not stored" for every record, so
+            # a first import into it skips the stored-row lookups entirely
+            lookup_existing = check_existing and bool(
+                cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table})").fetchone()[0]
+            )
+            existing_ids = self._load_existing_ids(cursor, table, key_fields, data) if lookup_existing else {}
+            
+            # New rows are buffered and written with executemany at the end;
+            # rows queued earlier in this import are tracked by key so later
+            # duplicates behave as if the row were already in the table
+            pending_rows = []
+            pending_by_key = {}
             
             for i, record in enumerate(data):
                 try:
-                    # Build field lists and values
-                    fields = []
-                    values = []
-                    placeholders = []
-                    
-                    for field in all_fields:
-                        if field in record and record[field] is not None:
-                            fields.append(field)
-                            values.append(record[field])
-                            placeholders.append('?')
+                    # Build field/value mapping
+                    row = {
+                        field: record[field] for field in all_fields
+                        if field in record and record[field] is not None
+                    }
                     
                     # Add timestamp fields
-                    current_time = datetime.now(timezone.utc).isoformat()
-                    if 'created_at' not in fields:
-                        fields.append('created_at')
-                        values.append(current_time)
-                        placeholders.append('?')
-                    
-                    fields.append('updated_at')
-                    values.append(current_time)
-                    placeholders.append('?')
+                    if 'created_at' not in row:
+                        row['created_at'] = current_time
+                    row['updated_at'] = current_time
                     
                     # Check if record exists (for merge/append modes)
-                    if import_mode in ['merge', 'append']:
-                        key_conditions = []
-                        key_values = []
-                        for key_field in schema['key_fields']:
-                            if key_field in record:
-                                key_conditions.append(f"{key_field} = ?")
-                                key_values.append(record[key_field])
+                    key = None
+                    if check_existing:
+                        key = tuple(
+                            (key_field, record[key_field]) for key_field in schema['key_fields']
+                            if key_field in record
+                        )
                         
-                        if key_conditions:
-                            cursor.execute(
-                                f"SELECT id FROM {table} WHERE {' AND '.join(key_conditions)}",
-                                key_values
-                            )
-                            existing_record = cursor.fetchone()
+                        if key:
+                            queued_row = pending_by_key.get(key)
+                            if queued_row is not None:
+                                if import_mode == 'append':
+                                    stats['records_skipped'] += 1
+                                else:
+                                    queued_row.update(
+                                        (field, value) for field, value in row.items() if field != 'created_at'
+                                    )
+                                    stats['records_updated'] += 1
+                                continue
+                            
+                            if not lookup_existing:
+                                existing_record = None
+                            elif len(key) == len(key_fields) and all(isinstance(value, str) for _, value in key):
+                                # Answered by the batched lookup above
+                                existing_id = existing_ids.get(key)
+                                existing_record = (existing_id,) if existing_id is not None else None
+                            else:
+                                cursor.execute(
+                                    f"SELECT id FROM {table} WHERE {' AND '.join(f'{field} = ?' for field, _ in key)}",
+                                    [value for _, value in key]
+                                )
+                                existing_record = cursor.fetchone()
                             
                             if existing_record:
                                 if import_mode == 'append':
@@ -492,8 +527,8 @@ class DataImportEngine:
                                     continue
                                 else:
                                     # Update existing record
-                                    update_fields = [f"{field} = ?" for field in fields if field != 'created_at']
-                                    update_values = [val for field, val in zip(fields, values) if field != 'created_at']
+                                    update_fields = [f"{field} = ?" for field in row if field != 'created_at']
+                                    update_values = [val for field, val in row.items() if field != 'created_at']
                                     update_values.append(existing_record[0])  # Add ID for WHERE clause
                                     
                                     cursor.execute(
@@ -503,12 +538,10 @@ class DataImportEngine:
                                     stats['records_updated'] += 1
                                     continue
                     
-                    # Insert new record
-                    cursor.execute(
-                        f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({', '.join(placeholders)})",
-                        values
-                    )
-                    stats['records_inserted'] += 1
+                    # Queue new record
+                    pending_rows.append((i, row))
+                    if key and all(value is not None for _, value in key):
+                        pending_by_key[key] = row
                     
                 except Exception as e:
                     error_msg = f"Record {i+1}: {str(e)}"
@@ -523,10 +556,90 @@ class DataImportEngine:
                         progress = 75 + int((i / len(data)) * 20)
                         progress_callback(progress, f"Processed {i+1}/{len(data)} records")
             
+            stats['records_inserted'] += self._insert_rows(cursor, table, pending_rows, stats['errors'])
             conn.commit()
         
         return stats
     
+    def _load_existing_ids(self, cursor: sqlite3.Cursor, table: str, key_fields: List[str],
+                           data: List[Dict[str, Any]]) -> Dict[Tuple[Tuple[str, Any], ...], int]:
+        """
+        Look up the ids of stored rows matching the records' keys in bulk.
+        
+        One IN query per chunk of first key values replaces a SELECT per
+        record. Only records whose key fields are all strings are covered;
+        others keep the per-record lookup so SQLite's type affinity rules
+        still decide equality for them.
+        
+        Args:
+            cursor: Cursor inside the import transaction
+            table: Target table name
+            key_fields: Fields identifying a record
+            data: Records being imported
+            
+        Returns:
+            Mapping of ((field, value), ...) keys to the lowest matching id
+        """
+        first_values = list({
+            record[key_fields[0]] for record in data
+            if isinstance(record, dict) and all(isinstance(record.get(field), str) for field in key_fields)
+        })
+        
+        existing_ids: Dict[Tuple[Tuple[str, Any], ...], int] = {}
+        columns = ', '.join(key_fields)
+        for start in range(0, len(first_values), self.KEY_LOOKUP_CHUNK):
+            chunk = first_values[start:start + self.KEY_LOOKUP_CHUNK]
+            cursor.execute(
+                f"SELECT id, {columns} FROM {table} "
+                f"WHERE {key_fields[0]} IN ({', '.join('?' * len(chunk))}) ORDER BY id",
+                chunk
+            )
+            for row in cursor.fetchall():
+                existing_ids.setdefault(tuple(zip(key_fields, row[1:])), row[0])
+        return existing_ids
+    
+    def _insert_rows(self, cursor: sqlite3.Cursor, table: str,
+                     pending_rows: List[Tuple[int, Dict[str, Any]]], errors: List[str]) -> int:
+        """
+        Insert queued rows with one prepared statement per column layout.
+        
+        Args:
+            cursor: Cursor inside the import transaction
+            table: Target table name
+            pending_rows: (record index, field->value) pairs to insert
+            errors: Error list to append per-record failures to
+            
+        Returns:
+            Number of rows inserted
+        """
+        groups: Dict[Tuple[str, ...], List[Tuple[int, List[Any]]]] = {}
+        for index, row in pending_rows:
+            groups.setdefault(tuple(row), []).append((index, list(row.values())))
+        
+        inserted = 0
+        for fields, rows in groups.items():
+            sql = f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({', '.join('?' * len(fields))})"
+            cursor.execute("SAVEPOINT import_batch")
+            try:
+                cursor.executemany(sql, [values for _, values in rows])
+                cursor.execute("RELEASE SAVEPOINT import_batch")
+                inserted += len(rows)
+                continue
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK TO SAVEPOINT import_batch")
+                cursor.execute("RELEASE SAVEPOINT import_batch")
+            
+            # A row in this batch was rejected - retry individually so the
+            # good rows still land and the bad ones are reported by number
+            for index, values in rows:
+                try:
+                    cursor.execute(sql, values)
+                    inserted += 1
+                except sqlite3.Error as e:
+                    errors.append(f"Record {index+1}: {str(e)}")
+        
+        return inserted
+    
     def get_import_modes(self) -> Dict[str, str]:
         """Get available import modes with descriptions."""
         return self.import_modes.copy()
@@ -549,7 +662,7 @@ class DataImportEngine:
             return {'valid': False, 'error': 'File not found'}
         
         file_ext = Path(file_path).suffix.lower()
-        supported_formats = ['.csv', '.json', '.zip']
+        supported_formats = list(self.file_readers)
         
         if file_ext not in supported_formats:
             return {
@@ -602,14 +715,10 @@ class DataImportEngine:
         try:
             # Read a sample of the data
             file_ext = Path(file_path).suffix.lower()
-            if file_ext == '.csv':
-                data = self._read_csv_file(file_path, data_type, None)
-            elif file_ext == '.json':
-                data = self._read_json_file(file_path, data_type, None)
-            elif file_ext == '.zip':
-                data = self._read_zip_file(file_path, data_type, None)
-            else:
+            reader = self.file_readers.get(file_ext)
+            if reader is None:
                 raise ValueError(f"Unsupported file format: {file_ext}")
+            data = reader(file_path, data_type, None)
             
             # Limit to preview size
             preview_data = data[:max_records]
@@ -12,11 +12,9 @@ database operations while providing real-time dashboard updates.
 import sqlite3
 import threading
 import time
-import json
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from contextlib import contextmanager
-from datetime import datetime, timedelta
 try:
     from error_codes import get_error, format_error_message
 except ImportError:
@@ -50,6 +48,8 @@ class DatabaseReader:
         self.cache = {}
         self.cache_timestamps = {}
         self.connection_lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_timeout: Optional[float] = None
         
         # Mock mode for testing
         self.mock_mode = False
@@ -234,9 +234,10 @@ class DatabaseReader:
         """
         try:
             self.db_path = Path(new_path).resolve()
-            return True
         except Exception:
             return False
+        self.close()
+        return True
     
     def enable_mock_mode(self) -> None:
         """
@@ -262,38 +263,60 @@ class DatabaseReader:
         Yields:
             SQLite connection object
             
-        Design Decision: Timeout and retry logic handles database locks
-        when backend is writing during active scans.
+        Design Decision: A single connection is kept open and shared (under
+        connection_lock) so dashboard refreshes do not pay the open/schema
+        load cost on every query. The connection's busy timeout handles
+        database locks when backend is writing during active scans.
         """
         with self.connection_lock:
-            conn = None
             try:
-                conn = sqlite3.connect(
-                    self.db_path,
-                    timeout=timeout,
-                    check_same_thread=False
-                )
-                conn.row_factory = sqlite3.Row  # Dict-like access
-                yield conn
+                yield self._open_connection(timeout)
             except sqlite3.OperationalError as e:
+                self._close_connection()
                 if "locked" in str(e).lower():
-                    # Database is locked, likely backend is writing
-                    time.sleep(1)
-                    # Try once more with shorter timeout
-                    try:
-                        conn = sqlite3.connect(self.db_path, timeout=5)
-                        conn.row_factory = sqlite3.Row
-                        yield conn
-                    except sqlite3.OperationalError:
-                        raise sqlite3.OperationalError(
-                            "Database is locked by backend operation. "
-                            "Try again in a moment."
-                        )
-                else:
-                    raise
-            finally:
-                if conn:
-                    conn.close()
+                    # SQLite's busy handler has already waited out the full
+                    # timeout for the backend's write; sleeping again here
+                    # only delays the error (and a context manager cannot
+                    # re-run the caller's block anyway)
+                    raise sqlite3.OperationalError(
+                        "Database is locked by backend operation. "
+                        "Try again in a moment."
+                    ) from e
+                raise
+            except sqlite3.Error:
+                self._close_connection()
+                raise
+    
+    def _open_connection(self, timeout: float) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use (caller holds lock)."""
+        if self._connection is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=timeout,
+                check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row  # Dict-like access
+            self._connection = conn
+            self._connection_timeout = timeout
+        elif self._connection_timeout != timeout:
+            self._connection.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+            self._connection_timeout = timeout
+        return self._connection
+    
+    def _close_connection(self) -> None:
+        """Close the shared connection (caller holds lock)."""
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+            self._connection = None
+            self._connection_timeout = None
+    
+    def close(self) -> None:
+        """Close the shared database connection; it reopens on next query."""
+        with self.connection_lock:
+            self._close_connection()
     
     def get_dashboard_summary(self) -> Dict[str, Any]:
         """
@@ -703,7 +726,9 @@ class DatabaseReader:
         """
         
         params.extend([limit, offset])
-        results = conn.execute(data_query, params).fetchall()
+        # Build rows straight off the cursor; the window asks for up to 10k
+        # hosts and never needs the intermediate list of sqlite3.Row objects
+        results = conn.execute(data_query, params)
         
         servers = [
             {
@@ -799,7 +824,8 @@ class DatabaseReader:
         """
         
         params.extend([limit, offset])
-        results = conn.execute(data_query, params).fetchall()
+        # Build rows straight off the cursor (see the enhanced query)
+        results = conn.execute(data_query, params)
         
         servers = [
             {
@@ -10,7 +10,6 @@ validation patterns to catch issues early in development.
 
 import tkinter as tk
 from typing import Any, Dict, List, Optional, Type
-import inspect
 import warnings
 
 
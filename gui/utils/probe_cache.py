@@ -7,11 +7,20 @@ reuse previous runs without talking to the backend again.
 
 from __future__ import annotations
 
+import datetime as _dt
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 CACHE_DIR = Path.home() / ".smbseek" / "probes"
+LOAD_WORKERS = 8
 
 
 def _sanitize_ip(ip_address: str) -> str:
@@ -20,9 +29,8 @@ def _sanitize_ip(ip_address: str) -> str:
 
 
 def get_cache_path(ip_address: str) -> Path:
-    """Return cache file path for the given IP."""
+    """Return cache file path for the given IP (the directory may not exist yet)."""
     safe_name = _sanitize_ip(ip_address)
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     return CACHE_DIR / f"{safe_name}.json"
 
 
@@ -31,19 +39,109 @@ def load_probe_result(ip_address: str) -> Optional[Dict[str, Any]]:
     cache_path = get_cache_path(ip_address)
     if not cache_path.exists():
         return None
+    return _read_cache_file(cache_path)
+
+
+def _read_cache_file(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Parse one cache file, returning None when it cannot be read."""
     try:
+        if orjson is not None:
+            return orjson.loads(cache_path.read_bytes())
         with cache_path.open("r", encoding="utf-8") as handle:
             return json.load(handle)
     except Exception:
         return None
 
 
+def load_probe_results(ip_addresses: Iterable[str],
+                       max_workers: int = LOAD_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Load cached probe results for many IPs at once.
+
+    The cache directory is listed once so IPs that were never probed cost
+    a set lookup rather than a stat call each. The remaining reads are file
+    I/O bound, so they are spread over a small thread pool. IPs without a
+    usable cache entry are omitted from the returned mapping.
+    """
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            cached_names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+    pending = []
+    for ip in dict.fromkeys(ip_addresses):
+        if not ip:
+            continue
+        file_name = f"{_sanitize_ip(ip)}.json"
+        if file_name in cached_names:
+            pending.append((ip, CACHE_DIR / file_name))
+    if not pending:
+        return {}
+
+    workers = max(1, min(max_workers, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        loaded = executor.map(_read_cache_file, [path for _, path in pending])
+        return {ip: result for (ip, _), result in zip(pending, loaded) if result}
+
+
+def load_fresh_probe_results(targets: Iterable[Tuple[str, List[str]]], *,
+                             max_age_seconds: float,
+                             max_directories: int,
+                             max_files: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Return cached snapshots that can stand in for a new probe.
+
+    A snapshot qualifies when it covers exactly the requested shares, was
+    taken with the same directory/file limits, and is younger than
+    ``max_age_seconds``; anything else needs a fresh probe.
+    """
+    if max_age_seconds <= 0:
+        return {}
+    requested = {ip: shares for ip, shares in targets if ip}
+    now = _dt.datetime.utcnow()
+    fresh = {}
+    for ip, snapshot in load_probe_results(requested).items():
+        limits = snapshot.get("limits") or {}
+        if (limits.get("max_directories"), limits.get("max_files")) != (max_directories, max_files):
+            continue
+        if _snapshot_share_names(snapshot) != _normalize_share_names(requested[ip]):
+            continue
+        try:
+            run_at = _dt.datetime.fromisoformat(str(snapshot.get("run_at", "")).rstrip("Z"))
+        except ValueError:
+            continue
+        if (now - run_at).total_seconds() <= max_age_seconds:
+            fresh[ip] = snapshot
+    return fresh
+
+
+def _normalize_share_names(shares: Iterable[str]) -> frozenset:
+    """Normalize share names the way the probe runner does."""
+    return frozenset(name for name in (share.strip("\\/ ") for share in shares) if name)
+
+
+def _snapshot_share_names(snapshot: Dict[str, Any]) -> frozenset:
+    """Return every share a snapshot attempted, successful or not."""
+    names = [entry.get("share") or "" for entry in snapshot.get("shares") or []]
+    names.extend(entry.get("share") or "" for entry in snapshot.get("errors") or [])
+    return frozenset(name for name in names if name)
+
+
 def save_probe_result(ip_address: str, result: Dict[str, Any]) -> None:
     """Persist probe result for later reuse."""
     cache_path = get_cache_path(ip_address)
     try:
-        with cache_path.open("w", encoding="utf-8") as handle:
-            json.dump(result, handle, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(result, indent=2).encode("utf-8")
+        try:
+            cache_path.write_bytes(payload)
+        except FileNotFoundError:
+            # Only the first save needs the directory created
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(payload)
     except Exception:
         pass
 
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 IndicatorPattern = Tuple[str, re.Pattern]
 
+# Wildcard tokens understood by _indicator_to_regex; text between them is literal
+_WILDCARD_RE = re.compile(r"[*?]|\[.*?\]|\{.*?\}")
+
 
 def load_ransomware_indicators(config_path: Optional[str]) -> List[str]:
     """Return ransomware indicator filenames from SMBSeek config (if present)."""
@@ -19,16 +23,22 @@ def load_ransomware_indicators(config_path: Optional[str]) -> List[str]:
             indicators = config_data.get("security", {}).get("ransomware_indicators", []) or []
         except Exception:
             indicators = []
-    # Normalize and deduplicate
+    # Normalize and deduplicate. Entries are compared by the regex they
+    # translate to (case-insensitively, as they match), so spellings that
+    # differ only in case, repeated '*' or placeholder style are checked once
     normalized: List[str] = []
     seen = set()
     for entry in indicators:
         if not isinstance(entry, str):
             continue
         cleaned = entry.strip()
-        if not cleaned or cleaned.lower() in seen:
+        if not cleaned:
+            continue
+        regex = _indicator_to_regex(cleaned)
+        key = (regex.pattern if regex else cleaned).lower()
+        if key in seen:
             continue
-        seen.add(cleaned.lower())
+        seen.add(key)
         normalized.append(cleaned)
     return normalized
 
@@ -42,12 +52,17 @@ def compile_indicator_patterns(indicators: Sequence[str]) -> List[IndicatorPatte
     return compiled
 
 
+@functools.lru_cache(maxsize=1024)
 def _indicator_to_regex(indicator: str) -> Optional[re.Pattern]:
+    # Every server list window recompiles the full indicator list on open;
+    # the translation is pure, so later windows reuse the compiled patterns
     indicator = indicator.strip()
     if not indicator:
         return None
     escaped = re.escape(indicator)
-    escaped = escaped.replace(r"\*", ".*")
+    # A run of '*' means the same as one; collapsing it avoids stacked '.*'
+    # groups that only add backtracking
+    escaped = re.sub(r"(?:\\\*)+", ".*", escaped)
     escaped = escaped.replace(r"\?", ".")
     escaped = re.sub(r"\\\[.*?\\\]", ".+", escaped)
     escaped = re.sub(r"\\\{.*?\\\}", ".+", escaped)
@@ -57,10 +72,107 @@ def _indicator_to_regex(indicator: str) -> Optional[re.Pattern]:
         return None
 
 
+class _FragmentAutomaton:
+    """
+    Aho-Corasick automaton over the literal fragment each indicator requires.
+
+    One pass over lowercased paths yields every indicator whose fragment
+    occurs in each of them; only those candidates need their regex run. Indicators
+    without a usable fragment are always candidates.
+    """
+
+    def __init__(self, fragments: Sequence[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self.always = tuple(index for index, fragment in enumerate(fragments) if not fragment)
+
+        for index, fragment in enumerate(fragments):
+            if not fragment:
+                continue
+            state = 0
+            for char in fragment:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (index,)
+
+        # Breadth-first failure links; outputs inherit their fallback's
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def candidates_per_text(self, texts: Sequence[str]) -> List[Set[int]]:
+        """
+        Scan ``texts`` in one pass over their NUL-joined form.
+
+        Returns the candidate indicator indices for each text; the automaton
+        restarts at every separator so matches never span two texts.
+        """
+        found = [set(self.always) for _ in texts]
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        segment = 0
+        for char in "\x00".join(texts):
+            if char == "\x00":
+                segment += 1
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found[segment].update(out[state])
+        return found
+
+
+def _literal_fragment(indicator: str) -> str:
+    """
+    Return the longest literal run of ``indicator``, lowercased.
+
+    Non-ASCII fragments are dropped (empty result) because IGNORECASE
+    matching folds some characters differently from str.lower().
+    """
+    fragment = max(_WILDCARD_RE.split(indicator.strip()), key=len).lower()
+    return fragment if fragment.isascii() else ""
+
+
+@functools.lru_cache(maxsize=8)
+def _fragment_automaton(indicator_patterns: Tuple[IndicatorPattern, ...]) -> _FragmentAutomaton:
+    return _FragmentAutomaton([_literal_fragment(indicator) for indicator, _ in indicator_patterns])
+
+
 def find_indicator_hits(snapshot: Dict[str, Any], indicator_patterns: Sequence[IndicatorPattern]) -> Dict[str, Any]:
     matches: List[Dict[str, str]] = []
-    for target_type, path in _iter_snapshot_paths(snapshot):
-        for indicator, pattern in indicator_patterns:
+    indicator_patterns = tuple(indicator_patterns)
+    if not indicator_patterns:
+        return {"is_suspicious": False, "matches": matches}
+    automaton = _fragment_automaton(indicator_patterns)
+    paths = list(_iter_snapshot_paths(snapshot))
+
+    # Every ASCII path goes through the automaton in a single batched pass;
+    # the rest (or any path holding the separator) is checked in full
+    batched = [index for index, (_, path) in enumerate(paths) if path.isascii() and "\x00" not in path]
+    candidates = dict(zip(batched, automaton.candidates_per_text([paths[index][1].lower() for index in batched])))
+
+    for index, (target_type, path) in enumerate(paths):
+        if index in candidates:
+            # Sorted so matches keep the configured indicator order
+            patterns_to_check = [indicator_patterns[i] for i in sorted(candidates[index])]
+        else:
+            patterns_to_check = indicator_patterns
+        for indicator, pattern in patterns_to_check:
             if pattern.search(path):
                 matches.append({
                     "indicator": indicator,
@@ -8,17 +8,100 @@ of directories/files per share so the GUI can render a quick preview.
 from __future__ import annotations
 
 import datetime as _dt
-from typing import Any, Dict, List
+import errno
+import logging
+import ntpath
+import queue
+import re
+import selectors
+import socket
+import struct
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 try:
-    from impacket.smbconnection import SMBConnection
+    from impacket.smbconnection import SMBConnection, SessionError as SMBSessionError
 except ImportError:  # pragma: no cover - handled at runtime
     SMBConnection = None
+    SMBSessionError = None
+
+try:
+    from impacket import smb3structs
+    from impacket.nt_errors import STATUS_NO_MORE_FILES
+    from impacket.smb3 import SMB3, SessionError as SMB3SessionError
+except ImportError:  # pragma: no cover - listPath fallback
+    SMB3 = None
+    SMB3SessionError = None
 
 
 DEFAULT_USERNAME = "guest"
 DEFAULT_PASSWORD = ""
 DEFAULT_CLIENT_NAME = "xsmbseek-probe"
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_HOSTS = 4
+SMB_PORT = 445
+NETBIOS_PORT = 139
+MAX_INFLIGHT_SHARES = 16
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+# Probes from several detail windows can overlap; this caps the total number
+# of shares being walked at once across all of them.
+_INFLIGHT_SHARES = threading.BoundedSemaphore(MAX_INFLIGHT_SHARES)
+
+# impacket SessionError text embeds the NT status name, e.g.
+# "SMB SessionError: STATUS_ACCESS_DENIED({Access Denied} ...)"
+_NT_STATUS_RE = re.compile(r'\b(?:NT_)?STATUS_([A-Z0-9_]+)')
+_NT_STATUS_MESSAGES = {
+    "ACCESS_DENIED": "Access denied",
+    "BAD_NETWORK_NAME": "Share not found",
+    "LOGON_FAILURE": "Logon failed",
+    "ACCOUNT_DISABLED": "Account disabled",
+    "OBJECT_NAME_NOT_FOUND": "Path not found",
+    "NO_SUCH_FILE": "No matching files",
+    "IO_TIMEOUT": "Request timed out",
+}
+
+# SMB status errors raised by impacket; a status that only concerns one
+# share or path leaves the session usable (see _session_survives)
+_SMB_STATUS_ERRORS = tuple(cls for cls in (SMBSessionError, SMB3SessionError) if cls is not None)
+
+# STATUS_NETWORK_SESSION_EXPIRED and STATUS_USER_SESSION_DELETED: the
+# session itself is gone and must not be handed out again
+_SESSION_LOST_STATUSES = frozenset((0xC000035C, 0xC0000203))
+
+# impacket logs failures it also raises; the probe already records those in
+# the snapshot, so keep its logger from writing every one to stderr
+logging.getLogger("impacket").setLevel(logging.CRITICAL)
+
+# SO_LINGER {on, 0s}: close() resets the connection instead of a FIN
+# handshake, so port checks leave no sockets behind in TIME_WAIT
+_LINGER_RESET = struct.pack("ii", 1, 0)
+
+# Port checks keep at most this many connects in flight, well under the
+# common 1024 descriptor limit; further hosts start as earlier ones finish
+_MAX_PENDING_CONNECTS = 256
+
+# FILE_FULL_DIR_INFORMATION record: NextEntryOffset at 0, FileAttributes
+# at 56, FileNameLength at 60; the UTF-16LE name starts at byte 68
+_FULL_DIR_INFO = struct.Struct("<I52xII")
+_FULL_DIR_INFO_NAME_OFFSET = 68
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+# Per-host limiters and probe locks live only while some probe holds them,
+# so a long session of batch probes does not keep one entry per IP forever
+_HOST_LIMITERS: "weakref.WeakValueDictionary[str, _RateLimiter]" = weakref.WeakValueDictionary()
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+# One probe per host at a time: a detail-window probe and a batch probe of
+# the same server queue up instead of walking it twice in parallel
+_HOST_PROBE_LOCKS: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_HOST_PROBE_LOCKS_LOCK = threading.Lock()
 
 
 class ProbeError(RuntimeError):
@@ -33,11 +116,19 @@ def run_probe(
     max_files: int,
     timeout_seconds: int,
     username: str = DEFAULT_USERNAME,
-    password: str = DEFAULT_PASSWORD
+    password: str = DEFAULT_PASSWORD,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    preflight: bool = True
 ) -> Dict[str, Any]:
     """
     Enumerate limited directory/file information for each accessible share.
 
+    Share roots and their subdirectories are listed concurrently (each
+    listing is dominated by SMB round trips), but results are reported in
+    the original share order. Probes of the same host never overlap; a
+    second caller waits for the first.
+
     Args:
         ip_address: Target server IP/hostname.
         shares: List of share names marked accessible.
@@ -45,6 +136,11 @@ def run_probe(
         max_files: Max files per directory to list.
         timeout_seconds: SMB socket timeout per request.
         username/password: Credentials to reuse (guest/anonymous by default).
+        max_workers: Upper bound on directory listings in flight for the host.
+        requests_per_second: Per-host cap on SMB directory listings shared by
+            all workers (None or <= 0 disables the limit).
+        preflight: Check the SMB/NetBIOS ports before connecting; callers
+            that have just confirmed port 445 themselves (run_probes) skip it.
 
     Returns:
         Dictionary describing probe snapshot suitable for caching/printing.
@@ -70,31 +166,320 @@ def run_probe(
         "errors": []
     }
 
-    for raw_share in shares:
-        share_name = raw_share.strip("\\/ ")
-        if not share_name:
-            continue
+    # Normalize and de-duplicate (first occurrence wins) so a share listed
+    # twice is probed once and keeps a single slot in the snapshot
+    share_names = list(dict.fromkeys(
+        share_name for share_name in (raw_share.strip("\\/ ") for raw_share in shares)
+        if share_name
+    ))
+
+    if not share_names:
+        return snapshot
+
+    if preflight:
+        # Check SMB and NetBIOS together; both connects share one timeout
+        # window, and a filtered NetBIOS port is not waited out once SMB
+        # has answered (139 only feeds the diagnostics below)
+        open_ports = check_endpoints(
+            [(ip_address, SMB_PORT), (ip_address, NETBIOS_PORT)],
+            timeout_seconds=timeout_seconds,
+            stop_at=(ip_address, SMB_PORT)
+        )
+        if (ip_address, SMB_PORT) not in open_ports:
+            if (ip_address, NETBIOS_PORT) in open_ports:
+                raise ProbeError(
+                    f"Port {SMB_PORT} is not reachable on {ip_address} "
+                    f"(only NetBIOS port {NETBIOS_PORT} answered)."
+                )
+            raise ProbeError(f"Port {SMB_PORT} is not reachable on {ip_address}.")
+        snapshot["network"] = {
+            "open_ports": sorted(port for _, port in open_ports),
+            "tcp_response_ms": round(open_ports[(ip_address, SMB_PORT)] * 1000, 1)
+        }
+
+    with _host_probe_lock(ip_address):
+        worker_count = max(1, int(max_workers or 1))
+        pool = _SessionPool(timeout_seconds)
+        limiter = _get_host_limiter(ip_address, requests_per_second)
+
+        def list_pattern(share_name: str, pattern: str, *, limit: int, directories: bool) -> List[Dict[str, Any]]:
+            # Wait for the rate limit before taking a global in-flight slot,
+            # so a throttled host does not hold slots other hosts could use
+            if limiter is not None:
+                limiter.acquire()
+            with _INFLIGHT_SHARES, pool.session(ip_address, username, password) as conn:
+                pool.hold_tree(conn, share_name)
+                return _list_entries(
+                    conn,
+                    share_name,
+                    pattern=pattern,
+                    limit=limit,
+                    directories=directories,
+                    smb3_server=pool.smb3_server(conn)
+                )
 
         try:
-            share_result = _probe_share(
-                ip_address,
-                share_name,
-                max_directories=max_directories,
-                max_files=max_files,
-                timeout_seconds=timeout_seconds,
-                username=username,
-                password=password
-            )
-            snapshot["shares"].append(share_result)
-        except Exception as exc:  # pragma: no cover
-            snapshot["errors"].append({
-                "share": share_name,
-                "message": str(exc)
-            })
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                # Share roots first, then every selected subdirectory across
+                # all shares goes through the same bounded pool, so listings
+                # inside one share no longer run back to back. One entry past
+                # each cap is enough to tell whether the preview is truncated
+                root_futures = [
+                    executor.submit(list_pattern, share_name, "*", limit=max_directories + 1, directories=True)
+                    for share_name in share_names
+                ]
+                share_jobs = []
+                for share_name, root_future in zip(share_names, root_futures):
+                    try:
+                        dir_entries = _subdirectories(root_future.result(), max_directories + 1)
+                    except Exception as exc:
+                        share_jobs.append((share_name, exc, None, []))
+                        continue
+                    nested_futures = [
+                        executor.submit(
+                            list_pattern,
+                            share_name,
+                            _nested_pattern(entry["name"]),
+                            limit=max_files + 1,
+                            directories=False
+                        )
+                        for entry in dir_entries[:max_directories]
+                    ]
+                    share_jobs.append((share_name, None, dir_entries, nested_futures))
+
+                # Collect in submission order so snapshots stay deterministic
+                for share_name, error, dir_entries, nested_futures in share_jobs:
+                    try:
+                        if error is not None:
+                            raise error
+                        snapshot["shares"].append(_build_share_payload(
+                            share_name,
+                            dir_entries,
+                            [future.result() for future in nested_futures],
+                            max_directories=max_directories,
+                            max_files=max_files
+                        ))
+                    except Exception as exc:  # pragma: no cover
+                        snapshot["errors"].append({
+                            "share": share_name,
+                            "message": _describe_error(exc)
+                        })
+        finally:
+            pool.close_all()
 
     return snapshot
 
 
+def run_probes(
+    targets: Iterable[Tuple[str, List[str]]],
+    *,
+    max_hosts: int = DEFAULT_MAX_HOSTS,
+    on_snapshot: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    **probe_options: Any
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Probe several hosts concurrently.
+
+    Each (ip, shares) target is handed to run_probe on a thread pool; share
+    level concurrency inside each host still applies, and the global
+    in-flight share cap bounds the total. Hosts whose SMB port is closed
+    are filtered out by a single bulk port check, and each reachable host is
+    submitted as soon as its connect succeeds rather than after the whole
+    check finishes. Yields ``(ip, snapshot, error)`` as each host finishes,
+    so callers can report progress incrementally.
+
+    ``on_snapshot(ip, snapshot)``, when given, runs on the worker thread
+    right after a host's probe succeeds, so per-host follow-up work such as
+    analysis and caching overlaps with the hosts still being probed instead
+    of queueing behind the consumer.
+    """
+    shares_by_ip = {ip: shares for ip, shares in dict(targets).items() if ip}
+    if not shares_by_ip:
+        return
+
+    def probe_host(ip: str, shares: List[str]) -> Dict[str, Any]:
+        # iter_reachable has just connected to 445; skip run_probe's own check
+        snapshot = run_probe(ip, shares, preflight=False, **probe_options)
+        if on_snapshot is not None:
+            on_snapshot(ip, snapshot)
+        return snapshot
+
+    worker_count = max(1, min(int(max_hosts or 1), len(shares_by_ip)))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        # One bulk port check up front: hosts with 445 closed are reported at
+        # once instead of each holding a worker for a full connect timeout.
+        # Open hosts start probing while the rest of the check is pending
+        futures = {}
+        for ip in iter_reachable(shares_by_ip, timeout_seconds=probe_options.get("timeout_seconds", 5)):
+            futures[executor.submit(probe_host, ip, shares_by_ip[ip])] = ip
+        reachable = set(futures.values())
+        for ip in shares_by_ip:
+            if ip not in reachable:
+                yield ip, None, f"Port {SMB_PORT} is not reachable on {ip}."
+
+        for future in as_completed(futures):
+            ip = futures[future]
+            try:
+                yield ip, future.result(), None
+            except Exception as exc:
+                yield ip, None, str(exc)
+
+
+def check_ports(
+    hosts: Iterable[str],
+    *,
+    port: int = SMB_PORT,
+    timeout_seconds: float = 5
+) -> Set[str]:
+    """
+    Return the subset of hosts accepting TCP connections on ``port``.
+
+    All connects are started non-blocking and awaited through one selector,
+    so checking many hosts costs a single timeout window rather than one
+    per host.
+    """
+    return set(iter_reachable(hosts, port=port, timeout_seconds=timeout_seconds))
+
+
+def iter_reachable(
+    hosts: Iterable[str],
+    *,
+    port: int = SMB_PORT,
+    timeout_seconds: float = 5
+) -> Iterator[str]:
+    """Yield hosts accepting TCP connections on ``port`` as each connect completes."""
+    for (host, _), _ in _iter_connect_times(((host, port) for host in hosts), timeout_seconds):
+        yield host
+
+
+def check_endpoints(
+    endpoints: Iterable[Tuple[str, int]],
+    *,
+    timeout_seconds: float = 5,
+    stop_at: Optional[Tuple[str, int]] = None
+) -> Dict[Tuple[str, int], float]:
+    """
+    Connect to every (host, port) pair concurrently.
+
+    Returns a mapping of reachable endpoints to their TCP connect time in
+    seconds. Unreachable endpoints are omitted. With ``stop_at`` set, the
+    check returns as soon as that endpoint connects, abandoning the
+    connects still pending.
+    """
+    open_endpoints = {}
+    connects = _iter_connect_times(endpoints, timeout_seconds)
+    try:
+        for endpoint, elapsed in connects:
+            open_endpoints[endpoint] = elapsed
+            if endpoint == stop_at:
+                break
+    finally:
+        connects.close()
+    return open_endpoints
+
+
+def _iter_connect_times(
+    endpoints: Iterable[Tuple[str, int]],
+    timeout_seconds: float
+) -> Iterator[Tuple[Tuple[str, int], float]]:
+    """
+    Yield ``(endpoint, connect_seconds)`` for each endpoint as it connects.
+
+    At most _MAX_PENDING_CONNECTS connects are in flight at once, so large
+    batches never run out of file descriptors (which would make hosts look
+    closed); each connect gets ``timeout_seconds`` from when it starts.
+    """
+    selector = selectors.DefaultSelector()
+    # (deadline, socket) in start order, so the head always expires first
+    waiting: deque = deque()
+    remaining_endpoints = iter(dict.fromkeys(endpoints))
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(selector.get_map()) < _MAX_PENDING_CONNECTS:
+                endpoint = next(remaining_endpoints, None)
+                if endpoint is None:
+                    exhausted = True
+                    break
+                # Resolve the way socket.create_connection does, so hostnames
+                # and scoped IPv6 addresses work and a bad name skips only its
+                # entry (numeric addresses never hit DNS)
+                try:
+                    family, sock_type, proto, _, address = socket.getaddrinfo(
+                        *endpoint, type=socket.SOCK_STREAM
+                    )[0]
+                    sock = socket.socket(family, sock_type, proto)
+                except OSError:
+                    continue
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+                except OSError:
+                    pass
+                sock.setblocking(False)
+                started = time.perf_counter()
+                result = sock.connect_ex(address)
+                if result == 0:
+                    sock.close()
+                    yield endpoint, time.perf_counter() - started
+                elif result in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                    selector.register(sock, selectors.EVENT_WRITE, (endpoint, started))
+                    waiting.append((time.monotonic() + timeout_seconds, sock))
+                else:
+                    sock.close()
+
+            # Give up on connects past their deadline; finished ones (already
+            # closed) are dropped as they reach the head
+            now = time.monotonic()
+            while waiting and (waiting[0][1].fileno() == -1 or waiting[0][0] <= now):
+                _, sock = waiting.popleft()
+                if sock.fileno() != -1:
+                    selector.unregister(sock)
+                    sock.close()
+            if not waiting:
+                if exhausted:
+                    break
+                continue
+
+            for key, _ in selector.select(waiting[0][0] - now):
+                sock = key.fileobj
+                endpoint, started = key.data
+                connected = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                elapsed = time.perf_counter() - started
+                selector.unregister(sock)
+                sock.close()
+                if connected:
+                    yield endpoint, elapsed
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+
+def _host_probe_lock(ip_address: str) -> threading.Lock:
+    """Return the lock serializing probes of ``ip_address``."""
+    with _HOST_PROBE_LOCKS_LOCK:
+        lock = _HOST_PROBE_LOCKS.get(ip_address)
+        if lock is None:
+            lock = _HOST_PROBE_LOCKS[ip_address] = threading.Lock()
+        return lock
+
+
+def _session_survives(exc: BaseException) -> bool:
+    """Return True when ``exc`` is an SMB status that leaves the session usable."""
+    return isinstance(exc, _SMB_STATUS_ERRORS) and exc.error not in _SESSION_LOST_STATUSES
+
+
+def _describe_error(exc: Exception) -> str:
+    """Map an SMB failure to a short message using a single status-code scan."""
+    message = str(exc)
+    match = _NT_STATUS_RE.search(message)
+    if match:
+        friendly = _NT_STATUS_MESSAGES.get(match.group(1))
+        if friendly:
+            return f"{friendly} (STATUS_{match.group(1)})"
+    return message
+
+
 def _connect(ip_address: str, timeout_seconds: int) -> SMBConnection:
     """Create and authenticate an SMBConnection."""
     conn = SMBConnection(
@@ -108,60 +493,262 @@ def _connect(ip_address: str, timeout_seconds: int) -> SMBConnection:
     return conn
 
 
-def _probe_share(
-    ip_address: str,
+def _close(conn: SMBConnection) -> None:
+    """Log off and drop the transport, ignoring teardown errors."""
+    try:
+        conn.logoff()
+    except Exception:
+        pass
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+class _SessionPool:
+    """
+    Authenticated SMB sessions keyed by (ip, username).
+
+    Workers borrow an idle session (or open one when none is idle) and hand
+    it back when done, so the TCP + NEGOTIATE + SESSION_SETUP cost is paid
+    at most once per concurrent worker rather than once per share. Tree
+    connects are held for the life of a session as well (see hold_tree).
+    A failed connect or login is remembered, so the host's remaining
+    listings fail at once instead of each waiting out its own attempt.
+    """
+
+    def __init__(self, timeout_seconds: int):
+        self._timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], queue.Queue] = {}
+        self._keys: Dict[int, Tuple[str, str]] = {}
+        self._trees: Dict[int, Set[str]] = {}
+        self._smb3: Dict[int, Any] = {}
+        self._failures: Dict[Tuple[str, str], Exception] = {}
+
+    def acquire(self, ip_address: str, username: str, password: str) -> SMBConnection:
+        key = (ip_address, username)
+        with self._lock:
+            idle = self._idle.setdefault(key, queue.Queue())
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        failure = self._failures.get(key)
+        if failure is not None:
+            raise failure
+
+        try:
+            conn = _connect(ip_address, self._timeout_seconds)
+        except Exception as exc:
+            self._failures[key] = exc
+            raise
+        try:
+            conn.login(username, password)
+        except Exception as exc:
+            _close(conn)
+            self._failures[key] = exc
+            raise
+        smb3_server = _smb3_server(conn)
+        with self._lock:
+            self._keys[id(conn)] = key
+            self._smb3[id(conn)] = smb3_server
+        return conn
+
+    @contextmanager
+    def session(self, ip_address: str, username: str, password: str) -> Iterator[SMBConnection]:
+        """
+        Borrow a session for the block.
+
+        A share- or path-level SMB status (access denied, share or file not
+        found) hands the session back as usual; any other failure leaves its
+        state unknown, so it is discarded instead.
+        """
+        conn = self.acquire(ip_address, username, password)
+        try:
+            yield conn
+        except BaseException as exc:
+            if _session_survives(exc):
+                self.release(conn)
+            else:
+                self.discard(conn)
+            raise
+        self.release(conn)
+
+    def hold_tree(self, conn: SMBConnection, share_name: str) -> None:
+        """
+        Keep a tree connect to ``share_name`` open on this session.
+
+        impacket's listPath does TREE_CONNECT/TREE_DISCONNECT around every
+        call unless the session already holds the tree, in which case it
+        only bumps a use count; holding it saves two round trips per listing.
+        """
+        key = id(conn)
+        with self._lock:
+            if share_name in self._trees.get(key, ()):
+                return
+        conn.connectTree(share_name)
+        with self._lock:
+            self._trees.setdefault(key, set()).add(share_name)
+
+    def smb3_server(self, conn: SMBConnection) -> Any:
+        """Return the session's SMB3 transport, or None when it speaks SMB1."""
+        with self._lock:
+            return self._smb3.get(id(conn))
+
+    def release(self, conn: SMBConnection) -> None:
+        with self._lock:
+            key = self._keys.get(id(conn))
+            idle = self._idle.get(key) if key else None
+        if idle is None:
+            _close(conn)
+            return
+        idle.put(conn)
+
+    def discard(self, conn: SMBConnection) -> None:
+        with self._lock:
+            self._keys.pop(id(conn), None)
+            self._trees.pop(id(conn), None)
+            self._smb3.pop(id(conn), None)
+        _close(conn)
+
+    def close_all(self) -> None:
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+            self._keys.clear()
+            self._trees.clear()
+            self._smb3.clear()
+        for idle in pools:
+            while True:
+                try:
+                    conn = idle.get_nowait()
+                except queue.Empty:
+                    break
+                _close(conn)
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing ``rate`` acquisitions per second (burst of ``rate``).
+
+    Callers reserve a token up front, letting the balance go negative, and
+    sleep until their reserved slot outside the lock. Waiters are therefore
+    spaced evenly in arrival order instead of all waking and re-checking
+    each time a token frees up.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _get_host_limiter(ip_address: str, rate: Optional[float]) -> Optional[_RateLimiter]:
+    """Return the shared limiter for a host so overlapping probes split one budget."""
+    if not rate or rate <= 0:
+        return None
+    with _HOST_LIMITERS_LOCK:
+        limiter = _HOST_LIMITERS.get(ip_address)
+        if limiter is None or limiter.rate != rate:
+            limiter = _RateLimiter(rate)
+            _HOST_LIMITERS[ip_address] = limiter
+        return limiter
+
+
+def _smb3_server(conn: SMBConnection) -> Any:
+    """Return the connection's SMB3 transport, or None for SMB1 / no impacket.smb3."""
+    if SMB3 is None:
+        return None
+    server = conn.getSMBServer()
+    return server if isinstance(server, SMB3) else None
+
+
+def _subdirectories(entries: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """Return up to ``limit`` directory entries, excluding the "." and ".." links."""
+    return list(islice(
+        (entry for entry in entries if entry["is_directory"] and entry["name"] not in (".", "..")),
+        limit
+    ))
+
+
+def _nested_pattern(dir_name: str) -> str:
+    """Return the listPath pattern matching everything inside ``dir_name``."""
+    safe_dir = dir_name.strip("\\/")
+    return f"{safe_dir}\\*"
+
+
+def _build_share_payload(
     share_name: str,
+    dir_entries: List[Dict[str, Any]],
+    nested_listings: List[List[Dict[str, Any]]],
     *,
     max_directories: int,
-    max_files: int,
-    timeout_seconds: int,
-    username: str,
-    password: str
+    max_files: int
 ) -> Dict[str, Any]:
-    """Probe a single share and return structured directory/file info."""
-    conn = _connect(ip_address, timeout_seconds)
-    try:
-        conn.login(username, password)
-        directories = _list_entries(conn, share_name, pattern="*")
-        dir_entries = [
-            entry for entry in directories
-            if entry["is_directory"] and entry["name"] not in (".", "..")
+    """Assemble a share's snapshot entry from its root and subdirectory listings."""
+    directory_payload = []
+    for dir_entry, nested_entries in zip(dir_entries[:max_directories], nested_listings):
+        # SMB1 listings are not cut short, so a directory can hold thousands
+        # of entries; one past the cap is enough to flag truncation
+        file_names = [
+            entry["name"] for entry in islice(
+                (entry for entry in nested_entries
+                 if not entry["is_directory"] and entry["name"] not in (".", "..")),
+                max_files + 1
+            )
         ]
-        selected_dirs = dir_entries[:max_directories]
-
-        directory_payload = []
-        for dir_entry in selected_dirs:
-            safe_dir = dir_entry["name"].strip("\\/")
-            nested_pattern = f"{safe_dir}\\*"
-            nested_entries = _list_entries(conn, share_name, pattern=nested_pattern)
-            file_entries = [
-                entry for entry in nested_entries
-                if not entry["is_directory"] and entry["name"] not in (".", "..")
-            ]
-            directory_payload.append({
-                "name": dir_entry["name"],
-                "files": [f["name"] for f in file_entries[:max_files]],
-                "files_truncated": len(file_entries) > max_files
-            })
-
-        return {
-            "share": share_name,
-            "directories": directory_payload,
-            "directories_truncated": len(dir_entries) > max_directories
-        }
-    finally:
-        try:
-            conn.logoff()
-        except Exception:
-            pass
+        directory_payload.append({
+            "name": dir_entry["name"],
+            "files": file_names[:max_files],
+            "files_truncated": len(file_names) > max_files
+        })
+
+    return {
+        "share": share_name,
+        "directories": directory_payload,
+        "directories_truncated": len(dir_entries) > max_directories
+    }
+
+
+def _list_entries(
+    conn: SMBConnection,
+    share: str,
+    pattern: str,
+    *,
+    limit: Optional[int] = None,
+    directories: bool = True,
+    smb3_server: Any = None
+) -> List[Dict[str, Any]]:
+    """
+    Return parsed directory entries for a share pattern.
 
+    ``smb3_server`` is the session's SMB3 transport as resolved once by
+    _SessionPool; without it the listing falls back to listPath.
 
-def _list_entries(conn: SMBConnection, share: str, pattern: str) -> List[Dict[str, Any]]:
-    """Return parsed directory entries for a share pattern."""
+    With ``limit`` set, SMB2/3 listings stop paging once that many entries
+    of the wanted kind (``directories`` or files, "." and ".." excluded)
+    have been read; the result may still hold more than ``limit``.
+    """
     normalized_pattern = pattern if pattern else "*"
     if not normalized_pattern.endswith("*"):
         normalized_pattern = f"{normalized_pattern}*"
 
+    if smb3_server is not None:
+        return _query_directory(smb3_server, share, normalized_pattern, limit=limit, directories=directories)
+
     entries = conn.listPath(share, normalized_pattern)
     payload = []
     for entry in entries:
@@ -172,3 +759,105 @@ def _list_entries(conn: SMBConnection, share: str, pattern: str) -> List[Dict[st
             "is_directory": is_dir
         })
     return payload
+
+
+def _query_directory(
+    server: SMB3,
+    share: str,
+    pattern: str,
+    *,
+    limit: Optional[int] = None,
+    directories: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    List ``pattern`` over SMB2/3 using directory pages of the negotiated size.
+
+    impacket's listPath caps every QUERY_DIRECTORY response at 64 KiB.
+    queryDirectory's default asks for the negotiated MaxReadSize (up to
+    1 MiB, with the matching credit charge), so large directories come back
+    in up to 16x fewer round trips. Paging stops early once ``limit``
+    wanted entries are in hand (see _list_entries).
+    """
+    path = ntpath.normpath(pattern.replace("/", "\\")).lstrip("\\")
+    tree_id = server.connectTree(share)
+    file_id = None
+    payload = []
+    wanted = 0
+    try:
+        file_id = server.create(
+            tree_id,
+            ntpath.dirname(path),
+            smb3structs.FILE_READ_ATTRIBUTES | smb3structs.FILE_READ_DATA,
+            smb3structs.FILE_SHARE_READ | smb3structs.FILE_SHARE_WRITE | smb3structs.FILE_SHARE_DELETE,
+            smb3structs.FILE_DIRECTORY_FILE | smb3structs.FILE_SYNCHRONOUS_IO_NONALERT,
+            smb3structs.FILE_OPEN,
+            0
+        )
+        while True:
+            try:
+                page = server.queryDirectory(
+                    tree_id,
+                    file_id,
+                    ntpath.basename(path),
+                    informationClass=smb3structs.FILE_FULL_DIRECTORY_INFORMATION
+                )
+            except SMB3SessionError as exc:
+                if exc.get_error_code() != STATUS_NO_MORE_FILES:
+                    raise
+                break
+
+            entries = _parse_directory_page(page)
+            payload.extend(entries)
+            if limit is not None:
+                wanted += sum(
+                    1 for entry in entries
+                    if entry["is_directory"] == directories and entry["name"] not in (".", "..")
+                )
+                if wanted >= limit:
+                    break
+    finally:
+        if file_id is not None:
+            _send_close(server, tree_id, file_id)
+        server.disconnectTree(tree_id)
+    return payload
+
+
+def _parse_directory_page(page: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode a FILE_FULL_DIRECTORY_INFORMATION page into directory entries.
+
+    Reads each record's header in place with one struct unpack instead of
+    building an impacket Structure per entry and re-slicing the page.
+    """
+    entries = []
+    offset = 0
+    while True:
+        next_offset, attributes, name_length = _FULL_DIR_INFO.unpack_from(page, offset)
+        name_start = offset + _FULL_DIR_INFO_NAME_OFFSET
+        entries.append({
+            "name": page[name_start:name_start + name_length].decode("utf-16le"),
+            "is_directory": bool(attributes & _FILE_ATTRIBUTE_DIRECTORY)
+        })
+        if not next_offset:
+            return entries
+        offset += next_offset
+
+
+def _send_close(server: SMB3, tree_id: int, file_id: Any) -> None:
+    """
+    Send CLOSE for a directory handle without waiting for the reply.
+
+    The listing is complete once QUERY_DIRECTORY reports no more files, so
+    blocking on CLOSE only adds a round trip. impacket parks replies it was
+    not waiting for by MessageID, and the session is dropped when the probe
+    ends, so the unread replies stay bounded.
+    """
+    request = smb3structs.SMB2Close()
+    request["Flags"] = 0
+    request["FileID"] = file_id
+
+    packet = server.SMB_PACKET()
+    packet["Command"] = smb3structs.SMB2_CLOSE
+    packet["TreeID"] = tree_id
+    packet["Data"] = request
+    server.sendSMB(packet)
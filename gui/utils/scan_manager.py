@@ -10,10 +10,9 @@ ensures single scan execution and proper resource cleanup.
 
 import json
 import os
-import subprocess
+import re
 import threading
 import time
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any, List, Tuple
@@ -44,6 +43,33 @@ class ScanManager:
     Design Pattern: Singleton-style manager with comprehensive
     lifecycle management and error recovery capabilities.
     """
+
+    # Progress message decorations, built once rather than per progress line
+    _ACTIVITY_INDICATORS = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+
+    # Phase-specific prefixes for clarity (SMBSeek 3.0 three-phase model)
+    _PHASE_PREFIXES = {
+        "initialization": "🚀 Starting",
+        "discovery": "🔍 Discovering",
+        "authentication": "🔐 Testing Authentication",
+        "access_testing": "⚡ Testing Access",
+        "completed": "✅ Complete",
+        "error": "❌ Error",
+        "scanning": "⚡ Scanning"
+    }
+    
+    # Phase keyword groups, each compiled to one alternation so a message is
+    # scanned once per group instead of once per keyword
+    _COMPLETED_RE = re.compile(r'complete|finished|done')
+    _SCOREBOARD_HOSTS_RE = re.compile(r'testing (?:recent )?hosts')
+    _SCOREBOARD_COUNTS_RE = re.compile(r'success:|failed:')
+    _ERROR_RE = re.compile(
+        r'error:| error|critical|fatal|exception|traceback|scan failed|'
+        r'failed to|failed due|failure| aborted| terminated'
+    )
+    _ACCESS_RE = re.compile(r'auth|access|testing|login|shares|enum')
+    _DISCOVERY_RE = re.compile(r'discover|shodan|query|search')
+    _INITIALIZATION_RE = re.compile(r'initializ|start|begin')
     
     def __init__(self, gui_directory: str = None):
         """
@@ -417,20 +443,21 @@ class ScanManager:
             percentage: Progress percentage (0-100) from backend interface
             message: Progress message from backend interface
         """
+        last_update = self.last_progress_update
+        now = time.monotonic()
+
         # Handle message-only updates where percentage is None
         if percentage is None:
-            percentage = float(self.last_progress_update.get("percentage", 0)) if hasattr(self, 'last_progress_update') and self.last_progress_update else 0.0
+            percentage = float(last_update.get("percentage", 0)) if last_update else 0.0
 
         # Ensure progress always moves forward (prevent stuck states)
-        if hasattr(self, 'last_progress_update') and self.last_progress_update:
-            last_percentage = self.last_progress_update.get("percentage", 0)
+        if last_update:
+            last_percentage = last_update.get("percentage", 0)
             # Only use new percentage if it's higher, or if significant time has passed
             # Skip comparison if either value is not numeric
             if isinstance(percentage, (int, float)) and isinstance(last_percentage, (int, float)) and percentage < last_percentage:
-                import time
-                last_time = self.last_progress_update.get("timestamp", "")
-                current_time = datetime.now().isoformat()
-                if last_time and (datetime.now() - datetime.fromisoformat(last_time)).total_seconds() > 30:
+                last_time = last_update.get("monotonic")
+                if last_time is not None and now - last_time > 30:
                     # Force progress increment if stuck for more than 30 seconds
                     percentage = min(last_percentage + 1, 100)
                 else:
@@ -446,12 +473,14 @@ class ScanManager:
         # Update progress with enhanced information
         self._update_progress(percentage, enhanced_message, phase)
         
-        # Store last update with timestamp
+        # Store last update with timestamp (epoch seconds; progress lines can
+        # arrive many times a second, so skip building an ISO string for each)
         self.last_progress_update = {
             "percentage": percentage,
             "message": enhanced_message,
             "phase": phase,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
+            "monotonic": now,  # Cheap elapsed-time checks without re-parsing the ISO string
             "backend_message": message  # Store original for debugging
         }
     
@@ -471,28 +500,24 @@ class ScanManager:
         message_lower = message.lower()
         
         # Simple keyword-based phase detection (SMBSeek 3.0 three-phase model)
-        if any(keyword in message_lower for keyword in ['complete', 'finished', 'done']):
+        if self._COMPLETED_RE.search(message_lower):
             return "completed"
 
         scoreboard_message = (
-            ("testing hosts" in message_lower or "testing recent hosts" in message_lower)
-            and ("success:" in message_lower or "failed:" in message_lower)
+            self._SCOREBOARD_HOSTS_RE.search(message_lower)
+            and self._SCOREBOARD_COUNTS_RE.search(message_lower)
         ) or "auth results" in message_lower
         if scoreboard_message:
             return "access_testing"
 
-        error_indicators = [
-            'error:', ' error', 'critical', 'fatal', 'exception', 'traceback',
-            'scan failed', 'failed to', 'failed due', 'failure', ' aborted', ' terminated'
-        ]
-        if any(indicator in message_lower for indicator in error_indicators):
+        if self._ERROR_RE.search(message_lower):
             return "error"
 
-        if any(keyword in message_lower for keyword in ['auth', 'access', 'testing', 'login', 'shares', 'enum']):
+        if self._ACCESS_RE.search(message_lower):
             return "access_testing"  # Combined access testing and enumeration
-        elif any(keyword in message_lower for keyword in ['discover', 'shodan', 'query', 'search']):
+        elif self._DISCOVERY_RE.search(message_lower):
             return "discovery"
-        elif any(keyword in message_lower for keyword in ['initializ', 'start', 'begin']):
+        elif self._INITIALIZATION_RE.search(message_lower):
             return "initialization"
         else:
             return "scanning"  # Default fallback
@@ -510,22 +535,11 @@ class ScanManager:
             Enhanced message for better user experience
         """
         # Add activity indicator to show system is working
-        activity_indicators = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+        activity_indicators = self._ACTIVITY_INDICATORS
         indicator_index = int((percentage // 2) % len(activity_indicators))
         activity_indicator = activity_indicators[indicator_index]
         
-        # Add phase-specific prefixes for clarity (SMBSeek 3.0 three-phase model)
-        phase_prefixes = {
-            "initialization": "🚀 Starting",
-            "discovery": "🔍 Discovering",
-            "authentication": "🔐 Testing Authentication",
-            "access_testing": "⚡ Testing Access",
-            "completed": "✅ Complete",
-            "error": "❌ Error",
-            "scanning": "⚡ Scanning"
-        }
-        
-        prefix = phase_prefixes.get(phase, "⚡ Processing")
+        prefix = self._PHASE_PREFIXES.get(phase, "⚡ Processing")
         
         # Enhance message with context
         if percentage < 100 and phase not in ["completed", "error"]:
@@ -536,10 +550,11 @@ class ScanManager:
             enhanced = f"{prefix}: {message}"
         
         # Add time-based activity for very long phases
-        if hasattr(self, 'last_progress_update') and self.last_progress_update:
-            last_time = self.last_progress_update.get("timestamp")
-            if last_time:
-                time_diff = (datetime.now() - datetime.fromisoformat(last_time)).total_seconds()
+        last_update = self.last_progress_update
+        if last_update:
+            last_time = last_update.get("monotonic")
+            if last_time is not None:
+                time_diff = time.monotonic() - last_time
                 if time_diff > 60 and percentage < 100:  # More than 1 minute in same phase
                     enhanced += f" (running {time_diff/60:.0f}m)"
         
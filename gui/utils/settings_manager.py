@@ -8,12 +8,23 @@ Design Decision: Centralized settings management allows consistent behavior
 across all application components and provides user preference persistence.
 """
 
+import hashlib
 import json
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+try:
+    from version_cache import run_version_check
+except ImportError:
+    from .version_cache import run_version_check
+
 
 class SettingsManager:
     """
@@ -38,6 +49,7 @@ class SettingsManager:
             self.settings_dir = Path(settings_dir)
         
         self.settings_file = self.settings_dir / 'gui_settings.json'
+        self._saved_digest: Optional[str] = None
         
         # Ensure settings directory exists
         self.settings_dir.mkdir(exist_ok=True)
@@ -94,6 +106,10 @@ class SettingsManager:
                 'max_directories_per_share': 3,
                 'max_files_per_directory': 5,
                 'share_timeout_seconds': 10,
+                'max_concurrent_shares': 4,
+                'max_concurrent_hosts': 4,
+                'requests_per_second': 10,
+                'batch_reuse_minutes': 10,
                 'status_by_ip': {}
             },
             'templates': {
@@ -155,17 +171,50 @@ class SettingsManager:
             True if saved successfully, False otherwise
         """
         try:
+            # Setters save unconditionally, often with nothing changed; only
+            # rewrite the file when its content (ignoring the timestamp) would
+            digest = self._settings_digest()
+            if digest == self._saved_digest and self.settings_file.exists():
+                return True
+
             self.settings['metadata']['last_updated'] = datetime.now().isoformat()
             
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+            with open(self.settings_file, 'wb') as f:
+                f.write(self._encode_settings())
             
+            self._saved_digest = digest
             return True
             
         except Exception as e:
             print(f"Error: Failed to save settings: {e}")
             return False
     
+    def _encode_settings(self) -> bytes:
+        """
+        Serialize settings as indented UTF-8 JSON with LF line endings.
+
+        Saved on every probe status change, and status_by_ip grows with each
+        host probed; encoding once and writing the bytes in binary mode keeps
+        the rewrite to a single write with no per-token text-layer calls or
+        newline translation (orjson when available, json otherwise).
+        """
+        if orjson is not None:
+            return orjson.dumps(self.settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.settings, indent=2).encode('utf-8')
+    
+    def _settings_digest(self) -> str:
+        """Return an MD5 of the settings, excluding metadata.last_updated."""
+        metadata = {
+            key: value for key, value in self.settings.get('metadata', {}).items()
+            if key != 'last_updated'
+        }
+        content = {**self.settings, 'metadata': metadata}
+        if orjson is not None:
+            payload = orjson.dumps(content, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.md5(payload).hexdigest()
+    
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
         Get setting value by dot-separated key path.
@@ -400,8 +449,8 @@ class SettingsManager:
             True if exported successfully
         """
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(self._encode_settings())
             return True
             
         except Exception as e:
@@ -574,16 +623,11 @@ class SettingsManager:
             if not smbseek_script.exists():
                 return {'valid': False, 'message': 'smbseek.py not found in directory'}
             
-            # Try to get version
+            # Try to get version (cached on disk while the script is unchanged)
             try:
-                result = subprocess.run(
-                    ["python", str(smbseek_script), "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    version = result.stdout.strip()
+                returncode, output = run_version_check(str(smbseek_script), timeout=5)
+                if returncode == 0:
+                    version = output.strip()
                     return {'valid': True, 'message': f'Valid SMBSeek installation ({version})'}
                 else:
                     return {'valid': True, 'message': 'SMBSeek installation found (version check failed)'}
@@ -806,6 +850,22 @@ class SettingsManager:
         status_map[ip_address] = status
         self.set_setting('probe.status_by_ip', status_map)
 
+    def set_probe_statuses(self, statuses: Dict[str, str]) -> None:
+        """Persist several probe statuses with a single settings write."""
+        allowed = {'unprobed', 'clean', 'issue'}
+        status_map = self.get_setting('probe.status_by_ip', {}) or {}
+        changed = False
+        for ip_address, status in statuses.items():
+            if not ip_address:
+                continue
+            if status not in allowed:
+                status = 'unprobed'
+            if status_map.get(ip_address) != status:
+                status_map[ip_address] = status
+                changed = True
+        if changed:
+            self.set_setting('probe.status_by_ip', status_map)
+
     def add_avoid_server(self, ip: Optional[str]) -> None:
         """
         Add server IP to avoid list.
@@ -0,0 +1,116 @@
+"""
+SMBSeek version check caching utilities.
+
+Path validation runs ``python smbseek.py --version`` and the backend
+availability check runs ``smbseek.py --help`` to confirm an installation
+works, which costs a full interpreter start each time. Results are kept under
+~/.smbseek/version_cache.json, keyed by script path, size and mtime, so
+re-validating an unchanged installation does not spawn a process.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+CACHE_PATH = Path.home() / ".smbseek" / "version_cache.json"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def run_version_check(script_path: str, timeout: int = 5,
+                      ttl_seconds: int = DEFAULT_TTL_SECONDS) -> Tuple[int, str]:
+    """
+    Return ``(returncode, stdout)`` for ``python <script_path> --version``.
+
+    Successful results are served from the on-disk cache while the script is
+    unchanged and the entry is younger than ``ttl_seconds``. Failures are
+    never cached. Raises the same exceptions as subprocess.run
+    (TimeoutExpired, FileNotFoundError) when the check has to run.
+    """
+    script = Path(script_path).resolve()
+    return _run_cached(
+        str(script),
+        script,
+        ["python", str(script), "--version"],
+        timeout=timeout,
+        ttl_seconds=ttl_seconds
+    )
+
+
+def run_help_check(script_path: str, interpreter: str, cwd: Optional[str] = None,
+                   timeout: int = 10, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> int:
+    """
+    Return the exit code of ``<interpreter> <script_path> --help``.
+
+    Cached like run_version_check; entries are kept per interpreter so a GUI
+    started from another environment still checks the backend once.
+    """
+    script = Path(script_path).resolve()
+    returncode, _ = _run_cached(
+        f"{script}::help::{interpreter}",
+        script,
+        [interpreter, str(script), "--help"],
+        timeout=timeout,
+        ttl_seconds=ttl_seconds,
+        cwd=cwd,
+        capture_output=False
+    )
+    return returncode
+
+
+def _run_cached(cache_key: str, script: Path, command: Sequence[str], *,
+                timeout: int, ttl_seconds: int,
+                cwd: Optional[str] = None,
+                capture_output: bool = True) -> Tuple[int, str]:
+    """Run ``command`` unless a fresh successful result for ``script`` is cached."""
+    stat_result = script.stat()
+    fingerprint = [stat_result.st_size, stat_result.st_mtime_ns]
+
+    cache = _load_cache()
+    entry = cache.get(cache_key)
+    if (
+        isinstance(entry, dict)
+        and entry.get("fingerprint") == fingerprint
+        and time.time() - entry.get("checked_at", 0) < ttl_seconds
+    ):
+        return 0, entry.get("output", "")
+
+    result = subprocess.run(
+        list(command),
+        cwd=cwd,
+        stdout=subprocess.PIPE if capture_output else subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=timeout
+    )
+    if result.returncode == 0:
+        cache[cache_key] = {
+            "fingerprint": fingerprint,
+            "checked_at": time.time(),
+            "output": result.stdout or ""
+        }
+        _save_cache(cache)
+    return result.returncode, result.stdout or ""
+
+
+def _load_cache() -> Dict[str, Any]:
+    """Load the cache file (returns an empty cache if missing or unreadable)."""
+    try:
+        with CACHE_PATH.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_cache(cache: Dict[str, Any]) -> None:
+    """Persist the cache file, ignoring write failures."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with CACHE_PATH.open("w", encoding="utf-8") as handle:
+            json.dump(cache, handle, indent=2)
+    except Exception:
+        pass